@@ -2,21 +2,217 @@
 Gerenciador de recursos para carregar imagens e sons
 """
 import os
+from collections import OrderedDict
 import pygame
 import config
+from assets.bundle import AssetBundle
+from utils.startup_profiler import startup_profiler
 
 class AssetManager:
     """
     Classe responsável por carregar e gerenciar recursos do jogo
     como imagens, sons, etc.
+    
+    As imagens ficam numa cache LRU com chave (caminho, tamanho, flip, formato),
+    por isso as variantes redimensionadas também são reaproveitadas. Cada
+    Surface conta largura × altura × bytes por pixel para o orçamento de
+    memória; quando é ultrapassado, as imagens usadas há mais tempo são
+    libertadas, exceto as que estão fixadas (ex.: as do nível atual).
+    
+    Os frames de animação recortados (load_trimmed_image) ficam na mesma
+    cache, com o formato "trimmed", por isso contam para o orçamento e ficam
+    fixados com o caminho do frame original.
     """
-    def __init__(self):
-        self.images = {}
+    def __init__(self, memory_budget=config.ASSET_MEMORY_BUDGET, max_fonts=config.ASSET_MAX_FONTS):
+        self.images = OrderedDict()
+        self.image_bytes = {}
+        # Offset de cada frame recortado na cache (chave "trimmed" → (x, y));
+        # frames vazios só têm offset, sem imagem
+        self.trim_offsets = {}
         self.sounds = {}
         self.animations = {}
-        self.fonts = {}
+        self.fonts = OrderedDict()
+        self.memory_budget = memory_budget
+        self.max_fonts = max_fonts
+        # Grupos de caminhos fixados (nome do grupo → conjunto de caminhos)
+        self.pinned = {}
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Pacote de imagens cozinhadas, aberto no primeiro carregamento
+        self.bundle = None
+        self.bundle_opened = False
+    
+    @staticmethod
+    def image_key(path, scale=None, flip=False, convert_alpha=True):
+        """
+        Constrói a chave da cache para uma variante de uma imagem
+        
+        Args:
+            path: Caminho da imagem
+            scale: Tupla (width, height) ou None para o tamanho original
+            flip: Se a imagem está espelhada na horizontal
+            convert_alpha: Se a imagem tem canal alpha
+            
+        Returns:
+            Tupla (path, size, flip, format)
+        """
+        return (path, tuple(scale) if scale else None, flip, "alpha" if convert_alpha else "opaque")
+    
+    def get_cached(self, key):
+        """
+        Procura uma variante na cache, conta um hit ou miss e marca-a como usada
+        
+        Args:
+            key: Chave criada por image_key
+            
+        Returns:
+            Surface ou None se não estiver em cache
+        """
+        image = self.images.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.images.move_to_end(key)
+        return image
+    
+    def peek(self, key):
+        """
+        Procura uma variante na cache sem contar hits/misses (procuras internas)
+        
+        Args:
+            key: Chave criada por image_key
+            
+        Returns:
+            Surface ou None se não estiver em cache
+        """
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+        return image
+    
+    def store(self, key, image):
+        """
+        Guarda uma variante na cache e liberta memória se o orçamento for ultrapassado
+        
+        Args:
+            key: Chave criada por image_key
+            image: Surface a guardar
+        """
+        if key in self.images:
+            self.resident_bytes -= self.image_bytes[key]
+        size = image.get_width() * image.get_height() * image.get_bytesize()
+        self.images[key] = image
+        self.images.move_to_end(key)
+        self.image_bytes[key] = size
+        self.resident_bytes += size
+        if self.resident_bytes > self.memory_budget:
+            self.evict(keep=key)
+    
+    def evict(self, keep=None):
+        """
+        Liberta as imagens usadas há mais tempo até voltar ao orçamento
+        
+        Args:
+            keep: Chave que não pode ser libertada (a que acabou de entrar)
+        """
+        pinned = set().union(*self.pinned.values()) if self.pinned else ()
+        for key in list(self.images):
+            if self.resident_bytes <= self.memory_budget:
+                break
+            if key == keep or key[0] in pinned:
+                continue
+            del self.images[key]
+            self.resident_bytes -= self.image_bytes.pop(key)
+            self.trim_offsets.pop(key, None)
+            self.evictions += 1
     
-    def load_image(self, path, convert_alpha=True, scale=None):
+    def pin(self, group, paths):
+        """
+        Fixa um grupo de imagens para não serem libertadas (substitui o grupo anterior)
+        
+        Args:
+            group: Nome do grupo (ex.: "level", "characters")
+            paths: Caminhos das imagens; todas as variantes ficam fixadas
+        """
+        self.pinned[group] = set(paths)
+    
+    def unpin(self, group):
+        """
+        Liberta um grupo de imagens fixadas
+        
+        Args:
+            group: Nome do grupo
+        """
+        self.pinned.pop(group, None)
+        if self.resident_bytes > self.memory_budget:
+            self.evict()
+    
+    def get_stats(self):
+        """
+        Retorna as estatísticas da cache de imagens
+        
+        resident_bytes cobre todas as imagens desta cache: ficheiros, variantes
+        e frames de animação recortados. As superfícies desenhadas no código
+        (texto, painéis do HUD, efeitos gerados, alvo de desenho) ficam fora
+        da cache e do orçamento.
+        
+        Returns:
+            Dicionário com hits, misses, evictions, resident_bytes, budget e images
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident_bytes": self.resident_bytes,
+            "budget": self.memory_budget,
+            "images": len(self.images)
+        }
+    
+    def get_bundle(self):
+        """
+        Retorna o pacote de imagens cozinhadas, abrindo-o na primeira chamada
+        
+        Returns:
+            AssetBundle ou None se não houver pacote
+        """
+        if not self.bundle_opened:
+            self.bundle_opened = True
+            self.bundle = AssetBundle.open(config.ASSET_CACHE_PATH)
+        return self.bundle
+    
+    def load_cooked_image(self, path, convert_alpha=True):
+        """
+        Carrega uma imagem a partir do pacote cozinhado, sem descodificar o ficheiro
+        
+        Args:
+            path: Caminho da imagem original
+            convert_alpha: Se deve manter o canal alpha
+            
+        Returns:
+            Surface da imagem ou None se não estiver no pacote (ou estiver desatualizada)
+        """
+        key = self.image_key(path, convert_alpha=convert_alpha)
+        if key in self.images:
+            return self.peek(key)
+        bundle = self.get_bundle()
+        if bundle is None:
+            return None
+        with startup_profiler.span(f"cooked {path}", "asset"):
+            image = bundle.load(path)
+        if image is None:
+            return None
+        if not convert_alpha:
+            image = image.convert()
+        elif image.get_masks()[:3] != pygame.display.get_surface().get_masks()[:3]:
+            # Só copia se o ecrã usar outra ordem de canais
+            image = image.convert_alpha()
+        self.store(key, image)
+        return image
+    
+    def load_image(self, path, convert_alpha=True, scale=None, flip=False):
         """
         Carrega uma imagem e a armazena em cache
         
@@ -24,30 +220,67 @@ class AssetManager:
             path: Caminho da imagem
             convert_alpha: Se deve converter para formato com alpha
             scale: Tupla (width, height) para redimensionar a imagem
+            flip: Se deve espelhar a imagem na horizontal
             
         Returns:
-            Surface da imagem carregada
+            Surface da imagem carregada (partilhada; não deve ser alterada)
+        """
+        # Cada pedido conta um só hit ou miss
+        key = self.image_key(path, scale, flip, convert_alpha)
+        image = self.get_cached(key)
+        if image is None:
+            image = self.create_image(key, path, convert_alpha, scale, flip)
+        return image
+    
+    def create_image(self, key, path, convert_alpha, scale, flip):
         """
-        # Verifica se a imagem já está em cache
-        if path in self.images:
-            image = self.images[path]
-            if scale:
-                return pygame.transform.scale(image, scale)
+        Cria e guarda uma variante que não está em cache, a partir da imagem base
+        
+        Args:
+            key: Chave da variante (de image_key)
+            path: Caminho da imagem
+            convert_alpha: Se deve converter para formato com alpha
+            scale: Tupla (width, height) ou None
+            flip: Se deve espelhar a imagem na horizontal
+            
+        Returns:
+            Surface da variante
+        """
+        base_key = self.image_key(path, convert_alpha=convert_alpha)
+        image = self.peek(base_key) if key != base_key else None
+        if image is None:
+            image = self.load_cooked_image(path, convert_alpha)
+        if image is None:
+            with startup_profiler.span(f"load {path}", "asset"):
+                image = self.decode_image(path, convert_alpha)
+            self.store(base_key, image)
+        
+        if key == base_key:
             return image
         
+        # Cria e guarda a variante redimensionada/espelhada
+        if scale:
+            image = pygame.transform.scale(image, scale)
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        self.store(key, image)
+        return image
+    
+    def decode_image(self, path, convert_alpha=True):
+        """
+        Descodifica uma imagem do disco
+        
+        Args:
+            path: Caminho da imagem
+            convert_alpha: Se deve converter para formato com alpha
+            
+        Returns:
+            Surface da imagem ou uma imagem de fallback se falhar
+        """
         try:
             if convert_alpha:
-                image = pygame.image.load(path).convert_alpha()
-            else:
-                image = pygame.image.load(path).convert()
-                
-            # Armazena a imagem original em cache
-            self.images[path] = image
-            
-            # Retorna a imagem redimensionada se necessário
-            if scale:
-                return pygame.transform.scale(image, scale)
-            return image
+                return pygame.image.load(path).convert_alpha()
+            return pygame.image.load(path).convert()
         except Exception as e:
             print(f"Erro ao carregar imagem {path}: {e}")
             # Cria uma superfície de fallback
@@ -55,13 +288,118 @@ class AssetManager:
             pygame.draw.rect(fallback, (255, 0, 255), fallback.get_rect(), 2)
             pygame.draw.line(fallback, (255, 0, 255), (0, 0), (64, 64), 2)
             pygame.draw.line(fallback, (255, 0, 255), (64, 0), (0, 64), 2)
+            return fallback
+    
+    def has_image(self, path, convert_alpha=True):
+        """
+        Verifica se uma imagem já está em cache
+        
+        Args:
+            path: Caminho da imagem
+            convert_alpha: Formato da imagem
             
-            # Armazena a imagem de fallback em cache
-            self.images[path] = fallback
+        Returns:
+            True se a imagem já foi carregada
+        """
+        return self.image_key(path, convert_alpha=convert_alpha) in self.images
+    
+    def add_image(self, path, image, convert_alpha=True):
+        """
+        Guarda em cache uma imagem já carregada e convertida (ex.: pelo preloader)
+        
+        Args:
+            path: Caminho da imagem
+            image: Surface já convertida para o formato do ecrã
+            convert_alpha: Formato da imagem
+        """
+        self.store(self.image_key(path, convert_alpha=convert_alpha), image)
+    
+    def unload_image(self, path):
+        """
+        Remove da cache todas as variantes de uma imagem
+        
+        Args:
+            path: Caminho da imagem
+        """
+        for key in [key for key in self.images if key[0] == path]:
+            del self.images[key]
+            self.resident_bytes -= self.image_bytes.pop(key)
+        for key in [key for key in self.trim_offsets if key[0] == path]:
+            del self.trim_offsets[key]
+    
+    def load_trimmed_image(self, path, size, flip=False, image=None):
+        """
+        Carrega um frame escalado, espelhado e recortado à sua área opaca
+        
+        Args:
+            path: Caminho da imagem (ou nome único, se a imagem for dada)
+            size: Tupla (width, height) do frame desenhado
+            flip: Se o frame deve ser espelhado na horizontal
+            image: Surface original, para frames que não vêm de um ficheiro
             
-            if scale:
-                return pygame.transform.scale(fallback, scale)
-            return fallback
+        Returns:
+            Tupla (surface, (offset_x, offset_y)); surface é None se o frame
+            estiver vazio
+        """
+        key = (path, size, flip, "trimmed")
+        offset = self.trim_offsets.get(key)
+        if offset is not None:
+            self.hits += 1
+            trimmed = self.images.get(key)
+            if trimmed is not None:
+                self.images.move_to_end(key)
+            return trimmed, offset
+        
+        self.misses += 1
+        if image is None:
+            base_key = self.image_key(path)
+            image = self.peek(base_key)
+            if image is None:
+                image = self.create_image(base_key, path, True, None, False)
+        trimmed, offset = self.trim_image(image, size, flip)
+        self.trim_offsets[key] = offset
+        if trimmed is not None:
+            self.store(key, trimmed)
+        return trimmed, offset
+    
+    def unload_trimmed(self, path, keep_size=None):
+        """
+        Remove da cache os frames recortados de uma imagem noutros tamanhos
+        
+        Args:
+            path: Caminho da imagem
+            keep_size: Tamanho cujos frames ficam (o da resolução atual)
+        """
+        for key in [key for key in self.trim_offsets if key[0] == path and key[1] != keep_size]:
+            del self.trim_offsets[key]
+            if key in self.images:
+                del self.images[key]
+                self.resident_bytes -= self.image_bytes.pop(key)
+    
+    @staticmethod
+    def trim_image(image, size, flip):
+        """
+        Espelha, escala e recorta uma imagem à sua área opaca
+        
+        O recorte é feito depois de espelhar e escalar, por isso desenhar a
+        imagem recortada na posição + offset dá o mesmo resultado que desenhar
+        a imagem completa, com menos píxeis.
+        
+        Args:
+            image: Surface original
+            size: Tupla (width, height)
+            flip: Se a imagem deve ser espelhada na horizontal
+            
+        Returns:
+            Tupla (surface recortada ou None, (offset_x, offset_y))
+        """
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        image = pygame.transform.scale(image, size)
+        bounds = image.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            return None, (0, 0)
+        return image.subsurface(bounds).copy(), bounds.topleft
     
     def load_sound(self, path):
         """
@@ -95,25 +433,38 @@ class AssetManager:
         Returns:
             Lista de frames da animação
         """
+        return [self.load_image(path) for path in self.animation_paths(folder_path)]
+    
+    def animation_paths(self, folder_path):
+        """
+        Lista os ficheiros dos frames de uma animação
+        
+        Só a lista de caminhos fica em cache; os frames passam pela cache de
+        imagens e contam para o orçamento de memória.
+        
+        Args:
+            folder_path: Caminho do diretório com os frames
+            
+        Returns:
+            Lista ordenada de caminhos dos frames
+        """
         # Verifica se a animação já está em cache
         if folder_path in self.animations:
             return self.animations[folder_path]
         
-        frames = []
+        paths = []
         try:
             if os.path.exists(folder_path):
-                for file in sorted(os.listdir(folder_path)):
-                    if file.endswith('.png'):
-                        image_path = os.path.join(folder_path, file)
-                        image = self.load_image(image_path)
-                        frames.append(image)
+                with startup_profiler.span(f"scan {folder_path}", "scan"):
+                    paths = [os.path.join(folder_path, file)
+                             for file in sorted(os.listdir(folder_path)) if file.endswith('.png')]
                 
-                # Armazena os frames em cache
-                self.animations[folder_path] = frames
+                # Armazena os caminhos em cache
+                self.animations[folder_path] = paths
         except Exception as e:
             print(f"Erro ao carregar animação de {folder_path}: {e}")
         
-        return frames
+        return paths
     
     def load_font(self, name, size):
         """
@@ -126,22 +477,25 @@ class AssetManager:
         Returns:
             Objeto Font carregado
         """
-        key = f"{name}_{size}"
+        key = (name, size)
         
         # Verifica se a fonte já está em cache
         if key in self.fonts:
+            self.fonts.move_to_end(key)
             return self.fonts[key]
         
         try:
             font = pygame.font.Font(name, size)
-            self.fonts[key] = font
-            return font
         except Exception as e:
             print(f"Erro ao carregar fonte {name} tamanho {size}: {e}")
             # Usa a fonte padrão como fallback
             font = pygame.font.Font(None, size)
-            self.fonts[key] = font
-            return font
+        
+        self.fonts[key] = font
+        # Mantém só as fontes usadas mais recentemente
+        while len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)
+        return font
     
     def create_gradient_surface(self, width, height, start_color, end_color, vertical=True):
         """
@@ -0,0 +1,158 @@
+"""
+Pacote de imagens pré-cozinhadas (pixels BGRA em bruto) lido com mmap
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+
+# Cabeçalho: assinatura, versão e tamanho do índice JSON
+MAGIC = b"QJDASSET"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+# Os blocos de pixels começam em múltiplos deste valor
+ALIGNMENT = 16
+# Ordem dos bytes igual ao formato de convert_alpha() na maioria dos ecrãs
+PIXEL_FORMAT = "BGRA"
+
+def file_hash(path):
+    """
+    Calcula o hash do conteúdo de um ficheiro
+    
+    Args:
+        path: Caminho do ficheiro
+        
+    Returns:
+        Hash em hexadecimal
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def normalize_path(path):
+    """
+    Normaliza um caminho para ser usado como chave do índice
+    
+    Args:
+        path: Caminho da imagem
+        
+    Returns:
+        Caminho relativo normalizado, com barras "/"
+    """
+    return os.path.normpath(path).replace(os.sep, "/")
+
+class AssetBundle:
+    """
+    Leitura de um pacote criado por assets/cook.py.
+    
+    O ficheiro é mapeado em memória e cada imagem é criada com
+    pygame.image.frombuffer diretamente sobre o mapa, sem descodificar PNG/JPG
+    nem copiar os pixels. Uma entrada só é usada se o ficheiro original não
+    mudou: mesmo mtime e tamanho, ou, se o mtime mudou, o mesmo hash.
+    """
+    def __init__(self, path):
+        """
+        Abre e mapeia o pacote
+        
+        Args:
+            path: Caminho do ficheiro do pacote
+            
+        Raises:
+            OSError/ValueError se o ficheiro não existir ou for inválido
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            # ACCESS_COPY: as páginas só são lidas quando usadas e uma escrita
+            # acidental numa Surface não toca no ficheiro
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, version, index_size = HEADER.unpack_from(self.map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Pacote de assets inválido: {path}")
+            start = HEADER.size
+            self.index = json.loads(self.map[start:start + index_size].decode("utf-8"))
+        except Exception:
+            self.file.close()
+            raise
+        self.view = memoryview(self.map)
+    
+    @classmethod
+    def open(cls, path):
+        """
+        Abre o pacote se existir
+        
+        Args:
+            path: Caminho do ficheiro do pacote
+            
+        Returns:
+            AssetBundle ou None se não existir ou for inválido
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            print(f"Erro ao abrir pacote de assets {path}: {e}")
+            return None
+    
+    def close(self):
+        """
+        Fecha o mapa e o ficheiro
+        """
+        self.view.release()
+        self.map.close()
+        self.file.close()
+    
+    def entry(self, path):
+        """
+        Retorna a entrada de uma imagem se ainda corresponder ao ficheiro original
+        
+        Args:
+            path: Caminho da imagem original
+            
+        Returns:
+            Dicionário da entrada ou None se não existir ou estiver desatualizada
+        """
+        entry = self.index.get(normalize_path(path))
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size != entry["size"]:
+            return None
+        if stat.st_mtime_ns != entry["mtime"] and file_hash(path) != entry["hash"]:
+            return None
+        return entry
+    
+    def pixels(self, entry):
+        """
+        Retorna os bytes em bruto de uma entrada
+        
+        Args:
+            entry: Entrada do índice
+            
+        Returns:
+            memoryview sobre o mapa
+        """
+        return self.view[entry["offset"]:entry["offset"] + entry["length"]]
+    
+    def load(self, path):
+        """
+        Cria a Surface de uma imagem cozinhada
+        
+        Args:
+            path: Caminho da imagem original
+            
+        Returns:
+            Surface BGRA que partilha a memória do mapa, ou None
+        """
+        entry = self.entry(path)
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(self.pixels(entry), (entry["width"], entry["height"]), PIXEL_FORMAT)
@@ -0,0 +1,122 @@
+"""
+Cozinha as imagens do jogo num único pacote de pixels em bruto
+
+Uso (a partir da pasta do jogo):
+    python -m assets.cook
+"""
+import json
+import os
+import sys
+import time
+import pygame
+import config
+from assets.bundle import (AssetBundle, ALIGNMENT, HEADER, MAGIC, PIXEL_FORMAT, VERSION,
+                           file_hash, normalize_path)
+
+# Pastas com as imagens a cozinhar
+SOURCE_FOLDERS = (config.CHARACTERS_PATH, config.BACKGROUNDS_PATH)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+def find_images(folders=SOURCE_FOLDERS):
+    """
+    Procura todas as imagens nas pastas de origem
+    
+    Args:
+        folders: Pastas a percorrer
+        
+    Returns:
+        Lista ordenada de caminhos
+    """
+    paths = []
+    for folder in folders:
+        for root, _, files in os.walk(folder):
+            for file in files:
+                if file.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(root, file))
+    return sorted(paths)
+
+def cook(output_path=config.ASSET_CACHE_PATH, folders=SOURCE_FOLDERS):
+    """
+    Cria ou atualiza o pacote de imagens
+    
+    As entradas cujo ficheiro original não mudou são copiadas do pacote
+    anterior sem voltar a descodificar a imagem.
+    
+    Args:
+        output_path: Caminho do pacote a escrever
+        folders: Pastas com as imagens
+        
+    Returns:
+        Tupla (imagens descodificadas, imagens reaproveitadas)
+    """
+    previous = AssetBundle.open(output_path)
+    entries = {}
+    blobs = []
+    offset = 0
+    decoded = 0
+    reused = 0
+    
+    for path in find_images(folders):
+        stat = os.stat(path)
+        old = previous.entry(path) if previous else None
+        if old is not None:
+            pixels = bytes(previous.pixels(old))
+            width, height, source_hash = old["width"], old["height"], old["hash"]
+            reused += 1
+        else:
+            try:
+                image = pygame.image.load(path)
+            except Exception as e:
+                print(f"Erro ao cozinhar imagem {path}: {e}")
+                continue
+            pixels = pygame.image.tobytes(image, PIXEL_FORMAT)
+            width, height = image.get_size()
+            source_hash = file_hash(path)
+            decoded += 1
+        
+        entries[normalize_path(path)] = {
+            "width": width,
+            "height": height,
+            "offset": offset,
+            "length": len(pixels),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": source_hash
+        }
+        padding = -len(pixels) % ALIGNMENT
+        blobs.append(pixels + b"\0" * padding)
+        offset += len(pixels) + padding
+    
+    # Os offsets são relativos ao fim do índice; passam a absolutos aqui,
+    # com folga para os dígitos extra que isso acrescenta ao índice
+    index_bytes = json.dumps(entries).encode("utf-8")
+    data_start = HEADER.size + len(index_bytes) + 12 * len(entries)
+    data_start += -data_start % ALIGNMENT
+    for entry in entries.values():
+        entry["offset"] += data_start
+    index_bytes = json.dumps(entries).encode("utf-8")
+    index_bytes += b" " * (data_start - HEADER.size - len(index_bytes))
+    
+    folder = os.path.dirname(output_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        file.write(index_bytes)
+        for blob in blobs:
+            file.write(blob)
+    if previous:
+        previous.close()
+    os.replace(temp_path, output_path)
+    return decoded, reused
+
+def main():
+    start = time.perf_counter()
+    decoded, reused = cook()
+    elapsed = time.perf_counter() - start
+    print(f"Pacote {config.ASSET_CACHE_PATH}: {decoded} imagens cozinhadas, "
+          f"{reused} reaproveitadas ({elapsed:.2f}s)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Pré-carregamento de imagens em segundo plano
+"""
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from utils.startup_profiler import startup_profiler
+
+class AssetPreloader:
+    """
+    Descodifica imagens em threads de trabalho enquanto o menu continua a responder.
+    
+    pygame.image.load liberta o GIL durante a descodificação, por isso os
+    ficheiros PNG/JPG são lidos em paralelo. A conversão para o formato do
+    ecrã (convert/convert_alpha) tem de acontecer na thread principal e é
+    feita aos poucos em poll(), que guarda o resultado no AssetManager.
+    """
+    def __init__(self, manager, workers=4, executor=None):
+        """
+        Inicializa o preloader
+        
+        Args:
+            manager: AssetManager onde as imagens convertidas são guardadas
+            workers: Número de threads de descodificação
+            executor: ThreadPoolExecutor partilhado a usar; se None, é criado um
+                com `workers` threads só para este preloader
+        """
+        self.manager = manager
+        self.workers = workers
+        self.executor = executor
+        self.entries = []
+        self.queued = set()
+        self.ready = queue.SimpleQueue()
+        self.total = 0
+        self.completed = 0
+        self.started = False
+    
+    def add_image(self, path, convert_alpha=True):
+        """
+        Regista uma imagem para pré-carregar
+        
+        Args:
+            path: Caminho da imagem
+            convert_alpha: Se deve converter para formato com alpha
+        """
+        if path in self.queued or self.manager.has_image(path, convert_alpha):
+            return
+        # Imagens do pacote cozinhado não precisam de ser descodificadas
+        if self.manager.load_cooked_image(path, convert_alpha) is not None:
+            return
+        self.queued.add(path)
+        self.entries.append((path, convert_alpha))
+    
+    def add_folder(self, folder_path):
+        """
+        Regista todos os frames PNG de um diretório de animação
+        
+        Args:
+            folder_path: Caminho do diretório com os frames
+        """
+        if not os.path.isdir(folder_path):
+            return
+        for file in sorted(os.listdir(folder_path)):
+            if file.endswith('.png'):
+                self.add_image(os.path.join(folder_path, file))
+    
+    def start(self):
+        """
+        Começa a descodificar as imagens registadas em segundo plano
+        """
+        self.total = len(self.entries)
+        self.started = True
+        if not self.entries:
+            return
+        executor = self.executor or ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-preloader")
+        for path, convert_alpha in self.entries:
+            executor.submit(self.decode, path, convert_alpha)
+        if executor is not self.executor:
+            executor.shutdown(wait=False)
+    
+    def decode(self, path, convert_alpha):
+        """
+        Descodifica uma imagem (executado nas threads de trabalho)
+        
+        Args:
+            path: Caminho da imagem
+            convert_alpha: Se deve converter para formato com alpha
+        """
+        try:
+            with startup_profiler.span(f"decode {path}", "asset"):
+                image = pygame.image.load(path)
+        except Exception as e:
+            print(f"Erro ao pré-carregar imagem {path}: {e}")
+            image = None
+        self.ready.put((path, convert_alpha, image))
+    
+    def poll(self, time_budget=0.004):
+        """
+        Converte na thread principal as imagens já descodificadas
+        
+        Args:
+            time_budget: Tempo máximo (segundos) a gastar nesta chamada
+            
+        Returns:
+            True se todas as imagens já foram carregadas
+        """
+        deadline = time.perf_counter() + time_budget
+        while self.completed < self.total:
+            try:
+                path, convert_alpha, image = self.ready.get_nowait()
+            except queue.Empty:
+                break
+            # Imagens que falharam ficam para o AssetManager, que cria o fallback
+            if image is not None and not self.manager.has_image(path, convert_alpha):
+                image = image.convert_alpha() if convert_alpha else image.convert()
+                self.manager.add_image(path, image, convert_alpha)
+            self.completed += 1
+            if time.perf_counter() >= deadline:
+                break
+        return self.done
+    
+    def finish(self, draw_progress=None):
+        """
+        Bloqueia até todas as imagens estarem carregadas
+        
+        Args:
+            draw_progress: Função chamada com o progresso (0 a 1) a cada passo
+        """
+        if not self.started:
+            self.start()
+        while not self.poll(0.016):
+            if draw_progress:
+                draw_progress(self.progress)
+            pygame.event.pump()
+            time.sleep(0.001)
+        if draw_progress:
+            draw_progress(1.0)
+    
+    @property
+    def progress(self):
+        """Fração das imagens já carregadas"""
+        if self.total == 0:
+            return 1.0 if self.started else 0.0
+        return self.completed / self.total
+    
+    @property
+    def done(self):
+        """True quando todas as imagens estão no AssetManager"""
+        return self.started and self.completed >= self.total
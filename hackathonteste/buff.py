@@ -11,6 +11,10 @@ class Buff:
         self.duration = duration
         self.active = True
         
+        # Rects reused by collides_with every frame
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.character_rect = pygame.Rect(0, 0, 0, 0)
+        
         # Load buff images
         try:
             image_path = f"./imagens_background/{buff_type}_buff.png"
@@ -54,9 +58,12 @@ class Buff:
 
     def collides_with(self, character):
         """Check if buff collides with a character"""
-        buff_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        char_rect = pygame.Rect(character.x, character.y, character.width, character.height)
-        return buff_rect.colliderect(char_rect)
+        char_rect = self.character_rect
+        char_rect.x = character.x
+        char_rect.y = character.y
+        char_rect.width = character.width
+        char_rect.height = character.height
+        return self.rect.colliderect(char_rect)
     
     def draw(self, screen):
         """Draw the buff"""
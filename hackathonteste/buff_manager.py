@@ -10,6 +10,11 @@ class BuffManager:
         self.spawn_timer = 0
         self.spawn_delay = 180  # Reduced from 300 to spawn more frequently
 
+    def reset(self):
+        """Remove all buffs and restart the spawn timer"""
+        self.buffs.clear()
+        self.spawn_timer = 0
+
     def spawn_buff(self):
         """Spawn a new random buff"""
         buff_types = ["heal", "power", "mana"]
@@ -35,11 +40,14 @@ class BuffManager:
             self.spawn_buff()
             self.spawn_timer = 0
 
-        # Update existing buffs
-        for buff in self.buffs[:]:  # Copy list to safely remove items
+        # Update existing buffs, dropping inactive ones in place
+        buffs = self.buffs
+        kept = 0
+        for buff in buffs:
             if not buff.active:
-                self.buffs.remove(buff)
                 continue
+            buffs[kept] = buff
+            kept += 1
 
             buff.update()
             
@@ -50,6 +58,7 @@ class BuffManager:
                     if buff.buff_type == "power":
                         character.has_power_buff = True
                         character.power_buff_timer = buff.duration
+        del buffs[kept:]
 
     def draw(self, screen):
         """Draw all active buffs"""
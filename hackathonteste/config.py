@@ -36,4 +36,68 @@ GRAY = (100, 100, 100)
 BACKGROUNDS_PATH = "./imagens_background/"
 CHARACTERS_PATH = "./imagens_characters/"
 HUD_PATH = "./imagens_characters/SirLobo_Pack_HUD_2021_ONLY_PNG/HUD/Modulated/8/"
-SOUNDS_PATH = "./sounds/" 
\ No newline at end of file
+SOUNDS_PATH = "./sounds/"
+
+# Ligações de teclas e joysticks
+KEYBINDINGS_PATH = "./keybindings.json"
+
+# Pacote de imagens cozinhadas (python -m assets.cook)
+ASSET_CACHE_PATH = "./cache/assets.bundle"
+
+# Cache de imagens do AssetManager
+ASSET_MEMORY_BUDGET = 128 * 1024 * 1024  # bytes (largura × altura × bytes por pixel)
+ASSET_MAX_FONTS = 32
+
+# Saída de python main.py --profile-startup
+STARTUP_REPORT_PATH = "./startup_report.txt"
+STARTUP_TRACE_PATH = "./startup_trace.json"
+
+# Histogramas de tempo por frame (update/draw/present por nível), escritos na saída ou com F4
+FRAME_STATS_PATH = "./frame_stats"
+
+# Trace das fases do ciclo de jogo (python main.py --trace), escrito na saída ou com F5
+TRACE_PATH = "./game_trace.json"
+TRACE_CAPACITY = 1 << 16  # eventos guardados, cerca de 45 s a 60 FPS
+
+# Profiler por amostragem ligado e desligado com F6 durante a partida
+PROFILE_PATH = "./profiles"
+
+# Menu: tempo máximo (ms) à espera de eventos antes de voltar a verificar o estado
+MENU_IDLE_TIMEOUT = 1000
+MENU_LOADING_TIMEOUT = 16
+
+# Efeitos visuais: partículas vivas por personagem
+PARTICLE_CAPACITY = 128
+
+# Resolução interna do mundo (fundo, plataformas e personagens), escalada para o ecrã;
+# 960x540 ou 640x360 reduzem o custo de desenho em máquinas fracas. O HUD fica sempre nativo.
+RENDER_WIDTH = SCREEN_WIDTH
+RENDER_HEIGHT = SCREEN_HEIGHT
+RENDER_SMOOTHSCALE = False  # True suaviza a ampliação, mas custa mais do que o scale simples
+
+# Backend de desenho do jogo: "blit" (Surface.blit) ou "texture" (Renderer do SDL2,
+# com recurso a "blit" se não estiver disponível); também --renderer=texture
+RENDER_BACKEND = "blit"
+
+# Orçamento de desenho por zona e por frame, verificado com --count-draws: máximos de
+# Surfaces criadas, transformações, textos renderizados e blits (métricas omitidas não têm limite)
+DRAW_BUDGETS = {
+    "Level.draw": {"surfaces": 0, "transforms": 0, "fonts": 0, "blits": 8},
+    "Platform.draw": {"surfaces": 0, "transforms": 0, "fonts": 0, "blits": 16},
+    "Character.draw": {"surfaces": 0, "transforms": 0, "fonts": 2, "blits": 8},
+    "draw_effects": {"surfaces": 2, "transforms": 2, "fonts": 0, "blits": 64},
+    "FireProjectile.draw": {"surfaces": 1, "transforms": 0, "fonts": 0, "blits": 16},
+    "HUD": {"surfaces": 2, "transforms": 2, "fonts": 8, "blits": 16},
+}
+
+# Governador de qualidade: baixa os níveis de qualidade quando o frame passa do orçamento
+QUALITY_GOVERNOR = True
+QUALITY_FRAME_BUDGET_MS = 1000 / FPS
+QUALITY_WINDOW = 60  # frames na média móvel
+QUALITY_DOWNGRADE_RATIO = 1.0  # baixa se a média passar do orçamento
+QUALITY_UPGRADE_RATIO = 0.6  # sobe se a média ficar abaixo de 60% do orçamento
+QUALITY_DOWNGRADE_HOLD = 60  # frames mínimos num nível antes de baixar
+QUALITY_UPGRADE_HOLD = 300  # frames mínimos num nível antes de voltar a subir
+
+# Atualizações extra por frame desenhado quando o jogo se atrasa em relação ao relógio
+MAX_FRAME_SKIP = 5
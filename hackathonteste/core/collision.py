@@ -0,0 +1,85 @@
+"""
+Colisão contínua (swept AABB) para objetos rápidos
+"""
+
+INFINITY = float("inf")
+
+
+def _sweep(left, top, right, bottom, dx, dy, target):
+    """
+    Calcula o instante de entrada de uma caixa em movimento numa caixa parada
+
+    Args:
+        left, top, right, bottom: Limites da caixa na posição inicial
+        dx, dy: Deslocamento durante o passo
+        target: Retângulo parado
+
+    Returns:
+        Fração do passo (0 a 1) em que o contacto começa, ou None
+    """
+    if left < target.right and right > target.left and top < target.bottom and bottom > target.top:
+        return 0.0
+
+    if dx > 0:
+        x_entry = (target.left - right) / dx
+        x_exit = (target.right - left) / dx
+    elif dx < 0:
+        x_entry = (target.right - left) / dx
+        x_exit = (target.left - right) / dx
+    elif right <= target.left or left >= target.right:
+        return None
+    else:
+        x_entry = -INFINITY
+        x_exit = INFINITY
+
+    if dy > 0:
+        y_entry = (target.top - bottom) / dy
+        y_exit = (target.bottom - top) / dy
+    elif dy < 0:
+        y_entry = (target.bottom - top) / dy
+        y_exit = (target.top - bottom) / dy
+    elif bottom <= target.top or top >= target.bottom:
+        return None
+    else:
+        y_entry = -INFINITY
+        y_exit = INFINITY
+
+    entry = x_entry if x_entry > y_entry else y_entry
+    exit_time = x_exit if x_exit < y_exit else y_exit
+    if entry >= exit_time or entry < 0 or entry >= 1:
+        return None
+    return entry
+
+
+def sweep_aabb(rect, dx, dy, target):
+    """
+    Instante de impacto de um retângulo que se desloca (dx, dy) contra outro
+
+    Args:
+        rect: Retângulo na posição inicial
+        dx, dy: Deslocamento durante o passo
+        target: Retângulo parado
+
+    Returns:
+        Fração do passo (0 a 1) em que o contacto começa, ou None
+    """
+    return _sweep(rect.left, rect.top, rect.right, rect.bottom, dx, dy, target)
+
+
+def swept_collides(rect, dx, dy, target):
+    """
+    Verifica se um retângulo tocou no alvo durante o último deslocamento
+
+    Ao contrário de colliderect, deteta também os casos em que o passo foi
+    maior que o alvo e o retângulo o atravessou entre dois frames.
+
+    Args:
+        rect: Retângulo na posição final
+        dx, dy: Deslocamento que acabou de ser aplicado
+        target: Retângulo parado
+
+    Returns:
+        True se houve contacto durante o passo
+    """
+    return _sweep(rect.left - dx, rect.top - dy, rect.right - dx, rect.bottom - dy,
+                  dx, dy, target) is not None
@@ -0,0 +1,309 @@
+"""
+Estado de input dos jogadores e mapa de teclas configurável
+"""
+import json
+import pygame
+import config
+
+# Ordem fixa das ações; cada ação ocupa um bit da máscara
+ACTIONS = ("left", "right", "up", "down", "attack", "defend", "special")
+ACTION_BITS = {action: 1 << index for index, action in enumerate(ACTIONS)}
+
+# Ligações por omissão, usadas quando o ficheiro de configuração falta ou está incompleto
+DEFAULT_BINDINGS = {
+    "player1": {
+        "keys": {
+            "left": ["a"], "right": ["d"], "up": ["w"], "down": ["s"],
+            "attack": ["f"], "defend": ["g"], "special": ["h"]
+        }
+    },
+    "player2": {
+        "keys": {
+            "left": ["left"], "right": ["right"], "up": ["up"], "down": ["down"],
+            "attack": ["k"], "defend": ["l"], "special": ["m"]
+        }
+    }
+}
+
+# Textos do guia de controlos
+GUIDE_LABELS = (
+    ("Movimento", ("up", "left", "down", "right")),
+    ("Ataque", ("attack",)),
+    ("Defesa", ("defend",)),
+    ("Especial", ("special",))
+)
+ARROW_KEYS = ("up", "left", "down", "right")
+
+
+class Controls:
+    """
+    Ações pressionadas por um jogador, guardadas numa máscara de bits.
+
+    Cada jogador tem uma única instância, reescrita a cada frame pelo InputMap,
+    por isso ler o input não cria objetos novos. controls["left"] continua a
+    funcionar como nos antigos dicionários de controlos.
+    """
+    __slots__ = ("bits",)
+
+    def __init__(self):
+        self.bits = 0
+
+    def clear(self):
+        """
+        Limpa todas as ações
+        """
+        self.bits = 0
+
+    def __getitem__(self, action):
+        return (self.bits & ACTION_BITS[action]) != 0
+
+
+class InputMap:
+    """
+    Mapa de input compilado a partir do ficheiro de ligações.
+
+    As ligações são convertidas uma única vez em tabelas planas
+    (tecla → jogador, bit); a cada frame basta uma passagem por essas tabelas
+    para produzir a máscara de ações de cada jogador. Os joysticks alimentam
+    as mesmas máscaras.
+    """
+    def __init__(self, bindings):
+        """
+        Compila as ligações
+
+        Args:
+            bindings: Dicionário no formato de DEFAULT_BINDINGS
+        """
+        self.bindings = bindings
+        self.player_keys = ("player1", "player2")
+        self.key_table = ()
+        self.button_table = ()
+        self.axis_table = ()
+        self.hat_table = ()
+        # Linhas do guia de controlos de cada jogador, geradas em compile()
+        self.guides = ()
+        self.joysticks = {}
+        self.masks = [0] * len(self.player_keys)
+        self.compile()
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Carrega as ligações de um ficheiro JSON
+
+        Args:
+            path: Caminho do ficheiro de ligações
+
+        Returns:
+            InputMap compilado (usa as ligações por omissão se o ficheiro falhar)
+        """
+        bindings = {player: {"keys": dict(data["keys"])} for player, data in DEFAULT_BINDINGS.items()}
+        try:
+            with open(path, encoding="utf-8") as file:
+                loaded = json.load(file)
+            for player, data in loaded.items():
+                entry = bindings.setdefault(player, {"keys": {}})
+                entry["keys"].update(data.get("keys", {}))
+                if "joystick" in data:
+                    entry["joystick"] = data["joystick"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Erro ao carregar ligações de teclas {path}: {e}")
+        return cls(bindings)
+
+    def compile(self):
+        """
+        Converte as ligações em tabelas de consulta
+        """
+        key_table = []
+        button_table = []
+        axis_table = []
+        hat_table = []
+
+        for player_index, player in enumerate(self.player_keys):
+            data = self.bindings.get(player, {})
+            for action, names in data.get("keys", {}).items():
+                if action not in ACTION_BITS:
+                    continue
+                for name in names:
+                    try:
+                        key_table.append((pygame.key.key_code(name), player_index, ACTION_BITS[action]))
+                    except ValueError:
+                        print(f"Tecla desconhecida '{name}' para {player}/{action}")
+
+            joystick = data.get("joystick")
+            if joystick is None:
+                continue
+            device = joystick.get("device", player_index)
+            if not self.open_joystick(device):
+                continue
+            # Botões, eixos e hats que o comando não tem são ignorados: lê-los faria
+            # o sample() falhar em todos os frames
+            device_joystick = self.joysticks[device]
+            device_buttons = device_joystick.get_numbuttons()
+            for action, button in joystick.get("buttons", {}).items():
+                if action not in ACTION_BITS:
+                    continue
+                if button < device_buttons:
+                    button_table.append((device, button, player_index, ACTION_BITS[action]))
+                else:
+                    print(f"Joystick {device} não tem o botão {button} ({player}/{action})")
+            device_axes = device_joystick.get_numaxes()
+            deadzone = joystick.get("deadzone", 0.5)
+            axis_x = joystick.get("axis_x", 0)
+            axis_y = joystick.get("axis_y", 1)
+            if axis_x < device_axes:
+                axis_table.append((device, axis_x, -deadzone, player_index, ACTION_BITS["left"]))
+                axis_table.append((device, axis_x, deadzone, player_index, ACTION_BITS["right"]))
+            else:
+                print(f"Joystick {device} não tem o eixo {axis_x} ({player}/axis_x)")
+            if axis_y < device_axes:
+                axis_table.append((device, axis_y, -deadzone, player_index, ACTION_BITS["up"]))
+                axis_table.append((device, axis_y, deadzone, player_index, ACTION_BITS["down"]))
+            else:
+                print(f"Joystick {device} não tem o eixo {axis_y} ({player}/axis_y)")
+            hat = joystick.get("hat", 0)
+            if hat < device_joystick.get_numhats():
+                hat_table.append((device, hat, player_index))
+            else:
+                print(f"Joystick {device} não tem o hat {hat} ({player}/hat)")
+
+        self.key_table = tuple(key_table)
+        self.button_table = tuple(button_table)
+        self.axis_table = tuple(axis_table)
+        self.hat_table = tuple(hat_table)
+        self.guides = tuple(self.build_guide_lines(index) for index in range(len(self.player_keys)))
+
+    def open_joystick(self, device):
+        """
+        Abre um joystick, se estiver ligado
+
+        Args:
+            device: Índice do joystick
+
+        Returns:
+            True se o joystick está disponível
+        """
+        if device in self.joysticks:
+            return True
+        try:
+            if not pygame.joystick.get_init():
+                pygame.joystick.init()
+            if device >= pygame.joystick.get_count():
+                return False
+            joystick = pygame.joystick.Joystick(device)
+            joystick.init()
+            self.joysticks[device] = joystick
+            return True
+        except pygame.error:
+            return False
+
+    def sample(self, controls):
+        """
+        Lê o teclado e os joysticks e atualiza os controlos dos jogadores
+
+        Args:
+            controls: Sequência de Controls, um por jogador
+        """
+        masks = self.masks
+        for index in range(len(masks)):
+            masks[index] = 0
+
+        keys = pygame.key.get_pressed()
+        for key, player_index, bit in self.key_table:
+            if keys[key]:
+                masks[player_index] |= bit
+
+        if self.joysticks:
+            joysticks = self.joysticks
+            for device, button, player_index, bit in self.button_table:
+                if joysticks[device].get_button(button):
+                    masks[player_index] |= bit
+            for device, axis, threshold, player_index, bit in self.axis_table:
+                value = joysticks[device].get_axis(axis)
+                if (threshold < 0 and value <= threshold) or (threshold > 0 and value >= threshold):
+                    masks[player_index] |= bit
+            for device, hat, player_index in self.hat_table:
+                hat_x, hat_y = joysticks[device].get_hat(hat)
+                if hat_x < 0:
+                    masks[player_index] |= ACTION_BITS["left"]
+                elif hat_x > 0:
+                    masks[player_index] |= ACTION_BITS["right"]
+                if hat_y > 0:
+                    masks[player_index] |= ACTION_BITS["up"]
+                elif hat_y < 0:
+                    masks[player_index] |= ACTION_BITS["down"]
+
+        for index in range(len(controls)):
+            controls[index].bits = masks[index]
+
+    def key_label(self, player_index, action):
+        """
+        Retorna o texto das teclas ligadas a uma ação
+
+        Args:
+            player_index: 0 para o jogador 1, 1 para o jogador 2
+            action: Nome da ação
+
+        Returns:
+            Texto com as teclas (ex.: "F" ou "K/Enter")
+        """
+        names = self.bindings.get(self.player_keys[player_index], {}).get("keys", {}).get(action, [])
+        return "/".join(name.upper() if len(name) == 1 else name.capitalize() for name in names)
+
+    def guide_lines(self, player_index):
+        """
+        Retorna as linhas do guia de controlos de um jogador, geradas ao compilar
+
+        Args:
+            player_index: 0 para o jogador 1, 1 para o jogador 2
+
+        Returns:
+            Tupla de tuplas (ação, teclas)
+        """
+        return self.guides[player_index]
+
+    def build_guide_lines(self, player_index):
+        """
+        Gera as linhas do guia de controlos de um jogador
+
+        Args:
+            player_index: 0 para o jogador 1, 1 para o jogador 2
+
+        Returns:
+            Tupla de tuplas (ação, teclas)
+        """
+        lines = []
+        for label, actions in GUIDE_LABELS:
+            if actions == ARROW_KEYS:
+                keys = self.bindings.get(self.player_keys[player_index], {}).get("keys", {})
+                if tuple((keys.get(action) or [None])[0] for action in actions) == ARROW_KEYS:
+                    text = "Setas"
+                else:
+                    # Ações sem teclas ficam de fora do texto
+                    labels = [self.key_label(player_index, action) for action in actions if keys.get(action)]
+                    separator = "" if all(len(item) == 1 for item in labels) else " "
+                    text = separator.join(labels)
+            else:
+                text = self.key_label(player_index, actions[0])
+            lines.append((label, text))
+        return tuple(lines)
+
+
+_input_map = None
+
+
+def get_input_map():
+    """
+    Retorna o mapa de input partilhado, compilando-o na primeira chamada
+
+    Tem de ser chamado depois de pygame.init().
+
+    Returns:
+        InputMap carregado de config.KEYBINDINGS_PATH
+    """
+    global _input_map
+    if _input_map is None:
+        _input_map = InputMap.from_file(config.KEYBINDINGS_PATH)
+    return _input_map
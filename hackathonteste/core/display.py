@@ -0,0 +1,298 @@
+"""
+Janela do jogo e backend de desenho
+
+Dois backends, escolhidos no arranque:
+- "blit": o jogo desenha com Surface.blit no ecrã do pygame.display;
+- "texture": o jogo desenha num TextureCanvas, que envia cada Surface uma
+  vez para uma Texture do SDL2 e desenha os frames com cópias do Renderer.
+  Funciona também com o renderer por software do SDL, em máquinas sem GPU.
+
+Os ecrãs desenhados inteiros em software (menu, ecrã de carregamento) usam
+sempre `display.surface` e são enviados de uma vez em `present(surface)`.
+"""
+import weakref
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    Window = Renderer = Texture = None
+
+class TextureCanvas:
+    """
+    Destino de desenho com a interface de blit de uma Surface, desenhado com texturas
+
+    Cada Surface desenhada é enviada para uma Texture na primeira vez e a
+    textura é reaproveitada enquanto a Surface existir. Quem redesenha uma
+    Surface já desenhada tem de chamar invalidate() (ou display.invalidate())
+    para a textura ser atualizada.
+    """
+    def __init__(self, renderer, size, parent=None):
+        """
+        Args:
+            renderer: Renderer do SDL2
+            size: Tupla (width, height) da área de desenho
+            parent: Canvas da janela, se este desenhar numa textura (ver create_target)
+        """
+        self.renderer = renderer
+        self.size = size
+        # Canvas que guarda as texturas e o total de envios, partilhados com os alvos
+        self.root = parent.root if parent is not None else self
+        self.textures = self.root.textures if parent is not None else weakref.WeakKeyDictionary()
+        self.circles = self.root.circles if parent is not None else {}
+        self.uploads = 0
+        # Textura onde este canvas desenha (None desenha na janela)
+        self.texture = None
+
+    def create_target(self, size):
+        """
+        Cria um canvas que desenha numa textura de outro tamanho (resolução interna)
+
+        Args:
+            size: Tupla (width, height) da textura
+
+        Returns:
+            TextureCanvas com uma Texture alvo; ver bind() e draw_target()
+        """
+        canvas = TextureCanvas(self.renderer, size, self)
+        canvas.texture = Texture(self.renderer, size, target=True)
+        return canvas
+
+    def bind(self):
+        """Faz as operações seguintes desenharem neste canvas"""
+        self.renderer.target = self.texture
+
+    def draw_target(self):
+        """Copia a textura deste canvas para a janela inteira, escalada pelo Renderer"""
+        self.renderer.target = None
+        self.texture.draw()
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def get_texture(self, surface):
+        """
+        Retorna a textura de uma Surface, enviando-a na primeira vez
+
+        Args:
+            surface: Surface a desenhar
+
+        Returns:
+            Texture com os píxeis, transparência e alpha da Surface
+        """
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+            self.root.uploads += 1
+        return texture
+
+    def invalidate(self, surface):
+        """
+        Atualiza a textura de uma Surface redesenhada no lugar
+
+        Args:
+            surface: Surface alterada depois de ter sido desenhada
+        """
+        texture = self.textures.get(surface)
+        if texture is not None:
+            texture.update(surface)
+            self.root.uploads += 1
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Desenha uma Surface, como Surface.blit (special_flags é ignorado)
+
+        Args:
+            source: Surface a desenhar
+            dest: Posição (x, y) ou Rect
+            area: Parte da Surface a desenhar
+        """
+        x, y = dest[0], dest[1]
+        texture = self.get_texture(source)
+        alpha = source.get_alpha()
+        if alpha is not None and alpha != texture.alpha:
+            # Transparência da Surface alterada depois do envio (ex.: guia de controles)
+            texture.alpha = alpha
+        if area is None:
+            width, height = source.get_size()
+            texture.draw(dstrect=(x, y, width, height))
+            return
+        area = pygame.Rect(area).clip(source.get_rect())
+        if area.width and area.height:
+            texture.draw(srcrect=area, dstrect=(x, y, area.width, area.height))
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Desenha várias Surfaces, como Surface.blits"""
+        for item in blit_sequence:
+            self.blit(*item)
+
+    def fill(self, color, rect=None):
+        """Pinta a área de desenho, ou um retângulo, com uma cor"""
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def draw_rect(self, color, rect, width=0):
+        """
+        Desenha um retângulo, preenchido ou com contorno
+
+        Args:
+            color: Cor RGB(A)
+            rect: Retângulo
+            width: Espessura do contorno (0 preenche)
+        """
+        self.renderer.draw_color = pygame.Color(color)
+        rect = pygame.Rect(rect)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+            return
+        for i in range(width):
+            self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+
+    def draw_circle(self, color, center, radius):
+        """
+        Desenha um círculo preenchido, a partir de uma Surface desenhada uma vez
+
+        Args:
+            color: Cor RGB(A)
+            center: Centro (x, y)
+            radius: Raio em píxeis
+        """
+        key = (tuple(color), radius)
+        circle = self.circles.get(key)
+        if circle is None:
+            circle = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(circle, color, (radius, radius), radius)
+            self.circles[key] = circle
+        self.blit(circle, (center[0] - radius, center[1] - radius))
+
+def draw_rect(surface, color, rect, width=0):
+    """pygame.draw.rect que também aceita um TextureCanvas (ou outro destino com draw_rect)"""
+    if not isinstance(surface, pygame.Surface):
+        surface.draw_rect(color, rect, width)
+    else:
+        pygame.draw.rect(surface, color, rect, width)
+
+def draw_circle(surface, color, center, radius):
+    """pygame.draw.circle preenchido que também aceita um TextureCanvas (ou outro destino com draw_circle)"""
+    if not isinstance(surface, pygame.Surface):
+        surface.draw_circle(color, center, radius)
+    else:
+        pygame.draw.circle(surface, color, center, radius)
+
+class Display:
+    """
+    Janela do jogo com o backend escolhido no arranque
+    """
+    BACKENDS = ("blit", "texture")
+
+    def __init__(self):
+        self.backend = None
+        # Surface para ecrãs desenhados inteiros em software (menu)
+        self.surface = None
+        # Destino de desenho do jogo: o ecrã (blit) ou um TextureCanvas
+        self.canvas = None
+        self.window = None
+        self.renderer = None
+        self.frame_texture = None
+
+    def open(self, size, title, backend="blit"):
+        """
+        Abre a janela
+
+        Args:
+            size: Tupla (width, height)
+            title: Título da janela
+            backend: "blit" ou "texture"; se as texturas falharem usa "blit"
+
+        Returns:
+            Destino de desenho do jogo (display.canvas)
+        """
+        if backend not in self.BACKENDS:
+            print(f"Backend de desenho desconhecido: {backend}; a usar blit")
+        elif backend == "texture":
+            try:
+                self.open_texture(size, title)
+                return self.canvas
+            except Exception as e:
+                print(f"Renderer por texturas indisponível ({e}); a usar blit")
+                self.window = self.renderer = None
+
+        self.surface = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        self.canvas = self.surface
+        self.backend = "blit"
+        return self.canvas
+
+    def open_texture(self, size, title):
+        """
+        Cria a janela com um Renderer do SDL2 (acelerado, ou por software se não houver GPU)
+        """
+        if Window is None:
+            raise RuntimeError("pygame._sdl2 não disponível")
+        # Modo de vídeo escondido: convert()/convert_alpha() precisam do formato do ecrã
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(title, size=size)
+        self.renderer = Renderer(self.window, accelerated=-1)
+        self.surface = pygame.Surface(size).convert()
+        self.canvas = TextureCanvas(self.renderer, size)
+        self.backend = "texture"
+
+    def present(self, surface=None):
+        """
+        Mostra o frame desenhado
+
+        Args:
+            surface: Ecrã desenhado inteiro em software (display.surface), a enviar
+                de uma vez; None se o frame foi desenhado em display.canvas
+        """
+        if self.backend != "texture":
+            pygame.display.flip()
+            return
+        if surface is not None:
+            if self.frame_texture is None:
+                self.frame_texture = Texture(self.renderer, surface.get_size(), streaming=True)
+            self.frame_texture.update(surface)
+            self.frame_texture.draw()
+        self.renderer.present()
+
+    def invalidate(self, surface):
+        """
+        Avisa que uma Surface foi redesenhada no lugar (só o backend por texturas precisa)
+
+        Args:
+            surface: Surface alterada
+        """
+        if self.backend == "texture":
+            self.canvas.invalidate(surface)
+
+    def get_stats(self):
+        """
+        Estado do backend para o painel de desempenho
+
+        Returns:
+            Dicionário com o backend, as texturas vivas e o total de envios
+        """
+        stats = {"backend": self.backend or "blit", "textures": 0, "uploads": 0}
+        if self.backend == "texture":
+            stats["textures"] = len(self.canvas.textures)
+            stats["uploads"] = self.canvas.uploads
+        return stats
+
+# Instância global, aberta em main.py
+display = Display()
@@ -1,14 +1,32 @@
 import pygame
 import sys
 import random
+import time
+import config
 from entities.characters import Fighter, Mage, Rogue
+from core.controls import Controls, get_input_map
 
+from assets.asset_manager import asset_manager
 from ui.hud import HUD
 from ui.game_over import GameOver
+from ui.perf_overlay import PerfOverlay
+from core.render_target import RenderTarget
+from core.display import display
+from core.quality import QualityGovernor
+from utils.frame_stats import frame_stats
+from utils.tracer import tracer
+from utils.sampler import sampling_profiler
+from utils.draw_counters import draw_counters
 
 class Game:
+    MOSQUETEIRO_PATH = "./imagens_characters/mosqueteiro.jpeg"
+    # No buffs are spawned in a match; shared so update_local gets no new list per tick
+    NO_BUFFS = ()
+    
     def __init__(self, screen, player1_class, player2_class, player1_name, player2_name, level_manager):
-        self.screen = screen
+        # The world is drawn at the internal resolution; the HUD goes straight to the screen
+        self.render_target = RenderTarget(screen)
+        self.screen = draw_counters.wrap(screen)
         self.level_manager = level_manager
         self.clock = pygame.time.Clock()
         self.running = True
@@ -21,7 +39,7 @@ class Game:
         self.winner = None
         self.respawn_delay = 120  # 2 segundos para respawn
         self.respawn_timer = 0
-        self.mosqueteiro = pygame.image.load("./imagens_characters/mosqueteiro.jpeg").convert_alpha()
+        self.mosqueteiro = asset_manager.load_image(self.MOSQUETEIRO_PATH)
         
         # Controls guide
         self.show_controls = True
@@ -36,22 +54,63 @@ class Game:
         self.player2_name = player2_name
         self.player1_lives = 3
         self.player2_lives = 3
+        # Players are created in the first round and reset in place afterwards
+        self.players = ()
+        
+        # Input state, reused every frame
+        self.input_map = get_input_map()
+        self.player1_controls = Controls()
+        self.player2_controls = Controls()
+        self.controls = (self.player1_controls, self.player2_controls)
         
         # Componentes
         self.hud = HUD(self)
         self.game_over_screen = GameOver(self)
+        self.perf_overlay = PerfOverlay(self)
+        # Countdown text, rendered once per second: (seconds, surface)
+        self.countdown_text = (None, None)
+        # Steps quality tiers down when frames overrun their budget
+        self.quality = QualityGovernor(self)
+        
+        # Catch-up health metrics: updates run without a draw, and ticks given up
+        # because the loop was further behind than config.MAX_FRAME_SKIP allows
+        self.skipped_draws = 0
+        self.lost_ticks = 0
+        # Counters already added to the session frame stats
+        self.reported_skipped_draws = 0
+        self.reported_lost_ticks = 0
+        
+        # As imagens das personagens e do HUD ficam fixadas na cache durante a partida
+        self.pin_assets()
         
         # Initialize first round with full lives
         self.initialize_round()
     
+    def pin_assets(self):
+        """Fixa na cache de imagens os assets usados durante toda a partida"""
+        character_classes = (Fighter, Mage, Rogue)
+        paths = list(HUD.asset_paths())
+        paths.append(self.MOSQUETEIRO_PATH)
+        for class_id in (self.player1_class, self.player2_class):
+            for folder in character_classes[min(class_id, 2)].animation_folders():
+                paths.extend(asset_manager.animation_paths(folder))
+        asset_manager.pin("match", paths)
+    
     def initialize_round(self):
         """Initialize or reset the round state"""
         # Get spawn points from current level
         spawn_points = self.level_manager.get_spawn_points()
         
-        # Create players at spawn points with current lives
-        self.player1 = self.create_player(self.player1_class, self.player1_name, spawn_points[0], self.player1_lives, is_player2=False)
-        self.player2 = self.create_player(self.player2_class, self.player2_name, spawn_points[1], self.player2_lives, is_player2=True)
+        # Create players at spawn points with current lives, or reset the existing ones
+        if self.players:
+            self.player1.reset(*spawn_points[0])
+            self.player2.reset(*spawn_points[1])
+            self.player1.lives = self.player1_lives
+            self.player2.lives = self.player2_lives
+        else:
+            self.player1 = self.create_player(self.player1_class, self.player1_name, spawn_points[0], self.player1_lives, is_player2=False)
+            self.player2 = self.create_player(self.player2_class, self.player2_name, spawn_points[1], self.player2_lives, is_player2=True)
+            self.players = (self.player1, self.player2)
         
         # Reset round-specific variables
         self.game_started = False
@@ -61,6 +120,41 @@ class Game:
         
         # Get platforms from current level
         self.platforms = self.level_manager.get_platforms()
+        self.platform_index = self.level_manager.get_platform_index()
+        
+        # Carrega o próximo nível durante a ronda para a transição não engasgar
+        self.level_manager.prefetch_next_level()
+        
+        # New or reset players get the current quality settings
+        self.quality.apply()
+    
+    def reset(self, player1_class=None, player2_class=None):
+        """Restore the initial match state in place for a rematch"""
+        # Players are only rebuilt if a different class was chosen
+        if player1_class is not None and player1_class != self.player1_class:
+            self.player1_class = player1_class
+            self.players = ()
+        if player2_class is not None and player2_class != self.player2_class:
+            self.player2_class = player2_class
+            self.players = ()
+        if not self.players:
+            self.pin_assets()
+        
+        self.level_manager.reset()
+        self.running = True
+        self.current_time = self.round_time
+        self.game_over = False
+        self.winner = None
+        self.respawn_timer = 0
+        self.show_controls = True
+        self.controls_alpha = 128
+        self.controls_fade_timer = 600
+        self.player1_lives = 3
+        self.player2_lives = 3
+        for player_controls in self.controls:
+            player_controls.clear()
+        
+        self.initialize_round()
     
     def create_player(self, class_id, name, spawn_point, lives, is_player2=False):
         """Create a player based on the selected class at the spawn point"""
@@ -74,13 +168,17 @@ class Game:
             player = Rogue(x, y, name, is_player2)
         
         player.lives = lives
+        player.prepare_frames(self.render_target.scale)
         return player
     
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
+                self.export_frame_stats()
+                tracer.dump(config.TRACE_PATH)
+                sampling_profiler.finish(config.PROFILE_PATH)
                 pygame.quit()
                 sys.exit()
             
@@ -94,11 +192,25 @@ class Game:
                 # Switch controls position with C key
                 elif event.key == pygame.K_c:
                     self.controls_position = "right" if self.controls_position == "left" else "left"
+                # Toggle performance overlay with F3
+                elif event.key == pygame.K_F3:
+                    self.perf_overlay.toggle()
+                # Write the session frame-time histograms with F4
+                elif event.key == pygame.K_F4:
+                    self.export_frame_stats()
+                # Write the game-loop trace (python main.py --trace) with F5
+                elif event.key == pygame.K_F5:
+                    tracer.dump(config.TRACE_PATH)
+                # Start/stop the sampling profiler with F6
+                elif event.key == pygame.K_F6:
+                    sampling_profiler.toggle(config.PROFILE_PATH)
     
     def update(self):
         """Update game state"""
         if self.game_over:
             return
+        
+        self.level_manager.update()
             
         # Handle start delay
         if not self.game_started:
@@ -116,13 +228,10 @@ class Game:
             self.determine_round_winner()
             return
         
-        # Get input for both players
-        keys = pygame.key.get_pressed()
-        
         # Update players
         if self.game_started:
             # Check for out of bounds
-            for player in [self.player1, self.player2]:
+            for player in self.players:
                 if player.y > 700:
                     if self.current_time == 210 and player == self.player1:
                             self.screen.blit(self.mosqueteiro, (0,0))
@@ -183,29 +292,18 @@ class Game:
                     self.player2.health = 0
  
             # Player controls
-            player1_controls = {
-                "left": keys[pygame.K_a],
-                "right": keys[pygame.K_d],
-                "up": keys[pygame.K_w],
-                "down": keys[pygame.K_s],
-                "attack": keys[pygame.K_f],
-                "defend": keys[pygame.K_g],
-                "special": keys[pygame.K_h]
-            }
+            self.input_map.sample(self.controls)
             
-            player2_controls = {
-                "left": keys[pygame.K_LEFT],
-                "right": keys[pygame.K_RIGHT],
-                "up": keys[pygame.K_UP],
-                "down": keys[pygame.K_DOWN],
-                "attack": keys[pygame.K_k],
-                "defend": keys[pygame.K_l],
-                "special": keys[pygame.K_m]
-            }
+            # Particles and effect timers step once per tick, so catch-up ticks without a draw still age them
+            for player in self.players:
+                player.view.particles.update()
+                player.update_effects()
             
             # Update players with platform collision
-            self.player1.update_local(player1_controls, self.player2, [], self.platforms)
-            self.player2.update_local(player2_controls, self.player1, [], self.platforms)
+            with tracer.span("update_local P1"):
+                self.player1.update_local(self.player1_controls, self.player2, self.NO_BUFFS, self.platform_index)
+            with tracer.span("update_local P2"):
+                self.player2.update_local(self.player2_controls, self.player1, self.NO_BUFFS, self.platform_index)
     
     def determine_round_winner(self):
         """Determina o vencedor do nível atual e avança para o próximo"""
@@ -254,44 +352,129 @@ class Game:
             self.initialize_round()
     
     def draw(self):
-        """Draw everything to the screen"""
+        """Draw everything to the screen and show the frame"""
+        self.render()
+        display.present()
+    
+    def render(self):
+        """Draw everything to the screen, without presenting it"""
+        self.render_target.begin()
+        world = self.render_target.canvas
+        
         # Draw current level
         current_level = self.level_manager.get_current_level()
-        current_level.draw(self.screen)
+        with tracer.span("Level.draw"), draw_counters.site("Level.draw"):
+            current_level.draw(world)
         
         # Draw platforms
-        for platform in self.platforms:
-            # Desenha a imagem da plataforma em vez de um retângulo simples
-            self.screen.blit(platform.image, platform.rect)
+        with draw_counters.site("Platform.draw"):
+            for platform in self.platforms:
+                # Desenha a imagem da plataforma em vez de um retângulo simples
+                platform.draw(world)
+        
+        # Draw players
+        with tracer.span("Character.draw P1"), draw_counters.site("Character.draw"):
+            self.player1.draw(world)
+        with tracer.span("Character.draw P2"), draw_counters.site("Character.draw"):
+            self.player2.draw(world)
+        
+        # Scale the world to the screen before drawing the UI on top
+        self.render_target.present()
         
         # Draw start countdown
         if not self.game_started:
             countdown = (self.start_delay // 60) + 1
-            text = self.hud.font.render(f"Começando em {countdown}...", True, (255, 255, 255))
+            if self.countdown_text[0] != countdown:
+                self.countdown_text = (countdown, self.hud.font.render(f"Começando em {countdown}...", True, (255, 255, 255)))
+            text = self.countdown_text[1]
             text_rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
             self.screen.blit(text, text_rect)
         
-        # Draw players
-        self.player1.draw(self.screen)
-        self.player2.draw(self.screen)
-        
         # Draw HUD
-        self.hud.draw()
+        with tracer.span("HUD.draw"), draw_counters.site("HUD"):
+            self.hud.draw()
         
         # Draw controls guide if enabled
         if self.show_controls:
-            self.hud.draw_controls_guide()
+            with tracer.span("draw_controls_guide"), draw_counters.site("HUD"):
+                self.hud.draw_controls_guide()
         
         # Draw game over screen if game is over
         if self.game_over:
             self.game_over_screen.draw()
         
-        pygame.display.flip()
+        self.perf_overlay.draw()
     
     def run(self):
-        """Run the game loop"""
+        """Run the game loop, catching up with extra updates when behind wall-clock time"""
+        tick_ms = 1000 / self.fps
+        lag = 0.0
+        last_frame = time.perf_counter()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(self.fps) 
\ No newline at end of file
+            frame_start = time.perf_counter()
+            lag += (frame_start - last_frame) * 1000
+            last_frame = frame_start
+            
+            with tracer.span("handle_events"):
+                self.handle_events()
+            # Timed per level, so a slow background shows up in the session stats
+            level = self.level_manager.get_level_name()
+            ticks, lag = self.catch_up_ticks(lag, tick_ms)
+            update_start = time.perf_counter()
+            for _ in range(ticks):
+                with tracer.span("update"):
+                    self.update()
+            render_start = time.perf_counter()
+            with tracer.span("render"):
+                self.render()
+            present_start = time.perf_counter()
+            with tracer.span("display.present"):
+                display.present()
+            frame_end = time.perf_counter()
+            
+            frame_stats.record(level, "update", (render_start - update_start) * 1000)
+            frame_stats.record(level, "draw", (present_start - render_start) * 1000)
+            frame_stats.record(level, "present", (frame_end - present_start) * 1000)
+            self.quality.record((frame_end - frame_start) * 1000)
+            draw_counters.end_frame()
+            self.clock.tick(self.fps)
+        self.update_frame_stats_info()
+    
+    def update_frame_stats_info(self):
+        """Store the backend and catch-up counters with the session frame stats"""
+        frame_stats.info.update(
+            pygame=pygame.version.ver,
+            sdl=".".join(map(str, pygame.get_sdl_version())),
+            render_size=list(self.render_target.size),
+            quality=self.quality.settings["name"],
+            skipped_draws=frame_stats.info.get("skipped_draws", 0) + self.skipped_draws - self.reported_skipped_draws,
+            lost_ticks=frame_stats.info.get("lost_ticks", 0) + self.lost_ticks - self.reported_lost_ticks,
+            **display.get_stats())
+        if draw_counters.enabled:
+            frame_stats.info["draw_counters"] = draw_counters.summary()
+        self.reported_skipped_draws = self.skipped_draws
+        self.reported_lost_ticks = self.lost_ticks
+    
+    def export_frame_stats(self):
+        """Write the session frame-time histograms to config.FRAME_STATS_PATH"""
+        self.update_frame_stats_info()
+        return frame_stats.export(config.FRAME_STATS_PATH)
+    
+    def catch_up_ticks(self, lag, tick_ms):
+        """
+        Number of updates to run before the next draw
+        
+        Rounds the elapsed time to whole ticks, so normal clock jitter still
+        gives one update per frame. Behind by more than config.MAX_FRAME_SKIP
+        extra ticks, the rest is dropped instead of snowballing.
+        Returns (ticks, lag left for the next frame).
+        """
+        ticks = max(1, int(lag / tick_ms + 0.5))
+        max_ticks = 1 + config.MAX_FRAME_SKIP
+        if ticks > max_ticks:
+            self.lost_ticks += ticks - max_ticks
+            ticks = max_ticks
+            lag = ticks * tick_ms
+        self.skipped_draws += ticks - 1
+        # Never bank more than one tick of credit from running ahead
+        return ticks, max(-tick_ms, lag - ticks * tick_ms) 
\ No newline at end of file
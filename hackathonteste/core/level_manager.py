@@ -1,11 +1,49 @@
 """
 Gerenciador de níveis do jogo
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 import random
 import config
 from assets.asset_manager import asset_manager
-from core.platform import Platform
+from assets.preloader import AssetPreloader
+from core.platform import Platform, PlatformIndex
+
+class LevelSpec:
+    """
+    Descrição leve de um nível; o Level só é construído quando é preciso
+    """
+    def __init__(self, background_path, platform_layout, spawn_points):
+        """
+        Guarda a descrição do nível
+        
+        Args:
+            background_path: Caminho da imagem de fundo
+            platform_layout: Lista de tuplas (x, y, platform_type) para plataformas
+            spawn_points: Lista de tuplas (x, y) para pontos de spawn
+        """
+        self.background_path = background_path
+        self.platform_layout = platform_layout
+        self.spawn_points = spawn_points
+    
+    def asset_paths(self):
+        """
+        Retorna as imagens necessárias para construir o nível
+        
+        Returns:
+            Lista de caminhos
+        """
+        return [self.background_path, Platform.IMAGE_PATH]
+    
+    def build(self):
+        """
+        Constrói o nível
+        
+        Returns:
+            Objeto Level
+        """
+        return Level(self.background_path, self.platform_layout, self.spawn_points)
 
 class Level:
     """
@@ -28,10 +66,17 @@ class Level:
             # Cria um fundo de fallback com gradiente
             self.background = self.create_fallback_background()
         
+        # Fundo já escalado para a resolução de desenho: (tamanho, surface)
+        self.scaled_background = None
+        self.get_background((config.RENDER_WIDTH, config.RENDER_HEIGHT))
+        
         # Inicializa plataformas e pontos de spawn
         self.platforms = []
         self.spawn_points = spawn_points
         self.create_platforms(platform_layout)
+        
+        # O layout é estático, por isso o índice de colisão é construído uma vez
+        self.platform_index = PlatformIndex(self.platforms)
     
     def create_fallback_background(self):
         """
@@ -71,6 +116,23 @@ class Level:
             x, y, platform_type = plat
             self.platforms.append(Platform(x, y, platform_type))
     
+    def get_background(self, size):
+        """
+        Retorna o fundo escalado para um tamanho, reaproveitando o último escalado
+        
+        Args:
+            size: Tupla (width, height) da superfície de desenho
+            
+        Returns:
+            Surface do fundo
+        """
+        if self.scaled_background is None or self.scaled_background[0] != size:
+            if self.background.get_size() == size:
+                self.scaled_background = (size, self.background)
+            else:
+                self.scaled_background = (size, pygame.transform.scale(self.background, size))
+        return self.scaled_background[1]
+    
     def draw(self, screen):
         """
         Desenha o nível (fundo e plataformas)
@@ -79,7 +141,7 @@ class Level:
             screen: Superfície onde desenhar
         """
         # Desenha fundo
-        screen.blit(pygame.transform.scale(self.background, (screen.get_width(), screen.get_height())), (0, 0))
+        screen.blit(self.get_background(screen.get_size()), (0, 0))
         
         # Desenha plataformas
         for platform in self.platforms:
@@ -89,6 +151,25 @@ class LevelManager:
     """
     Gerenciador de níveis do jogo
     """
+    # Imagens de fundo de cada nível, por ordem
+    BACKGROUNDS = (
+        "background1.png",
+        "background2.png",
+        "background3.png",
+        "background4.jpg",
+        "background5.jpg"
+    )
+    
+    @classmethod
+    def background_paths(cls):
+        """
+        Retorna os caminhos das imagens de fundo de todos os níveis
+        
+        Returns:
+            Lista de caminhos
+        """
+        return [f"{config.BACKGROUNDS_PATH}{name}" for name in cls.BACKGROUNDS]
+    
     def __init__(self):
         """
         Inicializa o gerenciador de níveis
@@ -97,15 +178,24 @@ class LevelManager:
         self.total_levels = config.TOTAL_LEVELS
         self.player1_wins = 0
         self.player2_wins = 0
-        self.levels = []
+        self.level_specs = []
+        # Níveis já construídos, por índice; só o atual e o seguinte ficam em memória
+        self.levels = {}
+        self.prefetcher = None
+        self.prefetch_index = None
+        # Uma única thread de pré-carga para toda a sessão: criar uma thread
+        # nova a cada nível (ou desforra) custava vários ms no frame
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self.pinned_level = None
         self.initialize_levels()
     
     def initialize_levels(self):
         """
-        Inicializa todos os níveis do jogo
+        Descreve todos os níveis do jogo (nenhum é carregado aqui)
         """
         screen_width = config.SCREEN_WIDTH
         center_x = screen_width // 2
+        backgrounds = self.background_paths()
         
         # Nível 1 - Arena Básica
         level1_platforms = [
@@ -115,7 +205,7 @@ class LevelManager:
             (center_x - 400, 600, Platform.GROUND)  # Chão
         ]
         spawn_points1 = [(center_x - 250, 200), (center_x + 250, 200)]
-        self.levels.append(Level(f"{config.BACKGROUNDS_PATH}background1.png", level1_platforms, spawn_points1))
+        self.level_specs.append(LevelSpec(backgrounds[0], level1_platforms, spawn_points1))
         
         # Nível 2 - Ilhas Flutuantes
         level2_platforms = [
@@ -126,7 +216,7 @@ class LevelManager:
             (center_x - 400, 600, Platform.GROUND)  # Chão
         ]
         spawn_points2 = [(center_x - 250, 250), (center_x + 250, 250)]
-        self.levels.append(Level(f"{config.BACKGROUNDS_PATH}background2.png", level2_platforms, spawn_points2))
+        self.level_specs.append(LevelSpec(backgrounds[1], level2_platforms, spawn_points2))
         
         # Nível 3 - Desafio Vertical
         level3_platforms = [
@@ -138,7 +228,7 @@ class LevelManager:
             (center_x - 400, 600, Platform.GROUND)  # Chão
         ]
         spawn_points3 = [(center_x - 200, 350), (center_x + 200, 350)]
-        self.levels.append(Level(f"{config.BACKGROUNDS_PATH}background3.png", level3_platforms, spawn_points3))
+        self.level_specs.append(LevelSpec(backgrounds[2], level3_platforms, spawn_points3))
         
         # Nível 4 - Arena Assimétrica
         level4_platforms = [
@@ -149,7 +239,7 @@ class LevelManager:
             (center_x - 400, 600, Platform.GROUND)  # Chão
         ]
         spawn_points4 = [(center_x - 250, 300), (center_x + 250, 300)]
-        self.levels.append(Level(f"{config.BACKGROUNDS_PATH}background4.jpg", level4_platforms, spawn_points4))
+        self.level_specs.append(LevelSpec(backgrounds[3], level4_platforms, spawn_points4))
         
         # Nível 5 - Arena Final
         level5_platforms = [
@@ -162,7 +252,23 @@ class LevelManager:
             (center_x - 400, 600, Platform.GROUND)  # Chão
         ]
         spawn_points5 = [(center_x - 250, 350), (center_x + 250, 350)]
-        self.levels.append(Level(f"{config.BACKGROUNDS_PATH}background5.jpg", level5_platforms, spawn_points5))
+        self.level_specs.append(LevelSpec(backgrounds[4], level5_platforms, spawn_points5))
+    
+    def reset(self):
+        """
+        Volta ao primeiro nível e limpa o placar, mantendo os dois primeiros níveis carregados
+        """
+        self.current_level = 0
+        self.player1_wins = 0
+        self.player2_wins = 0
+        # O segundo nível, já construído ou a pré-carregar, fica para a desforra
+        if self.prefetch_index != 1:
+            self.prefetcher = None
+            self.prefetch_index = None
+        self.pinned_level = None
+        for index in [index for index in self.levels if index > 1]:
+            del self.levels[index]
+            asset_manager.unload_image(self.level_specs[index].background_path)
     
     def get_current_level(self):
         """
@@ -171,9 +277,86 @@ class LevelManager:
         Returns:
             Objeto Level do nível atual
         """
+        level = self.get_level(self.current_level)
+        if self.pinned_level != self.current_level:
+            # O nível atual mudou: fixa as imagens dele e liberta os anteriores
+            self.pinned_level = self.current_level
+            spec = self.level_specs[min(self.current_level, len(self.level_specs) - 1)]
+            asset_manager.pin("level", spec.asset_paths())
+            self.evict_passed_levels()
+        return level
+    
+    def get_level_name(self):
+        """
+        Nome do nível atual para as estatísticas de frames
+        
+        Returns:
+            Nome do ficheiro de fundo do nível (ex.: "background4.jpg")
+        """
+        spec = self.level_specs[min(self.current_level, len(self.level_specs) - 1)]
+        return os.path.basename(spec.background_path)
+    
+    def get_level(self, index):
+        """
+        Retorna um nível, construindo-o na primeira utilização
+        
+        Args:
+            index: Índice do nível
+            
+        Returns:
+            Objeto Level
+        """
         # Garante que o índice não ultrapasse o número de níveis disponíveis
-        safe_index = min(self.current_level, len(self.levels) - 1)
-        return self.levels[safe_index]
+        safe_index = min(index, len(self.level_specs) - 1)
+        level = self.levels.get(safe_index)
+        if level is None:
+            if self.prefetch_index == safe_index:
+                # A pré-carga ainda não acabou: termina-a já
+                self.prefetcher.finish()
+                self.prefetcher = None
+                self.prefetch_index = None
+            level = self.level_specs[safe_index].build()
+            self.levels[safe_index] = level
+        return level
+    
+    def prefetch_next_level(self):
+        """
+        Começa a carregar em segundo plano as imagens do próximo nível
+        """
+        index = self.current_level + 1
+        if index >= len(self.level_specs) or index in self.levels or self.prefetch_index == index:
+            return
+        self.prefetcher = AssetPreloader(asset_manager, executor=self.prefetch_executor)
+        for path in self.level_specs[index].asset_paths():
+            self.prefetcher.add_image(path)
+        self.prefetcher.start()
+        self.prefetch_index = index
+    
+    def update(self):
+        """
+        Avança a pré-carga do próximo nível (chamado uma vez por frame)
+        """
+        if self.prefetcher is None:
+            return
+        if self.prefetcher.poll():
+            # Imagens prontas: construir o nível é só escalar as plataformas
+            index = self.prefetch_index
+            self.prefetcher = None
+            self.prefetch_index = None
+            self.levels[index] = self.level_specs[index].build()
+    
+    def evict_passed_levels(self):
+        """
+        Liberta os níveis já jogados e as respetivas imagens de fundo
+        
+        O primeiro nível fica sempre carregado para uma desforra começar logo.
+        """
+        current = min(self.current_level, len(self.level_specs) - 1)
+        for index in [index for index in self.levels if 0 < index < current]:
+            del self.levels[index]
+            path = self.level_specs[index].background_path
+            if all(spec.background_path != path for spec in self.level_specs[current:]):
+                asset_manager.unload_image(path)
     
     def get_spawn_points(self):
         """
@@ -193,6 +376,15 @@ class LevelManager:
         """
         return self.get_current_level().platforms
     
+    def get_platform_index(self):
+        """
+        Retorna o índice de colisão das plataformas do nível atual
+        
+        Returns:
+            PlatformIndex do nível atual
+        """
+        return self.get_current_level().platform_index
+    
     def next_level(self, winner):
         """
         Avança para o próximo nível e atualiza pontuações
@@ -1,8 +1,10 @@
 """
 Classe para plataformas do jogo
 """
+from bisect import bisect_left, bisect_right
 import pygame
 from assets.asset_manager import asset_manager
+from core.render_target import render_scale, scale_size
 
 class Platform:
     """
@@ -14,6 +16,9 @@ class Platform:
     LARGE = "large"
     GROUND = "ground"
     
+    # Imagem partilhada por todas as plataformas
+    IMAGE_PATH = "./imagens_background/plataformateste.png"
+    
     # Dimensões para cada tipo
     SIZES = {
         SMALL: (150, 40),
@@ -37,10 +42,12 @@ class Platform:
         
         # Carrega a imagem da plataforma
         try:
-            self.image = asset_manager.load_image("./imagens_background/plataformateste.png", True, (width, height))
+            self.image = asset_manager.load_image(self.IMAGE_PATH, True, (width, height))
         except Exception as e:
             print(f"Could not load platform image: {e}")
             self.image = self.create_fallback_platform(width, height)
+        # Imagem para outra resolução de desenho: (escala, surface)
+        self.scaled_image = None
         
         # Propriedades para colisão
         self.top = self.rect.top
@@ -82,4 +89,98 @@ class Platform:
         Args:
             screen: Superfície onde desenhar
         """
-        screen.blit(self.image, self.rect) 
\ No newline at end of file
+        scale = render_scale(screen)
+        if scale == 1:
+            screen.blit(self.image, self.rect)
+            return
+        if self.scaled_image is None or self.scaled_image[0] != scale:
+            self.scaled_image = (scale, pygame.transform.scale(self.image, scale_size(self.rect.size, scale)))
+        screen.blit(self.scaled_image[1], (round(self.rect.x * scale), round(self.rect.y * scale)))
+
+class PlatformIndex:
+    """
+    Índice estático das arestas superiores das plataformas de um nível.
+    
+    As plataformas são ordenadas pelo topo, de modo que as consultas de snap
+    ao chão e de aterragem usam bisect em vez de percorrer todas as plataformas.
+    O índice é iterável e pode ser usado onde antes se passava a lista.
+    """
+    def __init__(self, platforms):
+        """
+        Constrói o índice a partir das plataformas do nível
+        
+        Args:
+            platforms: Lista de plataformas (objetos com top, bottom, left e right)
+        """
+        self.platforms = sorted(platforms, key=lambda platform: (platform.top, platform.left))
+        self.tops = [platform.top for platform in self.platforms]
+        self.max_height = max((platform.bottom - platform.top for platform in self.platforms), default=0)
+    
+    def __iter__(self):
+        return iter(self.platforms)
+    
+    def __len__(self):
+        return len(self.platforms)
+    
+    def find_ground(self, rect, tolerance):
+        """
+        Procura a plataforma sobre a qual o retângulo está apoiado
+        
+        Args:
+            rect: Retângulo do personagem
+            tolerance: Distância máxima entre rect.bottom e o topo da plataforma
+            
+        Returns:
+            Plataforma encontrada ou None
+        """
+        bottom = rect.bottom
+        centerx = rect.centerx
+        platforms = self.platforms
+        start = bisect_left(self.tops, bottom - tolerance)
+        end = bisect_right(self.tops, bottom + tolerance)
+        for i in range(start, end):
+            platform = platforms[i]
+            if platform.left <= centerx <= platform.right:
+                return platform
+        return None
+    
+    def find_landing(self, rect, prev_bottom, margin=2):
+        """
+        Procura a primeira plataforma atravessada de cima ao cair
+        
+        A consulta cobre todo o intervalo vertical percorrido no passo, por isso
+        uma queda mais longa que a espessura da plataforma não a atravessa.
+        
+        Args:
+            rect: Retângulo do personagem já na nova posição
+            prev_bottom: Valor de rect.bottom antes do movimento vertical
+            margin: Tolerância acima do topo da plataforma
+            
+        Returns:
+            Plataforma mais alta atravessada ou None
+        """
+        platforms = self.platforms
+        start = bisect_left(self.tops, prev_bottom - margin)
+        end = bisect_left(self.tops, rect.bottom)
+        for i in range(start, end):
+            platform = platforms[i]
+            if platform.left < rect.right and platform.right > rect.left:
+                return platform
+        return None
+    
+    def query(self, rect):
+        """
+        Retorna as plataformas que intersectam o retângulo
+        
+        Args:
+            rect: Retângulo a testar
+            
+        Returns:
+            Lista de plataformas em colisão
+        """
+        platforms = self.platforms
+        start = bisect_right(self.tops, rect.top - self.max_height)
+        end = bisect_left(self.tops, rect.bottom)
+        return [platforms[i] for i in range(start, end)
+                if platforms[i].left < rect.right and platforms[i].right > rect.left and
+                rect.top < platforms[i].bottom]
@@ -0,0 +1,116 @@
+"""
+Governador de qualidade ligado ao orçamento de tempo por frame
+
+Mede o tempo de trabalho de cada frame (eventos, atualização e desenho,
+sem a espera do clock) numa média móvel. Se a média passa do orçamento,
+desce um nível de qualidade; quando volta a haver folga, sobe outra vez.
+A histerese vem de dois limiares diferentes e de um número mínimo de frames
+em cada nível, mais longo para subir do que para descer.
+"""
+from collections import deque
+import config
+
+class QualityGovernor:
+    """
+    Escolhe o nível de qualidade e aplica-o ao jogo
+    """
+    # Do melhor para o mais leve. particles: fração da capacidade de partículas;
+    # effects: animações de efeitos em draw_effects; guide_alpha: guia de controles
+    # translúcido; smooth: permite smoothscale; render_scale: fração da resolução interna
+    TIERS = (
+        {"name": "alta", "particles": 1.0, "effects": True, "guide_alpha": True, "smooth": True, "render_scale": 1.0},
+        {"name": "média", "particles": 0.5, "effects": True, "guide_alpha": True, "smooth": False, "render_scale": 1.0},
+        {"name": "baixa", "particles": 0.25, "effects": False, "guide_alpha": False, "smooth": False, "render_scale": 0.75},
+        {"name": "mínima", "particles": 0.0, "effects": False, "guide_alpha": False, "smooth": False, "render_scale": 0.5},
+    )
+
+    def __init__(self, game, enabled=None):
+        """
+        Args:
+            game: Jogo a controlar
+            enabled: Liga a mudança automática (por omissão config.QUALITY_GOVERNOR)
+        """
+        self.game = game
+        self.enabled = config.QUALITY_GOVERNOR if enabled is None else enabled
+        self.tier = 0
+        self.budget = config.QUALITY_FRAME_BUDGET_MS
+        self.samples = deque(maxlen=config.QUALITY_WINDOW)
+        self.total = 0.0
+        self.frames_in_tier = 0
+        self.transitions = 0
+
+    @property
+    def settings(self):
+        """Definições do nível atual"""
+        return self.TIERS[self.tier]
+
+    def average(self):
+        """Média móvel do tempo de frame em ms (0 sem amostras)"""
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    def record(self, frame_ms):
+        """
+        Regista o tempo de trabalho de um frame e muda de nível se for preciso
+
+        Args:
+            frame_ms: Tempo do frame em ms, sem a espera do clock
+        """
+        if not self.enabled:
+            return
+        if len(self.samples) == self.samples.maxlen:
+            self.total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.total += frame_ms
+        self.frames_in_tier += 1
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        average = self.average()
+        if (average > self.budget * config.QUALITY_DOWNGRADE_RATIO
+                and self.frames_in_tier >= config.QUALITY_DOWNGRADE_HOLD
+                and self.tier < len(self.TIERS) - 1):
+            self.set_tier(self.tier + 1, average)
+        elif (average < self.budget * config.QUALITY_UPGRADE_RATIO
+                and self.frames_in_tier >= config.QUALITY_UPGRADE_HOLD
+                and self.tier > 0):
+            self.set_tier(self.tier - 1, average)
+
+    def set_tier(self, tier, average=None):
+        """
+        Muda de nível, regista a transição e aplica as definições
+
+        Args:
+            tier: Índice em TIERS
+            average: Média que causou a mudança, para o registo
+        """
+        if tier == self.tier:
+            return
+        reason = f" (frame médio {average:.1f} ms, orçamento {self.budget:.1f} ms)" if average is not None else ""
+        print(f"Qualidade: {self.settings['name']} -> {self.TIERS[tier]['name']}{reason}")
+        self.tier = tier
+        self.transitions += 1
+        # As amostras do nível anterior já não contam
+        self.samples.clear()
+        self.total = 0.0
+        self.frames_in_tier = 0
+        self.apply()
+
+    def apply(self):
+        """
+        Aplica as definições do nível atual ao jogo e às personagens
+        """
+        game = self.game
+        settings = self.settings
+
+        render_target = game.render_target
+        render_target.smooth = config.RENDER_SMOOTHSCALE and settings["smooth"]
+        render_target.set_size((max(1, round(config.RENDER_WIDTH * settings["render_scale"])),
+                                max(1, round(config.RENDER_HEIGHT * settings["render_scale"]))))
+
+        game.hud.guide_translucent = settings["guide_alpha"]
+        for player in game.players:
+            view = player.view
+            view.effects_enabled = settings["effects"]
+            view.particles.set_limit(int(view.particles.capacity * settings["particles"]))
+            # Frames escalados para a nova resolução já, e não a meio da luta
+            player.prepare_frames(render_target.scale)
@@ -0,0 +1,106 @@
+"""
+Resolução interna de desenho do mundo
+
+O jogo simula sempre em coordenadas lógicas (config.SCREEN_WIDTH ×
+config.SCREEN_HEIGHT). O mundo (fundo, plataformas e personagens) é
+desenhado numa superfície interna, que pode ser mais pequena que o ecrã,
+e apresentado com um único scale; o HUD é desenhado depois diretamente no
+ecrã, à resolução nativa, para o texto continuar legível. No backend por
+texturas a superfície interna é uma textura alvo do Renderer, ampliada
+pelo próprio Renderer ao apresentar.
+"""
+import os
+import pygame
+import config
+from core.display import TextureCanvas
+from utils.draw_counters import draw_counters
+
+def render_scale(surface):
+    """
+    Escala entre uma superfície de desenho e as coordenadas lógicas
+
+    Args:
+        surface: Superfície de destino
+
+    Returns:
+        Largura da superfície a dividir por config.SCREEN_WIDTH
+    """
+    return surface.get_width() / config.SCREEN_WIDTH
+
+def scale_size(size, scale):
+    """
+    Converte um tamanho lógico para píxeis da superfície de desenho
+
+    Args:
+        size: Tupla (width, height) lógica
+        scale: Escala devolvida por render_scale
+
+    Returns:
+        Tupla (width, height) inteira, nunca menor que 1
+    """
+    if scale == 1:
+        return size
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+class RenderTarget:
+    """
+    Superfície onde o mundo é desenhado e a sua apresentação no ecrã
+
+    O jogo desenha o mundo em `canvas`, que é a própria `surface` ou, com
+    --count-draws, um CountingCanvas à volta dela.
+    """
+    def __init__(self, display, size=None, smooth=None):
+        """
+        Args:
+            display: Superfície do ecrã ou TextureCanvas
+            size: Resolução interna (por omissão config.RENDER_WIDTH × config.RENDER_HEIGHT)
+            smooth: Usa smoothscale na apresentação (por omissão config.RENDER_SMOOTHSCALE)
+        """
+        self.display = display
+        self.smooth = config.RENDER_SMOOTHSCALE if smooth is None else smooth
+        self.size = None
+        self.set_size(size or (config.RENDER_WIDTH, config.RENDER_HEIGHT))
+
+    def set_size(self, size):
+        """
+        Muda a resolução interna (usado também pelo governador de qualidade)
+
+        Args:
+            size: Tupla (width, height)
+        """
+        if size == self.size:
+            return
+        self.size = size
+        display = self.display
+        if size == display.get_size():
+            # Mesma resolução: desenha diretamente no ecrã
+            self.surface = display
+        elif isinstance(display, TextureCanvas):
+            # O filtro de ampliação da textura é escolhido quando ela é criada
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = "linear" if self.smooth else "nearest"
+            self.surface = display.create_target(size)
+        else:
+            self.surface = pygame.Surface(size).convert(display)
+        self.canvas = draw_counters.wrap(self.surface)
+        self.scale = render_scale(self.surface)
+
+    def begin(self):
+        """
+        Prepara o desenho do mundo num novo frame (no backend por texturas, muda o alvo do Renderer)
+        """
+        if self.surface is not self.display and isinstance(self.surface, TextureCanvas):
+            self.surface.bind()
+
+    def present(self):
+        """
+        Copia o mundo desenhado para o ecrã, escalado ao tamanho do ecrã
+        """
+        if self.surface is self.display:
+            return
+        if isinstance(self.surface, TextureCanvas):
+            self.surface.draw_target()
+            return
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, self.display.get_size(), self.display)
+        else:
+            pygame.transform.scale(self.surface, self.display.get_size(), self.display)
@@ -4,20 +4,35 @@ Sistema de animação para personagens e efeitos
 import os
 import pygame
 from assets.asset_manager import asset_manager
+from utils.startup_profiler import startup_profiler
 
 class Animation:
     """
     Classe para gerenciar animações de sprites
+    
+    Os frames escalados, espelhados e recortados ficam na cache do
+    asset_manager (contam para o orçamento de memória); a animação só guarda
+    os caminhos dos frames.
     """
-    def __init__(self, folder_path, speed=0.1):
+    
+    def __init__(self, folder_path, speed=0.1, frames=None):
         """
         Inicializa uma animação a partir de um diretório de frames
         
         Args:
-            folder_path: Caminho do diretório com os frames
+            folder_path: Caminho do diretório com os frames (ou nome único,
+                se os frames forem dados)
             speed: Velocidade da animação (frames por segundo)
-        """
-        self.frames = asset_manager.load_animation_frames(folder_path)
+            frames: Lista de frames já desenhados (ex.: efeitos gerados no código)
+        """
+        self.folder_path = folder_path
+        # Só os frames gerados ficam na animação; os de uma pasta vêm da cache
+        self.frames = frames
+        if frames is not None:
+            self.paths = [f"{folder_path}:{index}" for index in range(len(frames))]
+        else:
+            with startup_profiler.span(f"animation {folder_path}", "scan"):
+                self.paths = asset_manager.animation_paths(folder_path)
         self.current_frame = 0
         self.animation_speed = speed
         self.animation_timer = 0
@@ -31,12 +46,9 @@ class Animation:
         
         Args:
             dt: Delta time (tempo desde o último frame)
-            
-        Returns:
-            Frame atual da animação ou None se não houver frames
         """
-        if not self.frames or not self.is_playing:
-            return self.get_current_frame()
+        if not self.paths or not self.is_playing:
+            return
         
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
@@ -44,15 +56,13 @@ class Animation:
             self.current_frame += 1
             
             # Verifica se chegou ao fim da animação
-            if self.current_frame >= len(self.frames):
+            if self.current_frame >= len(self.paths):
                 if self.loop:
                     self.current_frame = 0
                 else:
-                    self.current_frame = len(self.frames) - 1
+                    self.current_frame = len(self.paths) - 1
                     self.is_playing = False
                     self.finished = True
-        
-        return self.get_current_frame()
     
     def get_current_frame(self):
         """
@@ -61,10 +71,58 @@ class Animation:
         Returns:
             Frame atual ou None se não houver frames
         """
-        if not self.frames:
+        if not self.paths:
             return None
+        if self.frames is not None:
+            return self.frames[self.current_frame]
+        return asset_manager.load_image(self.paths[self.current_frame])
+    
+    def get_trimmed_frame(self, size, flip=False):
+        """
+        Retorna o frame atual escalado para um tamanho, sem as margens transparentes
         
-        return self.frames[self.current_frame]
+        Args:
+            size: Tupla (width, height) do frame desenhado
+            flip: Se o frame deve ser espelhado na horizontal
+            
+        Returns:
+            Tupla (surface, (offset_x, offset_y)); surface é None se o frame
+            estiver vazio ou não houver frames
+        """
+        if not self.paths:
+            return None, (0, 0)
+        return self.load_trimmed(self.current_frame, size, flip)
+    
+    def prepare(self, size):
+        """
+        Escala e recorta já todos os frames num tamanho, nas duas orientações
+        
+        Usado ao criar as personagens e ao mudar a resolução de desenho, para
+        isso não causar trabalho durante o jogo. Os frames recortados noutros
+        tamanhos saem da cache.
+        
+        Args:
+            size: Tupla (width, height) do frame desenhado
+        """
+        for index, path in enumerate(self.paths):
+            asset_manager.unload_trimmed(path, keep_size=size)
+            for flip in (False, True):
+                self.load_trimmed(index, size, flip)
+    
+    def load_trimmed(self, index, size, flip):
+        """
+        Carrega um frame recortado da cache do asset_manager
+        
+        Args:
+            index: Índice do frame
+            size: Tupla (width, height) do frame desenhado
+            flip: Se o frame deve ser espelhado na horizontal
+            
+        Returns:
+            Tupla (surface ou None, (offset_x, offset_y))
+        """
+        image = self.frames[index] if self.frames is not None else None
+        return asset_manager.load_trimmed_image(self.paths[index], size, flip, image)
     
     def reset(self):
         """
@@ -1,51 +1,119 @@
 import pygame
-import random
 import math
 import os
+from core.collision import swept_collides
+from core.render_target import render_scale, scale_size
+from core.display import draw_rect, draw_circle
+from assets.asset_manager import asset_manager
+from entities.animation import Animation
+from entities.particles import ParticlePool
+from entities.effects import EFFECT_FRAMES, create_effect_animation
+from utils.draw_counters import draw_counters
+import config
 
-class Animation:
-    def __init__(self, folder_path):
-        self.frames = []
-        self.current_frame = 0
-        self.animation_speed = 0.1  # Faster animation speed
+
+# Number of pre-scaled sizes for the pulsing combo text
+COMBO_SCALE_STEPS = 8
+
+
+class CharacterView:
+    """Rendering-only state of a character: animations and visual effects"""
+    __slots__ = ("animations", "color", "sprite", "font", "effect_colors",
+                 "effect_surfaces", "active_effects", "effect_duration", "animation_timer",
+                 "particles", "effect_animations", "effects_enabled")
+    
+    def __init__(self, color, width, height):
+        self.animations = {}
+        self.color = color
+        self.sprite = pygame.Surface((width, height))
+        self.sprite.fill(color)
         self.animation_timer = 0
         
-        # Load all frames from the folder
-        if os.path.exists(folder_path):
-            for file in sorted(os.listdir(folder_path)):
-                if file.endswith('.png'):
-                    image_path = os.path.join(folder_path, file)
-                    image = pygame.image.load(image_path).convert_alpha()
-                    self.frames.append(image)
-    
-    def update(self, dt):
-        if not self.frames:
-            return None
-            
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
+        # Visual effects; effect_surfaces caches pre-rendered effect images
+        self.effect_surfaces = {}
+        self.particles = ParticlePool(config.PARTICLE_CAPACITY)
+        # Baked looping effects: name -> (Animation, origin, frame size)
+        self.effect_animations = {}
+        # Turned off by the quality governor on slow machines
+        self.effects_enabled = True
+        self.active_effects = []
+        self.effect_duration = 0
+        self.font = pygame.font.Font(None, 24)
         
-        return self.frames[self.current_frame]
+        # Effect colors
+        self.effect_colors = {
+            "perfect_block": (255, 215, 0, 128),  # Golden
+            "charging": (255, 200, 0, 100),  # Orange
+            "teleport": (100, 100, 255, 128),  # Blue
+            "levitate": (100, 100, 255, 128),  # Blue
+            "combo": (255, 255, 255, 255),  # White
+            "dash": (100, 255, 100, 50)  # Green
+        }
     
     def reset(self):
-        self.current_frame = 0
+        """Clear effects and rewind animations, keeping the loaded frames"""
+        self.active_effects.clear()
+        self.effect_duration = 0
+        self.particles.clear()
         self.animation_timer = 0
+        for animation in self.animations.values():
+            animation.reset()
+        for animation, _, _ in self.effect_animations.values():
+            animation.reset()
+
 
 class Character:
+    # Per-frame simulation state lives in slots; rendering state lives in self.view
+    __slots__ = (
+        "x", "y", "name", "is_player2", "width", "height", "rect", "speed",
+        "health", "max_health", "max_mana", "base_knockback", "knockback_growth",
+        "attack_power", "defense", "attack_range", "lives",
+        # Physics
+        "velocity_x", "velocity_y", "gravity", "jump_force", "on_ground", "jumps_left",
+        "max_fall_speed", "ground_friction", "air_resistance", "ground_snap_distance",
+        "last_ground_y", "move_dx", "move_dy",
+        # Buffs
+        "active_buffs", "buff_durations", "attack_multiplier", "has_power_buff", "power_buff_timer",
+        # Combat
+        "special_cooldown", "special_cooldown_max", "attacking", "defending", "using_special",
+        "special_frame", "attack_frame", "attack_cooldown", "attack_cooldown_max", "direction",
+        "attack_hitbox",
+        # Dodge
+        "dodging", "dodge_cooldown", "dodge_cooldown_max", "dodge_duration", "dodge_speed",
+        "dodge_direction",
+        # Animation state driven by the simulation
+        "state", "facing_right",
+        "view",
+    )
+    
+    # Animation folders, defined by each character class
+    ANIMATION_PATH = None
+    ANIMATIONS = {}
+    
     def __init__(self, x, y, name, is_player2=False):
-        self.x = x
-        self.y = y
         self.name = name
         self.is_player2 = is_player2
+        self.reset_state(x, y)
+        
+        # Visual representation, kept across resets
+        self.view = CharacterView(self.get_color(), self.width, self.height)
+        self.load_animations()
+    
+    def reset(self, x, y):
+        """Restore the initial state in place for a new round; animations and fonts are kept"""
+        self.reset_state(x, y)
+        self.view.reset()
+    
+    def reset_state(self, x, y):
+        """Set every simulation attribute to its initial value"""
+        is_player2 = self.is_player2
+        self.x = x
+        self.y = y
         self.width = 75
         self.height = 80
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.speed = 5
         self.health = 0  # Damage percentage starts at 0
-        self.max_health = 100  # Adjust based on your game
-        self.max_health = 300  # Maximum percentage reduced
         self.base_knockback = 2  # Reduced base knockback
         self.knockback_growth = 0.2  # Reduced knockback growth
         self.attack_power = 10
@@ -65,6 +133,8 @@ class Character:
         self.air_resistance = 0.95
         self.ground_snap_distance = 5  # Nova variável para snap ao chão
         self.last_ground_y = y  # Nova variável para rastrear última posição no chão
+        self.move_dx = 0  # Deslocamento do último passo (colisão contínua)
+        self.move_dy = 0
         # Buff system
         self.active_buffs = []
         self.buff_durations = {}
@@ -77,11 +147,11 @@ class Character:
         self.attacking = False
         self.defending = False
         self.using_special = False
+        self.special_frame = 0
         self.attack_frame = 0
         self.attack_cooldown = 0
         self.attack_cooldown_max = 20  # Faster attacks
         self.direction = -1 if is_player2 else 1
-        self.color = self.get_color()
         self.attack_hitbox = pygame.Rect(0, 0, 0, 0)
         
         # Dodge mechanics
@@ -92,35 +162,10 @@ class Character:
         self.dodge_speed = 15
         self.dodge_direction = 0
         
-        # Visual representation
-        self.sprite = pygame.Surface((self.width, self.height))
-        self.sprite.fill(self.color)
-        
-        # Animation states
+        # Animation state
         self.state = "idle"
-        self.animations = {}
-        self.load_animations()
         self.facing_right = not is_player2
-        self.animation_timer = 0
-        
-        # Visual effects
-        self.effect_surfaces = {}
-        self.active_effects = []
-        self.effect_duration = 0
-        self.font = pygame.font.Font(None, 24)  # Add font initialization
         
-        # Effect colors
-        self.effect_colors = {
-            "perfect_block": (255, 215, 0, 128),  # Golden
-            "charging": (255, 200, 0, 100),  # Orange
-            "teleport": (100, 100, 255, 128),  # Blue
-            "levitate": (100, 100, 255, 128),  # Blue
-            "combo": (255, 255, 255, 255),  # White
-            "dash": (100, 255, 100, 50)  # Green
-        }
-        self.attack_multiplier = 1.0
-        self.has_power_buff = False
-        self.power_buff_timer = 0
         self.max_health = 100  # Adjust based on your game
         self.max_mana = 100    # Adjust based on your game
     
@@ -199,6 +244,8 @@ class Character:
         else:
             self.velocity_x *= self.air_resistance  # Menos atrito no ar
         
+        start_x, start_y = self.rect.x, self.rect.y
+        
         # Movimento horizontal primeiro
         self.x += self.velocity_x
         self.rect.x = self.x
@@ -209,45 +256,42 @@ class Character:
         
         # Se estava no chão no frame anterior, primeiro tenta manter no chão
         if was_on_ground:
-            for platform in platforms:
-                if (self.rect.bottom <= platform.top + self.ground_snap_distance and 
-                    self.rect.bottom >= platform.top - self.ground_snap_distance and
-                    self.rect.centerx >= platform.left and 
-                    self.rect.centerx <= platform.right):
-                    self.rect.bottom = platform.top
-                    self.y = self.rect.y
-                    self.velocity_y = 0
-                    self.on_ground = True
-                    self.last_ground_y = self.y
-                    break
+            platform = platforms.find_ground(self.rect, self.ground_snap_distance)
+            if platform is not None:
+                self.rect.bottom = platform.top
+                self.y = self.rect.y
+                self.velocity_y = 0
+                self.on_ground = True
+                self.last_ground_y = self.y
         
         # Se não está no chão, aplica gravidade e movimento vertical
         if not self.on_ground:
             # Aplica gravidade
             self.velocity_y += self.gravity
-            self.velocity_y = min(self.velocity_y, self.max_fall_speed)
+            if self.velocity_y > self.max_fall_speed:
+                self.velocity_y = self.max_fall_speed
             
             # Move verticalmente
             self.y += self.velocity_y
             self.rect.y = self.y
             
             # Checa colisão com plataformas
-            for platform in platforms:
-                if self.rect.colliderect(platform):
-                    if self.velocity_y > 0:  # Caindo
-                        prev_bottom = self.rect.bottom - self.velocity_y
-                        if prev_bottom <= platform.top + 2:  # Margem reduzida
-                            self.rect.bottom = platform.top
-                            self.y = self.rect.y
-                            self.velocity_y = 0
-                            self.on_ground = True
-                            self.last_ground_y = self.y
-                            self.jumps_left = 2
-                            break
+            if self.velocity_y > 0:  # Caindo
+                prev_bottom = self.rect.bottom - self.velocity_y
+                platform = platforms.find_landing(self.rect, prev_bottom, 2)  # Margem reduzida
+                if platform is not None:
+                    self.rect.bottom = platform.top
+                    self.y = self.rect.y
+                    self.velocity_y = 0
+                    self.on_ground = True
+                    self.last_ground_y = self.y
+                    self.jumps_left = 2
         
         # Atualiza posição final
         self.x = self.rect.x
         self.y = self.rect.y
+        self.move_dx = self.rect.x - start_x
+        self.move_dy = self.rect.y - start_y
         
         # Limpa velocidades muito pequenas para evitar deslizamento
         if abs(self.velocity_x) < 0.1:
@@ -312,35 +356,66 @@ class Character:
         self.defending = controls["defend"]
     
     def draw(self, screen):
-        """Draw the character with animations"""
+        """Draw the character with animations, scaled to the screen's render resolution"""
+        scale = render_scale(screen)
+        
         # Update animation state
         self.update_animation_state()
         
         # Get current animation frame
-        current_animation = self.animations.get(self.state)
+        current_animation = self.view.animations.get(self.state)
         if current_animation:
-            frame = current_animation.update(1/60)  # Assuming 60 FPS
+            current_animation.update(1/60)  # Assuming 60 FPS
+            # Trimmed frame, flipped when facing left, cached per size
+            frame, (offset_x, offset_y) = current_animation.get_trimmed_frame(
+                scale_size((self.width, self.height), scale), self.direction == -1)
             if frame:
-                # Flip the frame based on direction
-                if self.direction == -1:  # Moving/facing left
-                    frame = pygame.transform.flip(frame, True, False)
-                
-                # Scale the frame if needed
-                scaled_frame = pygame.transform.scale(frame, (self.width, self.height))
-                screen.blit(scaled_frame, (self.x, self.y))
+                screen.blit(frame, (int(self.x * scale) + offset_x, int(self.y * scale) + offset_y))
         
         # Draw attack hitbox if attacking
         if self.attacking:
-            pygame.draw.rect(screen, (255, 255, 0), self.attack_hitbox, 2)
+            hitbox = self.attack_hitbox
+            if scale != 1:
+                hitbox = pygame.Rect(hitbox.x * scale, hitbox.y * scale, *scale_size(hitbox.size, scale))
+            draw_rect(screen, (255, 255, 0), hitbox, max(1, round(2 * scale)))
         
         # Draw name only, removed percentage display
-        name_font = pygame.font.Font(None, 24)
-        name_surface = name_font.render(self.name, True, (255, 255, 255))
-        screen.blit(name_surface, (self.x, self.y - 30))
+        screen.blit(self.get_name_text(scale), (self.x * scale, (self.y - 30) * scale))
+        self.draw_buffs(screen, self.x, self.y)
        
         # Draw effects
-        self.draw_effects(screen)
-        self.update_effects()
+        with draw_counters.site("draw_effects"):
+            self.draw_effects(screen)
+    
+    def get_font(self, scale):
+        """Character font at the render resolution"""
+        if scale == 1:
+            return self.view.font
+        return asset_manager.load_font(None, max(1, round(24 * scale)))
+    
+    def get_name_text(self, scale):
+        """Name label at the render resolution, rendered once"""
+        surfaces = self.view.effect_surfaces
+        key = ("name", self.name, scale)
+        surface = surfaces.get(key)
+        if surface is None:
+            surface = self.get_font(scale).render(self.name, True, (255, 255, 255))
+            surfaces[key] = surface
+        return surface
+    
+    def prepare_frames(self, scale):
+        """Pre-scale and trim every animation frame for the render resolution"""
+        size = scale_size((self.width, self.height), scale)
+        for animation in self.view.animations.values():
+            animation.prepare(size)
+        # Effects too, so their first use does not bake frames mid-fight
+        for name in EFFECT_FRAMES:
+            animation, _, frame_size = self.get_effect_animation(name)
+            animation.prepare(scale_size(frame_size, scale))
+    
+    def swept_hit(self, target):
+        """Check contact with target along the last movement step, so fast moves can't tunnel"""
+        return swept_collides(self.rect, self.move_dx, self.move_dy, target)
     
     def take_damage(self, damage):
         """Take damage, increasing percentage"""
@@ -360,9 +435,21 @@ class Character:
         """Special ability, overridden by subclasses"""
         return self.attack_power * 2  # Default special damage
     
+    @classmethod
+    def animation_folders(cls):
+        """Folders of every animation this class loads"""
+        if cls.ANIMATION_PATH is None:
+            return []
+        return [os.path.join(cls.ANIMATION_PATH, folder) for folder in cls.ANIMATIONS.values()]
+    
     def load_animations(self):
-        """Load character animations - to be overridden by subclasses"""
-        pass
+        """Load the animations listed in ANIMATIONS (state -> folder)"""
+        if self.ANIMATION_PATH is None:
+            return
+        self.view.animations = {
+            state: Animation(os.path.join(self.ANIMATION_PATH, folder))
+            for state, folder in self.ANIMATIONS.items()
+        }
     
     def update_animation_state(self):
         """Update the current animation state based on character's actions"""
@@ -379,92 +466,113 @@ class Character:
         
         if self.state != new_state:
             self.state = new_state
-            if self.state in self.animations:
-                self.animations[self.state].reset()
+            if self.state in self.view.animations:
+                self.view.animations[self.state].reset()
 
     def add_visual_effect(self, effect_name, duration=10):
         """Add a visual effect to be displayed"""
-        self.active_effects.append(effect_name)
-        self.effect_duration = duration
+        self.view.active_effects.append(effect_name)
+        self.view.effect_duration = duration
     
     def update_effects(self):
-        """Update visual effects"""
-        if self.effect_duration > 0:
-            self.effect_duration -= 1
+        """Update visual effects, once per simulation tick"""
+        view = self.view
+        if view.effect_duration > 0:
+            view.effect_duration -= 1
         else:
-            self.active_effects = []
+            view.active_effects.clear()
     
     def draw_effects(self, screen):
         """Draw active visual effects"""
-        if "perfect_block" in self.active_effects:
-            # Draw golden shield effect with pulsing
-            radius = self.width * 0.7
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
-            shield_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            color = self.effect_colors["perfect_block"]
-            pygame.draw.circle(shield_surface, color, (radius, radius), radius * pulse, 3)
-            screen.blit(shield_surface, (self.x + self.width//2 - radius, self.y + self.height//2 - radius))
-        
-        if "charging" in self.active_effects:
-            # Draw charging effect with particles
+        scale = render_scale(screen)
+        active_effects = self.view.active_effects
+        effect_colors = self.view.effect_colors
+        if "perfect_block" in active_effects:
+            # Golden shield effect with pulsing
+            self.draw_effect_animation(screen, "perfect_block")
+        
+        particles = self.view.particles
+        if "charging" in active_effects:
+            # Draw charging bar, cut from a pre-filled surface, with rising sparks
             charge_height = int(self.height * (getattr(self, 'charge_time', 0) / getattr(self, 'max_charge_time', 60)))
-            charge_surface = pygame.Surface((self.width, charge_height), pygame.SRCALPHA)
-            color = self.effect_colors["charging"]
-            charge_surface.fill(color)
+            charge_surface = self.get_effect_surface("charging", scale)
+            screen.blit(charge_surface, (self.x * scale, (self.y + self.height - charge_height) * scale),
+                        (0, 0, charge_surface.get_width(), round(charge_height * scale)))
             
             # Add particle effects
-            for _ in range(3):
-                particle_x = random.randint(0, self.width)
-                particle_y = random.randint(0, charge_height)
-                particle_size = random.randint(2, 4)
-                pygame.draw.circle(charge_surface, (255, 255, 200, 150), (particle_x, particle_y), particle_size)
-            
-            screen.blit(charge_surface, (self.x, self.y + self.height - charge_height))
-        
-        if "teleport" in self.active_effects:
-            # Draw teleport trail with fade effect
-            color = self.effect_colors["teleport"]
-            for i in range(5):
-                alpha = int(color[3] * (1 - i/5))
-                trail_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                x = self.x - (self.direction * i * 20)
-                pygame.draw.rect(trail_surface, (*color[:3], alpha), (0, 0, self.width, self.height))
-                screen.blit(trail_surface, (x, self.y))
-        
-        if "levitate" in self.active_effects:
-            # Draw levitation waves with dynamic effect
-            wave_points = []
-            time = pygame.time.get_ticks() * 0.01
-            color = self.effect_colors["levitate"]
-            
-            for i in range(5):
-                x = self.x + (i * self.width//4)
-                y = self.y + self.height + math.sin(time + i) * 5
-                wave_points.append((x, y))
-            
-            if len(wave_points) > 1:
-                wave_surface = pygame.Surface((self.width, 20), pygame.SRCALPHA)
-                pygame.draw.lines(wave_surface, color, False, [(x - self.x, y - self.y) for x, y in wave_points], 2)
-                screen.blit(wave_surface, (self.x, self.y + self.height))
+            bottom = self.y + self.height
+            for radius in (2, 3, 4):
+                particles.emit(self.x - radius, bottom - charge_height - radius,
+                               ParticlePool.circle_sprite((255, 255, 200, 150), radius), 10,
+                               spread=(self.width, charge_height), velocity=(0, -1), velocity_spread=(0.3, 0.5))
+        
+        if "teleport" in active_effects:
+            # Teleport trail with fade effect, behind the facing direction
+            self.draw_effect_animation(screen, "teleport", self.direction == -1)
+        
+        if "levitate" in active_effects:
+            # Levitation waves under the feet
+            self.draw_effect_animation(screen, "levitate")
         
-        if "combo" in self.active_effects:
+        if "combo" in active_effects:
             # Draw combo counter with dynamic scaling
             combo_count = getattr(self, 'combo_count', 0)
-            scale = 1 + math.sin(pygame.time.get_ticks() * 0.01) * 0.2
-            combo_text = self.font.render(f"Combo: {combo_count}", True, self.effect_colors["combo"][:3])
-            scaled_text = pygame.transform.scale(combo_text, 
-                (int(combo_text.get_width() * scale), int(combo_text.get_height() * scale)))
-            screen.blit(scaled_text, (self.x, self.y - 60))
-        
-        if "dash" in self.active_effects:
-            # Draw dash trail with motion blur effect
-            color = self.effect_colors["dash"]
-            for i in range(3):
-                alpha = int(color[3] * (1 - i/3))
-                ghost_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                ghost_surface.fill((*color[:3], alpha))
-                screen.blit(ghost_surface, (self.x - (self.direction * i * 20), self.y))
+            pulse = math.sin(pygame.time.get_ticks() * 0.01)
+            scale_step = round((pulse + 1) / 2 * COMBO_SCALE_STEPS)
+            screen.blit(self.get_combo_text(combo_count, scale_step, scale), (self.x * scale, (self.y - 60) * scale))
+        
+        if "dash" in active_effects:
+            # Dash trail: short-lived ghosts left behind every frame
+            particles.emit(self.x, self.y, ParticlePool.rect_sprite(effect_colors["dash"], (self.width, self.height)), 3)
+        
+        particles.draw(screen, scale)
 
+    def draw_effect_animation(self, screen, name, flip=False):
+        """Play one frame of a baked effect animation around the character"""
+        if not self.view.effects_enabled:
+            return
+        scale = render_scale(screen)
+        animation, (origin_x, origin_y), frame_size = self.get_effect_animation(name)
+        animation.update(1/60)
+        frame, (offset_x, offset_y) = animation.get_trimmed_frame(scale_size(frame_size, scale), flip)
+        if frame:
+            if flip:
+                origin_x = self.width - origin_x - frame_size[0]
+            screen.blit(frame, (int(self.x * scale) + round(origin_x * scale) + offset_x,
+                               int(self.y * scale) + round(origin_y * scale) + offset_y))
+    
+    def get_effect_animation(self, name):
+        """Baked effect animation for this character: (animation, origin, frame size)"""
+        effect = self.view.effect_animations.get(name)
+        if effect is None:
+            effect = create_effect_animation(name, self.width, self.height, self.view.effect_colors[name])
+            self.view.effect_animations[name] = effect
+        return effect
+    
+    def get_effect_surface(self, name, scale=1):
+        """Character-sized surface filled with an effect color, created once per scale"""
+        surfaces = self.view.effect_surfaces
+        key = (name, self.width, self.height, scale)
+        surface = surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(scale_size((self.width, self.height), scale), pygame.SRCALPHA)
+            surface.fill(self.view.effect_colors[name])
+            surfaces[key] = surface
+        return surface
+    
+    def get_combo_text(self, combo_count, scale_step, scale=1):
+        """Combo counter text at one of the pre-scaled sizes"""
+        surfaces = self.view.effect_surfaces
+        key = ("combo", combo_count, scale_step, scale)
+        surface = surfaces.get(key)
+        if surface is None:
+            combo_text = self.view.font.render(f"Combo: {combo_count}", True, self.view.effect_colors["combo"][:3])
+            text_scale = (0.8 + 0.4 * scale_step / COMBO_SCALE_STEPS) * scale
+            surface = pygame.transform.scale(combo_text,
+                (int(combo_text.get_width() * text_scale), int(combo_text.get_height() * text_scale)))
+            surfaces[key] = surface
+        return surface
+    
     def update(self):
         # Update power buff
         if self.has_power_buff:
@@ -472,11 +580,59 @@ class Character:
             if self.power_buff_timer <= 0:
                 self.has_power_buff = False
                 self.attack_multiplier = 1.0
+        
+        # Update buff durations; expired keys are only collected when one expires
+        expired = None
+        for buff_type, remaining in self.buff_durations.items():
+            remaining -= 1/60  # Decrease by 1 second (assuming 60 FPS)
+            self.buff_durations[buff_type] = remaining
+            if remaining <= 0:
+                if expired is None:
+                    expired = []
+                expired.append(buff_type)
+        if expired:
+            for buff_type in expired:
+                self.active_buffs.remove(buff_type)
+                del self.buff_durations[buff_type]
+                if buff_type == "power":
+                    self.attack_multiplier = 1.0
+
+    def draw_buffs(self, screen, x, y):
+        """Draw active buffs below the character name"""
+        scale = render_scale(screen)
+        for i, buff in enumerate(self.active_buffs):
+            text = f"{buff.capitalize()}: {self.buff_durations[buff]}s"
+            buff_text = self.get_font(scale).render(text, True, (255, 255, 255))
+            screen.blit(buff_text, (x * scale, (y + 20 + (i * 20)) * scale))
 
 
 class Fighter(Character):
-    def __init__(self, x, y, name, is_player2=False):
-        super().__init__(x, y, name, is_player2)
+    __slots__ = (
+        "special_damage", "stamina", "max_stamina", "stamina_regen", "blocking",
+        "perfect_block_window", "perfect_block_timer", "combo_count", "combo_timer",
+        "combo_timer_max", "attack_types", "current_attack_type", "charging", "charge_time",
+        "max_charge_time", "charge_multiplier", "charge_attack_active", "slam_cooldown",
+        "slam_cooldown_max", "push_cooldown", "push_cooldown_max",
+    )
+    
+    ANIMATION_PATH = "./imagens_characters/PNG/Knight"
+    ANIMATIONS = {
+        "idle": "Idle",
+        "walk": "Walk",
+        "run": "Run",
+        "attack": "Attack",
+        "attack_extra": "Attack_Extra",
+        "walk_attack": "Walk_Attack",
+        "run_attack": "Run_Attack",
+        "jump": "Jump",
+        "high_jump": "High_Jump",
+        "hurt": "Hurt",
+        "climb": "Climb",
+        "push": "Push"
+    }
+    
+    def reset_state(self, x, y):
+        super().reset_state(x, y)
         self.health = 0  # Start at 0%
         self.attack_power = 6  # High base damage
         self.defense = 8  # Highest defense
@@ -519,7 +675,9 @@ class Fighter(Character):
         """Update with enhanced knight abilities"""
         # Stamina regeneration
         if not self.charging and not self.blocking:
-            self.stamina = min(self.max_stamina, self.stamina + self.stamina_regen)
+            # Compared instead of min() so the regen allocates no argument tuple per tick
+            stamina = self.stamina + self.stamina_regen
+            self.stamina = stamina if stamina < self.max_stamina else self.max_stamina
         
         # Cooldown timers
         if self.slam_cooldown > 0:
@@ -697,31 +855,22 @@ class Fighter(Character):
         
         # Show perfect block indicator
         if self.perfect_block_timer > 0:
-            pygame.draw.circle(screen, (255, 215, 0), (self.x + self.width//2, self.y - 50), 5)
+            scale = render_scale(screen)
+            draw_circle(screen, (255, 215, 0), ((self.x + self.width//2) * scale, (self.y - 50) * scale),
+                        max(1, round(5 * scale)))
     
     def get_color(self):
         """Knight's unique color"""
         return (255, 0, 0)  # Red for Knight
-    
-    def load_animations(self):
-        base_path = "./imagens_characters/PNG/Knight"
-        self.animations = {
-            "idle": Animation(os.path.join(base_path, "Idle")),
-            "walk": Animation(os.path.join(base_path, "Walk")),
-            "run": Animation(os.path.join(base_path, "Run")),
-            "attack": Animation(os.path.join(base_path, "Attack")),
-            "attack_extra": Animation(os.path.join(base_path, "Attack_Extra")),
-            "walk_attack": Animation(os.path.join(base_path, "Walk_Attack")),
-            "run_attack": Animation(os.path.join(base_path, "Run_Attack")),
-            "jump": Animation(os.path.join(base_path, "Jump")),
-            "high_jump": Animation(os.path.join(base_path, "High_Jump")),
-            "hurt": Animation(os.path.join(base_path, "Hurt")),
-            "climb": Animation(os.path.join(base_path, "Climb")),
-            "push": Animation(os.path.join(base_path, "Push"))
-        }
 
 
 class FireProjectile:
+    __slots__ = ("x", "y", "direction", "damage", "is_special", "width", "height", "speed",
+                 "lifetime", "rect", "step_dx", "alpha", "fade_rate")
+    
+    # Drawn projectiles shared by all instances: (is_special, alpha, scale) -> surface
+    surfaces = {}
+    
     def __init__(self, x, y, direction, damage, is_special=False):
         self.x = x
         self.y = y
@@ -733,6 +882,7 @@ class FireProjectile:
         self.speed = 15 if not is_special else 10
         self.lifetime = 60 if not is_special else 30  # Frames until disappear
         self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.step_dx = 0  # Last displacement, used for swept collision
         
         # Visual effect properties
         self.alpha = 255
@@ -740,6 +890,7 @@ class FireProjectile:
     
     def update(self):
         self.x += self.direction * self.speed
+        self.step_dx = int(self.x) - self.rect.x
         self.rect.x = self.x
         self.rect.y = self.y
         self.lifetime -= 1
@@ -750,24 +901,57 @@ class FireProjectile:
         
         return self.lifetime > 0
     
+    def hits(self, target):
+        """Check if the projectile touched target during its last step"""
+        return swept_collides(self.rect, self.step_dx, 0, target)
+    
     def draw(self, screen):
-        # Create a surface for the projectile with transparency
-        projectile_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
-        # Draw the projectile with current alpha
-        if self.is_special:
-            color = (255, 100, 0, self.alpha)  # Orange for special
-            pygame.draw.ellipse(projectile_surface, color, (0, 0, self.width, self.height))
-        else:
-            color = (255, 0, 0, self.alpha)  # Red for normal
-            pygame.draw.ellipse(projectile_surface, color, (0, 0, self.width, self.height))
+        scale = render_scale(screen)
+        key = (self.is_special, self.alpha, scale)
+        projectile_surface = self.surfaces.get(key)
+        if projectile_surface is None:
+            width, height = scale_size((self.width, self.height), scale)
+            
+            # Create a surface for the projectile with transparency
+            projectile_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            
+            # Draw the projectile with current alpha
+            if self.is_special:
+                color = (255, 100, 0, self.alpha)  # Orange for special
+                pygame.draw.ellipse(projectile_surface, color, (0, 0, width, height))
+            else:
+                color = (255, 0, 0, self.alpha)  # Red for normal
+                pygame.draw.ellipse(projectile_surface, color, (0, 0, width, height))
+            self.surfaces[key] = projectile_surface
         
-        screen.blit(projectile_surface, (self.x, self.y))
+        screen.blit(projectile_surface, (self.x * scale, self.y * scale))
 
 
 class Mage(Character):
-    def __init__(self, x, y, name, is_player2=False):
-        super().__init__(x, y, name, is_player2)
+    __slots__ = (
+        "special_damage", "mana", "mana_regen", "fire_cooldown", "fire_cooldown_max",
+        "fire_extra_cooldown", "fire_extra_cooldown_max", "fire_mana_cost", "fire_extra_mana_cost",
+        "continuous_jump_power", "continuous_jump_mana_cost", "spell_combo", "combo_timer",
+        "combo_timer_max", "projectiles", "projectile_damage", "special_projectile_damage",
+    )
+    
+    ANIMATION_PATH = "./imagens_characters/PNG/Mage"
+    ANIMATIONS = {
+        "idle": "Idle",
+        "walk": "Walk",
+        "attack": "Attack",
+        "attack_extra": "Attack_Extra",
+        "jump": "Jump",
+        "high_jump": "High_Jump",
+        "hurt": "Hurt",
+        "run": "Run",
+        "fire": "Fire",
+        "fire_extra": "Fire_Extra",
+        "climb": "Climb"  # Used for teleport
+    }
+    
+    def reset_state(self, x, y):
+        super().reset_state(x, y)
         self.health = 0  # Start at 0%
         self.attack_power = 4  # Base damage
         self.defense = 3  # Lowest defense but powerful ranged attacks
@@ -812,11 +996,18 @@ class Mage(Character):
     
     def update_local(self, controls, opponent, buffs, platforms):
         """Update with enhanced magic abilities"""
-        # Update existing projectiles
-        self.projectiles = [proj for proj in self.projectiles if proj.update()]
+        # Update existing projectiles, compacting the list in place
+        projectiles = self.projectiles
+        alive = 0
+        for proj in projectiles:
+            if proj.update():
+                projectiles[alive] = proj
+                alive += 1
+        del projectiles[alive:]
         
         # Mana regeneration
-        self.mana = min(self.max_mana, self.mana + self.mana_regen)
+        mana = self.mana + self.mana_regen
+        self.mana = mana if mana < self.max_mana else self.max_mana
         
         # Cooldown timers
         if self.fire_cooldown > 0:
@@ -827,8 +1018,8 @@ class Mage(Character):
         # Combo timer
         if self.combo_timer > 0:
             self.combo_timer -= 1
-        else:
-            self.spell_combo = []
+        elif self.spell_combo:
+            self.spell_combo.clear()
         
         # Pulo contínuo enquanto mantém o botão pressionado e tem mana
         if controls["up"] and not self.on_ground and self.mana >= self.continuous_jump_mana_cost:
@@ -878,7 +1069,7 @@ class Mage(Character):
         
         # Check projectile collisions
         for projectile in self.projectiles:
-            if projectile.rect.colliderect(opponent.rect):
+            if projectile.hits(opponent.rect):
                 opponent.take_damage(projectile.damage)
                 # Knockback based on projectile type
                 knockback_power = 12 if projectile.is_special else 8
@@ -932,8 +1123,9 @@ class Mage(Character):
     def draw(self, screen):
         """Override draw to add projectiles and mana bar"""
         # Draw projectiles
-        for projectile in self.projectiles:
-            projectile.draw(screen)
+        with draw_counters.site("FireProjectile.draw"):
+            for projectile in self.projectiles:
+                projectile.draw(screen)
         
         super().draw(screen)
         
@@ -942,27 +1134,31 @@ class Mage(Character):
     def get_color(self):
         """Mage's unique color"""
         return (0, 0, 255)  # Blue for Mage
-    
-    def load_animations(self):
-        base_path = "./imagens_characters/PNG/Mage"
-        self.animations = {
-            "idle": Animation(os.path.join(base_path, "Idle")),
-            "walk": Animation(os.path.join(base_path, "Walk")),
-            "attack": Animation(os.path.join(base_path, "Attack")),
-            "attack_extra": Animation(os.path.join(base_path, "Attack_Extra")),
-            "jump": Animation(os.path.join(base_path, "Jump")),
-            "high_jump": Animation(os.path.join(base_path, "High_Jump")),
-            "hurt": Animation(os.path.join(base_path, "Hurt")),
-            "run": Animation(os.path.join(base_path, "Run")),
-            "fire": Animation(os.path.join(base_path, "Fire")),
-            "fire_extra": Animation(os.path.join(base_path, "Fire_Extra")),
-            "climb": Animation(os.path.join(base_path, "Climb"))  # Used for teleport
-        }
 
 
 class Rogue(Character):
-    def __init__(self, x, y, name, is_player2=False):
-        super().__init__(x, y, name, is_player2)
+    __slots__ = (
+        "special_damage", "energy", "max_energy", "energy_regen", "dash_energy_cost",
+        "push_energy_cost", "double_jump_energy_cost", "can_climb", "climbing", "climb_speed",
+        "double_jump_available", "run_multiplier", "combo_count", "combo_timer", "max_combo",
+        "dash_cooldown", "dash_cooldown_max", "push_cooldown", "push_cooldown_max",
+        "special_duration",
+    )
+    
+    ANIMATION_PATH = "./imagens_characters/PNG/Rogue"
+    ANIMATIONS = {
+        "idle": "Idle",
+        "walk": "Walk",
+        "attack": "Attack",
+        "attack_extra": "Attack_Extra",
+        "jump": "Jump",
+        "hurt": "Hurt",
+        "run": "Run",
+        "push": "Push"  # Added Push animation
+    }
+    
+    def reset_state(self, x, y):
+        super().reset_state(x, y)
         self.health = 0  # Start at 0%
         self.attack_power = 3  # Base damage
         self.defense = 4  # Lower defense but more agile
@@ -1002,7 +1198,8 @@ class Rogue(Character):
     def update_local(self, controls, opponent, buffs, platforms):
         """Update with enhanced movement and abilities"""
         # Regeneração de energia
-        self.energy = min(self.max_energy, self.energy + self.energy_regen)
+        energy = self.energy + self.energy_regen
+        self.energy = energy if energy < self.max_energy else self.max_energy
         
         # Reset combo if timer expires
         if self.combo_timer > 0:
@@ -1109,7 +1306,7 @@ class Rogue(Character):
         # Continue checking for dash attack collision during the dash
         if self.using_special:
             if self.special_frame < 10:  # Check for first 10 frames of dash
-                if self.rect.colliderect(opponent.rect):
+                if self.swept_hit(opponent.rect):
                     damage = self.special_damage
                     opponent.take_damage(damage)
                     opponent.velocity_x = self.direction * 15
@@ -1147,16 +1344,3 @@ class Rogue(Character):
     def get_color(self):
         """Rogue's unique color"""
         return (0, 255, 0)  # Green for Rogue
-    
-    def load_animations(self):
-        base_path = "./imagens_characters/PNG/Rogue"
-        self.animations = {
-            "idle": Animation(os.path.join(base_path, "Idle")),
-            "walk": Animation(os.path.join(base_path, "Walk")),
-            "attack": Animation(os.path.join(base_path, "Attack")),
-            "attack_extra": Animation(os.path.join(base_path, "Attack_Extra")),
-            "jump": Animation(os.path.join(base_path, "Jump")),
-            "hurt": Animation(os.path.join(base_path, "Hurt")),
-            "run": Animation(os.path.join(base_path, "Run")),
-            "push": Animation(os.path.join(base_path, "Push"))  # Added Push animation
-        }
\ No newline at end of file
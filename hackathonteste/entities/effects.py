@@ -0,0 +1,112 @@
+"""
+Animações de efeitos visuais geradas uma única vez por tamanho de personagem
+"""
+import math
+import pygame
+from entities.animation import Animation
+
+# Frames por ciclo e duração de cada frame (segundos) de cada efeito
+EFFECT_FRAMES = {
+    "perfect_block": 16,
+    "levitate": 16,
+    "teleport": 8
+}
+EFFECT_SPEED = {
+    # Ciclo de |sin(t * 0.005)| com t em ms: ~0.63 s
+    "perfect_block": math.pi / 0.005 / 1000 / 16,
+    # Ciclo de sin(t * 0.01) com t em ms: ~0.63 s
+    "levitate": 2 * math.pi / 0.01 / 1000 / 16,
+    "teleport": 0.05
+}
+
+# Distância entre as cópias do rasto de teleporte
+TELEPORT_TRAIL_STEP = 20
+TELEPORT_TRAIL_LENGTH = 5
+
+# Frames já gerados: (efeito, largura, altura, cor) → (frames, origem)
+_baked = {}
+
+def bake_perfect_block(width, height, color):
+    """
+    Escudo circular que pulsa
+
+    Returns:
+        Tupla (frames, origem relativa à personagem)
+    """
+    radius = width * 0.7
+    size = int(radius * 2)
+    frames = []
+    count = EFFECT_FRAMES["perfect_block"]
+    for i in range(count):
+        pulse = abs(math.sin(math.pi * i / count)) * 0.3 + 0.7
+        frame = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(frame, color, (radius, radius), radius * pulse, 3)
+        frames.append(frame)
+    return frames, (int(width // 2 - radius), int(height // 2 - radius))
+
+def bake_levitate(width, height, color):
+    """
+    Onda ondulante por baixo dos pés
+
+    Returns:
+        Tupla (frames, origem relativa à personagem)
+    """
+    frames = []
+    count = EFFECT_FRAMES["levitate"]
+    for i in range(count):
+        phase = 2 * math.pi * i / count
+        points = [(j * width // 4, 10 + math.sin(phase + j) * 5) for j in range(5)]
+        frame = pygame.Surface((width, 20), pygame.SRCALPHA)
+        pygame.draw.lines(frame, color, False, points, 2)
+        frames.append(frame)
+    return frames, (0, height)
+
+def bake_teleport(width, height, color):
+    """
+    Rasto de cópias cada vez mais transparentes atrás da personagem (virada à direita)
+
+    Returns:
+        Tupla (frames, origem relativa à personagem)
+    """
+    trail = TELEPORT_TRAIL_STEP * (TELEPORT_TRAIL_LENGTH - 1)
+    frames = []
+    count = EFFECT_FRAMES["teleport"]
+    for i in range(count):
+        # Cintilação suave ao longo do ciclo
+        flicker = 0.85 + 0.15 * math.cos(2 * math.pi * i / count)
+        frame = pygame.Surface((width + trail, height), pygame.SRCALPHA)
+        for step in reversed(range(TELEPORT_TRAIL_LENGTH)):
+            alpha = int(color[3] * (1 - step / TELEPORT_TRAIL_LENGTH) * flicker)
+            ghost = pygame.Surface((width, height), pygame.SRCALPHA)
+            ghost.fill((*color[:3], alpha))
+            frame.blit(ghost, (trail - step * TELEPORT_TRAIL_STEP, 0))
+        frames.append(frame)
+    return frames, (-trail, 0)
+
+BAKERS = {
+    "perfect_block": bake_perfect_block,
+    "levitate": bake_levitate,
+    "teleport": bake_teleport
+}
+
+def create_effect_animation(name, width, height, color):
+    """
+    Cria a animação de um efeito; os frames são gerados uma vez por tamanho e cor
+
+    Args:
+        name: Nome do efeito (chave de BAKERS)
+        width, height: Tamanho da personagem
+        color: Cor RGBA do efeito
+
+    Returns:
+        Tupla (Animation, origem (x, y) relativa à personagem, tamanho dos frames)
+    """
+    key = (name, width, height, tuple(color))
+    baked = _baked.get(key)
+    if baked is None:
+        baked = BAKERS[name](width, height, color)
+        _baked[key] = baked
+    frames, origin = baked
+    # O nome único identifica os frames recortados na cache de imagens
+    animation = Animation(f"effect:{name}:{width}x{height}:{color}", EFFECT_SPEED[name], frames)
+    return animation, origin, frames[0].get_size()
@@ -0,0 +1,215 @@
+"""
+Sistema de partículas para os efeitos visuais das personagens
+"""
+import numpy as np
+import pygame
+
+class ParticlePool:
+    """
+    Conjunto de partículas com capacidade fixa, guardado em arrays NumPy.
+
+    Posição, velocidade, vida e sprite de cada partícula vivem em arrays
+    preparados no arranque; as partículas vivas ocupam sempre as primeiras
+    `count` posições. A atualização é feita em bloco e o desenho usa sprites
+    pré-desenhados (um por nível de transparência) com Surface.blits, por
+    isso não são criadas superfícies durante o jogo.
+    """
+    # Níveis de transparência pré-desenhados para cada sprite
+    ALPHA_STEPS = 8
+
+    # Sprites partilhados por todos os conjuntos: id → tuplo de surfaces por nível de alpha
+    sprites = []
+    sprite_ids = {}
+    # Sprites escalados para outras resoluções de desenho: escala → lista paralela a sprites
+    scaled_sprites = {}
+
+    def __init__(self, capacity=256):
+        """
+        Reserva os arrays das partículas
+
+        Args:
+            capacity: Número máximo de partículas vivas
+        """
+        self.capacity = capacity
+        # Máximo de partículas vivas em uso (baixado pelo governador de qualidade)
+        self.limit = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.rng = np.random.default_rng()
+
+    @classmethod
+    def circle_sprite(cls, color, radius):
+        """
+        Retorna o id de um sprite circular, desenhando-o na primeira vez
+
+        Args:
+            color: Cor RGBA no máximo de opacidade
+            radius: Raio em píxeis
+
+        Returns:
+            Id do sprite
+        """
+        key = ("circle", tuple(color), radius)
+        sprite_id = cls.sprite_ids.get(key)
+        if sprite_id is None:
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            sprite_id = cls.add_sprite(key, surface, color[3] if len(color) > 3 else 255)
+        return sprite_id
+
+    @classmethod
+    def rect_sprite(cls, color, size):
+        """
+        Retorna o id de um sprite retangular, desenhando-o na primeira vez
+
+        Args:
+            color: Cor RGBA no máximo de opacidade
+            size: Tupla (width, height)
+
+        Returns:
+            Id do sprite
+        """
+        key = ("rect", tuple(color), tuple(size))
+        sprite_id = cls.sprite_ids.get(key)
+        if sprite_id is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color[:3])
+            sprite_id = cls.add_sprite(key, surface, color[3] if len(color) > 3 else 255)
+        return sprite_id
+
+    @classmethod
+    def add_sprite(cls, key, surface, alpha):
+        """
+        Guarda um sprite com todos os níveis de transparência
+
+        Args:
+            key: Chave do sprite
+            surface: Surface desenhada a cor sólida
+            alpha: Opacidade máxima (vida cheia)
+
+        Returns:
+            Id do sprite
+        """
+        steps = []
+        for step in range(cls.ALPHA_STEPS):
+            faded = surface.copy()
+            faded.fill((255, 255, 255, int(alpha * (step + 1) / cls.ALPHA_STEPS)), special_flags=pygame.BLEND_RGBA_MULT)
+            steps.append(faded)
+        cls.sprites.append(tuple(steps))
+        cls.sprite_ids[key] = len(cls.sprites) - 1
+        return len(cls.sprites) - 1
+
+    @classmethod
+    def get_scaled_sprites(cls, scale):
+        """
+        Retorna os sprites escalados para uma resolução de desenho
+
+        Args:
+            scale: Escala da superfície de desenho
+
+        Returns:
+            Lista paralela a sprites, completada com os sprites criados entretanto
+        """
+        scaled = cls.scaled_sprites.setdefault(scale, [])
+        for steps in cls.sprites[len(scaled):]:
+            size = steps[0].get_size()
+            size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+            scaled.append(tuple(pygame.transform.scale(step, size) for step in steps))
+        return scaled
+
+    def emit(self, x, y, sprite_id, life, count=1, spread=(0, 0), velocity=(0, 0), velocity_spread=(0, 0)):
+        """
+        Cria partículas; as que não couberem na capacidade são ignoradas
+
+        Args:
+            x, y: Posição (canto superior esquerdo do sprite)
+            sprite_id: Id devolvido por circle_sprite/rect_sprite
+            life: Duração em frames
+            count: Número de partículas
+            spread: Variação aleatória máxima da posição (dx, dy)
+            velocity: Velocidade base (vx, vy) em píxeis por frame
+            velocity_spread: Variação aleatória máxima da velocidade
+        """
+        start = self.count
+        end = min(start + count, self.limit)
+        if end <= start:
+            return
+        n = end - start
+        position = self.position[start:end]
+        position[:, 0] = x
+        position[:, 1] = y
+        if spread != (0, 0):
+            position += self.rng.random((n, 2), dtype=np.float32) * spread
+        speed = self.velocity[start:end]
+        speed[:, 0] = velocity[0]
+        speed[:, 1] = velocity[1]
+        if velocity_spread != (0, 0):
+            speed += (self.rng.random((n, 2), dtype=np.float32) * 2 - 1) * velocity_spread
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.sprite[start:end] = sprite_id
+        self.count = end
+
+    def update(self):
+        """
+        Avança todas as partículas um frame e remove as que morreram
+        """
+        count = self.count
+        if count == 0:
+            return
+        self.position[:count] += self.velocity[:count]
+        life = self.life[:count]
+        life -= 1
+        alive = np.greater(life, 0, out=self.alive[:count])
+        kept = int(np.count_nonzero(alive))
+        if kept < count:
+            # Compacta as vivas para o início dos arrays
+            for array in (self.position, self.velocity, self.life, self.max_life, self.sprite):
+                array[:kept] = array[:count][alive]
+        self.count = kept
+
+    def draw(self, screen, scale=1):
+        """
+        Desenha as partículas vivas, mais transparentes à medida que a vida acaba
+
+        Args:
+            screen: Superfície onde desenhar
+            scale: Escala da resolução de desenho em relação às coordenadas lógicas
+        """
+        count = self.count
+        if count == 0:
+            return
+        steps = (self.life[:count] / self.max_life[:count] * self.ALPHA_STEPS).astype(np.int32)
+        np.clip(steps - 1, 0, self.ALPHA_STEPS - 1, out=steps)
+        if scale == 1:
+            sprites = self.sprites
+            positions = self.position[:count].astype(np.int32)
+        else:
+            sprites = self.get_scaled_sprites(scale)
+            positions = (self.position[:count] * scale).astype(np.int32)
+        screen.blits(
+            [(sprites[sprite][step], (x, y)) for sprite, step, (x, y) in
+             zip(self.sprite[:count].tolist(), steps.tolist(), positions.tolist())],
+            doreturn=False
+        )
+
+    def set_limit(self, limit):
+        """
+        Limita o número de partículas vivas, descartando as que passarem do limite
+
+        Args:
+            limit: Novo máximo (entre 0 e a capacidade)
+        """
+        self.limit = max(0, min(limit, self.capacity))
+        self.count = min(self.count, self.limit)
+
+    def clear(self):
+        """
+        Remove todas as partículas
+        """
+        self.count = 0
@@ -5,6 +5,8 @@ import math
 from characters import Character, Fighter, Mage, Archer
 from buff import Buff
 from buff_manager import BuffManager
+from core.controls import Controls, get_input_map
+from utils.tracer import tracer
 
 class Game:
     def __init__(self, screen, player1_class, player2_class, player1_name, player2_name, level_manager):
@@ -41,6 +43,14 @@ class Game:
         self.player2_name = player2_name
         self.player1_lives = 3
         self.player2_lives = 3
+        # Players are created in the first round and reset in place afterwards
+        self.players = ()
+        
+        # Input state, reused every frame
+        self.input_map = get_input_map()
+        self.player1_controls = Controls()
+        self.player2_controls = Controls()
+        self.controls = (self.player1_controls, self.player2_controls)
         
         # Load HUD assets
         self.load_hud_assets()
@@ -56,9 +66,16 @@ class Game:
         # Get spawn points from current level
         spawn_points = self.level_manager.get_spawn_points()
         
-        # Create players at spawn points with current lives
-        self.player1 = self.create_player(self.player1_class, self.player1_name, spawn_points[0], self.player1_lives, is_player2=False)
-        self.player2 = self.create_player(self.player2_class, self.player2_name, spawn_points[1], self.player2_lives, is_player2=True)
+        # Create players at spawn points with current lives, or reset the existing ones
+        if self.players:
+            self.player1.reset(*spawn_points[0])
+            self.player2.reset(*spawn_points[1])
+            self.player1.lives = self.player1_lives
+            self.player2.lives = self.player2_lives
+        else:
+            self.player1 = self.create_player(self.player1_class, self.player1_name, spawn_points[0], self.player1_lives, is_player2=False)
+            self.player2 = self.create_player(self.player2_class, self.player2_name, spawn_points[1], self.player2_lives, is_player2=True)
+            self.players = (self.player1, self.player2)
         
         # Reset round-specific variables
         self.game_started = False
@@ -68,6 +85,25 @@ class Game:
         
         # Get platforms from current level
         self.platforms = self.level_manager.get_platforms()
+        self.platform_index = self.level_manager.get_platform_index()
+    
+    def reset(self):
+        """Restore the initial match state in place for a rematch"""
+        self.level_manager.reset()
+        self.buff_manager.reset()
+        self.running = True
+        self.current_time = self.round_time
+        self.game_over = False
+        self.winner = None
+        self.respawn_timer = 0
+        self.show_controls = True
+        self.controls_alpha = 128
+        self.controls_fade_timer = 600
+        self.player1_lives = 3
+        self.player2_lives = 3
+        for player_controls in self.controls:
+            player_controls.clear()
+        self.initialize_round()
     
     def create_player(self, class_id, name, spawn_point, lives, is_player2=False):
         """Create a player based on the selected class at the spawn point"""
@@ -150,13 +186,10 @@ class Game:
             self.determine_round_winner()
             return
         
-        # Get input for both players
-        keys = pygame.key.get_pressed()
-        
         # Update players
         if self.game_started:
             # Check for out of bounds
-            for player in [self.player1, self.player2]:
+            for player in self.players:
                 if player.y > 800:  # If player falls off screen
                     if player == self.player1:
                         self.player1_lives -= 1
@@ -209,36 +242,19 @@ class Game:
                     self.player2.health = 0
 
             # Player controls
-            player1_controls = {
-                "left": keys[pygame.K_a],
-                "right": keys[pygame.K_d],
-                "up": keys[pygame.K_w],
-                "down": keys[pygame.K_s],
-                "attack": keys[pygame.K_f],
-                "defend": keys[pygame.K_g],
-                "special": keys[pygame.K_h]
-            }
-            
-            player2_controls = {
-                "left": keys[pygame.K_LEFT],
-                "right": keys[pygame.K_RIGHT],
-                "up": keys[pygame.K_UP],
-                "down": keys[pygame.K_DOWN],
-                "attack": keys[pygame.K_k],
-                "defend": keys[pygame.K_l],
-                "special": keys[pygame.K_m]
-            }
+            self.input_map.sample(self.controls)
             
             # Update players with platform collision
-            self.player1.update_local(player1_controls, self.player2, [], self.platforms)
-            self.player2.update_local(player2_controls, self.player1, [], self.platforms)
+            self.player1.update_local(self.player1_controls, self.player2, [], self.platform_index)
+            self.player2.update_local(self.player2_controls, self.player1, [], self.platform_index)
         
         # Check if either player is defeated (percentage too high)
         if self.game_started and (self.player1.health >= self.player1.max_health or self.player2.health >= self.player2.max_health):
             self.round_over = True
             self.determine_round_winner()
 
-        self.buff_manager.update([self.player1, self.player2])
+        with tracer.span("BuffManager.update"):
+            self.buff_manager.update(self.players)
     
     def determine_round_winner(self):
         """Determina o vencedor do nível atual e avança para o próximo"""
@@ -335,7 +351,8 @@ class Game:
 
         self.buff_manager.draw(self.screen)
         
-        pygame.display.flip()
+        with tracer.span("display.flip"):
+            pygame.display.flip()
     
     def draw_damage_percentage(self, player):
         """Desenha a porcentagem de dano e o nome acima do jogador"""
@@ -530,15 +547,8 @@ class Game:
             class_name = "Cavaleiro" if isinstance(player, Fighter) else "Mago" if isinstance(player, Mage) else "Arqueiro"
             y = draw_control_line(f"Jogador {player_num} - {class_name}:", y, (255, 215, 0))
             
-            # Movement
-            controls = {
-                "Movimento": "WASD" if player_num == 1 else "Setas",
-                "Ataque": "F" if player_num == 1 else "K",
-                "Defesa": "G" if player_num == 1 else "L",
-                "Especial": "H" if player_num == 1 else "M"
-            }
-            
-            for action, key in controls.items():
+            # Movement and actions, from the key bindings
+            for action, key in self.input_map.guide_lines(player_num - 1):
                 y = draw_control_line(f"{action}: {key}", y)
             
             # Special abilities based on character class
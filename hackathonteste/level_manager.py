@@ -1,5 +1,6 @@
 import pygame
 import random
+from core.platform import PlatformIndex
 
 class Platform:
     # Tamanhos predefinidos
@@ -70,6 +71,7 @@ class Level:
         self.platforms = []
         self.spawn_points = spawn_points
         self.create_platforms(platform_layout)
+        self.platform_index = PlatformIndex(self.platforms)
     
     def create_fallback_background(self):
         """Create a fallback background with a gradient when image fails to load"""
@@ -124,6 +126,13 @@ class LevelManager:
         self.rounds_per_level = 2
         self.total_rounds = self.total_levels * self.rounds_per_level
     
+    def reset(self):
+        """Volta ao primeiro nível e limpa o placar; os níveis já construídos são mantidos"""
+        self.current_level = 0
+        self.player1_wins = 0
+        self.player2_wins = 0
+        self.current_round = 1
+    
     def initialize_levels(self):
         """Initialize all level data"""
         screen_width = 1280  # Largura padrão da tela
@@ -200,6 +209,10 @@ class LevelManager:
         """Get platforms for current level"""
         return self.get_current_level().platforms
     
+    def get_platform_index(self):
+        """Get the platform collision index for current level"""
+        return self.get_current_level().platform_index
+    
     def next_round(self, winner):
         """Progress to next round and update scores"""
         if winner == 1:
@@ -1,11 +1,44 @@
-import pygame
 import sys
+from utils.startup_profiler import startup_profiler
+
+# Tem de ser ligado antes dos restantes imports para medir o tempo de importação
+if "--profile-startup" in sys.argv:
+    startup_profiler.enable()
+
+import pygame
+import config
 from core.level_manager import LevelManager
 from core.game_core import Game
+from core.controls import get_input_map
+from core.platform import Platform
+from core.display import display
+from entities.characters import Fighter, Mage, Rogue
+from assets.asset_manager import asset_manager
+from assets.preloader import AssetPreloader
+from ui.hud import HUD
+from utils.frame_stats import frame_stats
+from utils.tracer import tracer
+from utils.sampler import sampling_profiler
+from utils.draw_counters import draw_counters
+
+def build_preloader():
+    """Regista todas as imagens usadas numa partida para carregar em segundo plano"""
+    preloader = AssetPreloader(asset_manager)
+    # Só o primeiro nível; os seguintes são pré-carregados durante o jogo
+    preloader.add_image(LevelManager.background_paths()[0])
+    preloader.add_image(Platform.IMAGE_PATH)
+    for path in HUD.asset_paths():
+        preloader.add_image(path)
+    preloader.add_image(Game.MOSQUETEIRO_PATH)
+    for character_class in (Fighter, Mage, Rogue):
+        for folder in character_class.animation_folders():
+            preloader.add_folder(folder)
+    return preloader
 
 class Menu:
-    def __init__(self, screen):
+    def __init__(self, screen, preloader=None):
         self.screen = screen
+        self.preloader = preloader
         self.running = True
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
@@ -25,6 +58,15 @@ class Menu:
         
         # Background
         self.background = self.load_background()
+        
+        # The game is built once and reset for every rematch
+        self.game = None
+        
+        # Pre-rendered menu screens, keyed by what they show
+        self.screens = {}
+        # Only redraw when something changed
+        self.dirty = True
+        self.last_progress = None
     
     def load_background(self):
         try:
@@ -42,9 +84,7 @@ class Menu:
         
         for char_type in character_types:
             try:
-                image_path = f"./imagens_characters/PNG/{char_type}/frame_{char_type.lower()}.png"
-                image = pygame.image.load(image_path).convert_alpha()
-                images.append(pygame.transform.scale(image, (150, 150)))
+                images.append(asset_manager.load_image(HUD.portrait_path(char_type), True, (150, 150)))
             except:
                 # Fallback image
                 img = pygame.Surface((150, 150))
@@ -53,10 +93,17 @@ class Menu:
         
         return images
     
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_events(self, events=None):
+        for event in events if events is not None else pygame.event.get():
+            # Anything but mouse movement may change or uncover the menu
+            if event.type != pygame.MOUSEMOTION:
+                self.dirty = True
+            
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
+                frame_stats.export(config.FRAME_STATS_PATH)
+                tracer.dump(config.TRACE_PATH)
+                sampling_profiler.finish(config.PROFILE_PATH)
                 pygame.quit()
                 sys.exit()
             
@@ -87,24 +134,54 @@ class Menu:
                     elif event.key == pygame.K_RETURN:
                         return self.start_game()
     
+    def get_menu_screen(self):
+        """Retorna o ecrã atual pré-renderizado, criando-o na primeira vez"""
+        surface = self.screens.get(self.state)
+        if surface is None:
+            surface = self.background.copy()
+            if self.state == "main":
+                self.draw_main_menu(surface)
+            elif self.state == "character_select":
+                self.draw_character_select(surface)
+            elif self.state == "controls":
+                self.draw_controls(surface)
+            self.screens[self.state] = surface
+        return surface
+    
     def draw(self):
-        # Draw background
-        self.screen.blit(self.background, (0, 0))
+        # Draw the cached screen for the current state
+        self.screen.blit(self.get_menu_screen(), (0, 0))
+        
+        # Only the selected characters change on the selection screen
+        if self.state == "character_select":
+            self.draw_character_choices(self.screen)
         
-        if self.state == "main":
-            self.draw_main_menu()
-        elif self.state == "character_select":
-            self.draw_character_select()
-        elif self.state == "controls":
-            self.draw_controls()
+        if self.preloader and not self.preloader.done:
+            self.draw_loading_bar(self.preloader.progress)
         
-        pygame.display.flip()
+        display.present(self.screen)
+    
+    def draw_loading_bar(self, progress):
+        """Desenha uma barra discreta com o progresso do carregamento"""
+        width = 200
+        x = self.screen.get_width() - width - 20
+        y = self.screen.get_height() - 30
+        pygame.draw.rect(self.screen, (60, 60, 60), (x, y, width, 8))
+        pygame.draw.rect(self.screen, (255, 255, 0), (x, y, int(width * progress), 8))
+        text = self.small_font.render("A carregar...", True, (200, 200, 200))
+        self.screen.blit(text, (x, y - 22))
+    
+    def draw_loading_screen(self, progress):
+        """Ecrã mostrado se o jogo começar antes de o carregamento terminar"""
+        self.screen.blit(self.background, (0, 0))
+        self.draw_loading_bar(progress)
+        display.present(self.screen)
     
-    def draw_main_menu(self):
+    def draw_main_menu(self, surface):
         # Draw title
         title = self.title_font.render("Batalha pela Queijada", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Draw menu options
         options = [
@@ -116,28 +193,34 @@ class Menu:
         for i, (text, color) in enumerate(options):
             option = self.font.render(text, True, color)
             option_rect = option.get_rect(center=(self.screen.get_width() // 2, 250 + i * 50))
-            self.screen.blit(option, option_rect)
+            surface.blit(option, option_rect)
     
-    def draw_character_select(self):
+    def draw_character_select(self, surface):
         # Draw title
         title = self.font.render("Selecione os Personagens", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Draw player 1 selection
         p1_text = self.font.render("Jogador 1 (Setas)", True, (255, 255, 255))
         p1_rect = p1_text.get_rect(center=(self.screen.get_width() // 4, 100))
-        self.screen.blit(p1_text, p1_rect)
+        surface.blit(p1_text, p1_rect)
         
         # Draw player 2 selection
         p2_text = self.font.render("Jogador 2 (A/D)", True, (255, 255, 255))
         p2_rect = p2_text.get_rect(center=(self.screen.get_width() * 3 // 4, 100))
-        self.screen.blit(p2_text, p2_rect)
+        surface.blit(p2_text, p2_rect)
         
+        # Draw start instruction
+        start_text = self.font.render("Pressione ENTER para iniciar", True, (255, 255, 0))
+        start_rect = start_text.get_rect(center=(self.screen.get_width() // 2, 400))
+        surface.blit(start_text, start_rect)
+    
+    def draw_character_choices(self, surface):
         # Draw character images
-        self.screen.blit(self.character_images[self.player1_class], 
+        surface.blit(self.character_images[self.player1_class], 
                          (self.screen.get_width() // 4 - 75, 150))
-        self.screen.blit(self.character_images[self.player2_class], 
+        surface.blit(self.character_images[self.player2_class], 
                          (self.screen.get_width() * 3 // 4 - 75, 150))
         
         # Draw character names
@@ -145,90 +228,129 @@ class Menu:
         
         p1_char = self.font.render(char_names[self.player1_class], True, (255, 255, 255))
         p1_char_rect = p1_char.get_rect(center=(self.screen.get_width() // 4, 320))
-        self.screen.blit(p1_char, p1_char_rect)
+        surface.blit(p1_char, p1_char_rect)
         
         p2_char = self.font.render(char_names[self.player2_class], True, (255, 255, 255))
         p2_char_rect = p2_char.get_rect(center=(self.screen.get_width() * 3 // 4, 320))
-        self.screen.blit(p2_char, p2_char_rect)
-        
-        # Draw start instruction
-        start_text = self.font.render("Pressione ENTER para iniciar", True, (255, 255, 0))
-        start_rect = start_text.get_rect(center=(self.screen.get_width() // 2, 400))
-        self.screen.blit(start_text, start_rect)
+        surface.blit(p2_char, p2_char_rect)
     
-    def draw_controls(self):
+    def draw_controls(self, surface):
         # Draw title
         title = self.font.render("Controles", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Draw controls for player 1
         p1_text = self.font.render("Jogador 1", True, (255, 255, 255))
         p1_rect = p1_text.get_rect(center=(self.screen.get_width() // 4, 100))
-        self.screen.blit(p1_text, p1_rect)
+        surface.blit(p1_text, p1_rect)
         
-        p1_controls = [
-            "Movimento: WASD",
-            "Ataque: F",
-            "Defesa: G",
-            "Especial: H"
-        ]
+        p1_controls = [f"{action}: {key}" for action, key in get_input_map().guide_lines(0)]
         
         for i, control in enumerate(p1_controls):
             text = self.small_font.render(control, True, (200, 200, 200))
             rect = text.get_rect(center=(self.screen.get_width() // 4, 150 + i * 30))
-            self.screen.blit(text, rect)
+            surface.blit(text, rect)
         
         # Draw controls for player 2
         p2_text = self.font.render("Jogador 2", True, (255, 255, 255))
         p2_rect = p2_text.get_rect(center=(self.screen.get_width() * 3 // 4, 100))
-        self.screen.blit(p2_text, p2_rect)
+        surface.blit(p2_text, p2_rect)
         
-        p2_controls = [
-            "Movimento: Setas",
-            "Ataque: K",
-            "Defesa: L",
-            "Especial: M"
-        ]
+        p2_controls = [f"{action}: {key}" for action, key in get_input_map().guide_lines(1)]
         
         for i, control in enumerate(p2_controls):
             text = self.small_font.render(control, True, (200, 200, 200))
             rect = text.get_rect(center=(self.screen.get_width() * 3 // 4, 150 + i * 30))
-            self.screen.blit(text, rect)
+            surface.blit(text, rect)
         
         # Draw back instruction
         back_text = self.font.render("Pressione ESC para voltar", True, (255, 255, 0))
         back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, 400))
-        self.screen.blit(back_text, back_rect)
+        surface.blit(back_text, back_rect)
     
     def start_game(self):
         """Inicia o jogo com os personagens selecionados"""
-        level_manager = LevelManager()
-        game = Game(
-            self.screen,
-            self.player1_class,
-            self.player2_class,
-            self.player1_name,
-            self.player2_name,
-            level_manager
-        )
-        game.run()
+        if self.preloader and not self.preloader.done:
+            self.preloader.finish(self.draw_loading_screen)
+        if self.game is None:
+            level_manager = LevelManager()
+            self.game = Game(
+                display.canvas,
+                self.player1_class,
+                self.player2_class,
+                self.player1_name,
+                self.player2_name,
+                level_manager
+            )
+        else:
+            self.game.reset(self.player1_class, self.player2_class)
+        self.game.run()
+        # The game drew over the menu
+        self.dirty = True
         return True
     
     def run(self):
+        first_frame = True
         while self.running:
-            self.handle_events()
-            self.draw()
-            pygame.time.delay(30)
+            loading = self.preloader is not None and not self.preloader.done
+            if loading:
+                self.preloader.poll()
+                # The progress bar is the menu's only animation
+                progress = self.preloader.progress
+                if progress != self.last_progress:
+                    self.last_progress = progress
+                    self.dirty = True
+            
+            # Sleep until input arrives; while loading, wake up to animate the bar
+            timeout = config.MENU_LOADING_TIMEOUT if loading else config.MENU_IDLE_TIMEOUT
+            event = pygame.event.wait(timeout)
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
+            self.handle_events(events)
+            
+            if self.dirty and self.running:
+                self.dirty = False
+                self.draw()
+                if first_frame:
+                    # O arranque termina no primeiro frame interativo do menu
+                    first_frame = False
+                    startup_profiler.mark("first menu frame")
+                    startup_profiler.finish(config.STARTUP_REPORT_PATH, config.STARTUP_TRACE_PATH)
+
+def get_render_backend():
+    """Backend de desenho: --renderer=blit|texture na linha de comandos, senão config.RENDER_BACKEND"""
+    for arg in sys.argv[1:]:
+        if arg.startswith("--renderer="):
+            return arg.split("=", 1)[1]
+    return config.RENDER_BACKEND
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((1280, 720))
-    pygame.display.set_caption("Batalha pela Queijada")
+    if "--trace" in sys.argv:
+        tracer.enable(config.TRACE_CAPACITY)
+    with startup_profiler.span("pygame.init", "init"):
+        pygame.init()
+    # Antes de se criarem fontes e Surfaces, para as contar todas
+    if "--count-draws" in sys.argv:
+        draw_counters.enable(config.DRAW_BUDGETS)
+    with startup_profiler.span("display.set_mode", "init"):
+        display.open((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), config.TITLE, get_render_backend())
+        # O menu é desenhado em software; o jogo desenha em display.canvas
+        screen = display.surface
+    
+    # Começa a descodificar as imagens do jogo enquanto o menu está aberto
+    with startup_profiler.span("preloader setup", "init"):
+        preloader = build_preloader()
+        preloader.start()
     
-    menu = Menu(screen)
+    with startup_profiler.span("Menu()", "init"):
+        menu = Menu(screen, preloader)
     menu.run()
     
+    frame_stats.export(config.FRAME_STATS_PATH)
+    tracer.dump(config.TRACE_PATH)
+    sampling_profiler.finish(config.PROFILE_PATH)
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,206 @@
+"""
+O update de uma partida em regime estável não deve alocar memória
+
+Corre Game.update sem janela (SDL_VIDEODRIVER=dummy), aquece alguns frames
+e mede cada frame seguinte:
+- com o tracemalloc, nenhuma linha dos ficheiros do jogo pode criar
+  dicionários, listas ou tuplos, mesmo que sejam libertados antes de o frame
+  acabar;
+- nenhum Rect pode ser criado e deitado fora durante o frame.
+
+Os números (float, int) que substituem atributos em cada frame não contam:
+em Python não se evitam. Também não contam as chamadas de ALLOWED_CALLS, que
+alocam dentro do pygame.
+"""
+import gc
+import linecache
+import os
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import config
+
+WARM_FRAMES = 300
+MEASURED_FRAMES = 20
+# Blocos até este tamanho são números: float (24 bytes) ou int até 2**60 (32 bytes)
+NUMBER_BLOCK_SIZE = 32
+# Chamadas que alocam dentro do pygame: get_pressed() cria um tuplo interno em cada
+# leitura e é a única forma de ler o estado do teclado sem eventos
+ALLOWED_CALLS = ("pygame.key.get_pressed()",)
+# Tuplos até este tamanho são apanhados mesmo quando vêm das listas livres
+DRAINED_TUPLE_SIZE = 8
+# Capacidade máxima das listas livres de tuplos do CPython (por tamanho)
+TUPLE_FREE_LIST = 2000
+# Chave das contagens de Rects deitados fora
+FREED_RECTS = "pygame.Rect libertados"
+
+def count_freed_rects(monkeypatch):
+    """
+    Troca pygame.Rect por uma subclasse que conta os Rects libertados
+
+    Os Rects criados com pygame.Rect(...) e os derivados deles (move, copy,
+    clip...) são desta subclasse, por isso um Rect temporário é contado quando
+    é libertado. Os criados dentro do pygame (Surface.get_rect) ficam de fora.
+
+    Returns:
+        Lista com o número de Rects libertados na posição 0
+    """
+    freed = [0]
+
+    class CountedRect(pygame.Rect):
+        __slots__ = ()
+
+        def __del__(self):
+            freed[0] += 1
+
+    monkeypatch.setattr(pygame, "Rect", CountedRect)
+    return freed
+
+def make_game(player1_class, player2_class):
+    """Partida nova sem janela visível"""
+    from core.level_manager import LevelManager
+    from core.game_core import Game
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    return Game(screen, player1_class, player2_class, "P1", "P2", LevelManager())
+
+def drain_free_lists():
+    """
+    Prepara as listas livres do CPython para um frame medido
+
+    Dicionários, listas e tuplos pequenos são reaproveitados de listas livres
+    sem passarem pelo alocador que o tracemalloc segue. Com essas listas
+    vazias, cada um criado durante o frame é um bloco novo, que continua
+    seguido depois de libertado (fica na lista livre). A lista dos floats,
+    criados em todas as contas do jogo, é enchida para eles não contarem.
+
+    Returns:
+        Objetos que mantêm as listas vazias; libertar depois do frame
+    """
+    floats = [index + 0.5 for index in range(100)]
+    del floats
+    held = []
+    for index in range(100):
+        held.append({"drain": index})
+        held.append([index])
+    for size in range(1, DRAINED_TUPLE_SIZE + 1):
+        for _ in range(TUPLE_FREE_LIST):
+            held.append(tuple(range(size)))
+    return held
+
+def blocks_by_line(snapshot):
+    """
+    Conta os blocos de um snapshot, sem os números nem as chamadas de ALLOWED_CALLS
+
+    Returns:
+        Dicionário "ficheiro:linha" → blocos
+    """
+    blocks = {}
+    for trace in snapshot.traces:
+        if trace.size <= NUMBER_BLOCK_SIZE:
+            continue
+        frame = trace.traceback[0]
+        source = linecache.getline(frame.filename, frame.lineno)
+        if any(call in source for call in ALLOWED_CALLS):
+            continue
+        line = str(frame)
+        blocks[line] = blocks.get(line, 0) + 1
+    return blocks
+
+def frame_allocations(game, freed_rects):
+    """
+    Aquece uma partida e conta as alocações de cada frame medido
+
+    Args:
+        game: Partida criada depois de count_freed_rects
+        freed_rects: Lista devolvida por count_freed_rects
+
+    Returns:
+        Dicionário "ficheiro:linha" (ou FREED_RECTS) → blocos criados nos frames medidos
+    """
+    # Aquece depois da contagem inicial, para o update dos jogadores também correr
+    for _ in range(game.start_delay + 1 + WARM_FRAMES):
+        game.update()
+    # O próximo nível é construído quando a pré-carga acaba; isso não é regime estável
+    level_manager = game.level_manager
+    if level_manager.prefetcher is not None:
+        level_manager.prefetcher.finish()
+        level_manager.update()
+    assert game.game_started
+    # Ciclos deixados pelas partidas anteriores não podem ser recolhidos a meio da medição
+    gc.collect()
+
+    filters = [tracemalloc.Filter(True, os.path.join(GAME_DIR, "*"))]
+    allocations = {}
+    tracemalloc.start()
+    try:
+        for _ in range(MEASURED_FRAMES):
+            held = drain_free_lists()
+            rects = freed_rects[0]
+            before = tracemalloc.take_snapshot()
+            game.update()
+            after = tracemalloc.take_snapshot()
+            rects = freed_rects[0] - rects
+            del held
+            # Contados só depois dos dois snapshots, para as contagens não entrarem no segundo
+            before = blocks_by_line(before.filter_traces(filters))
+            after = blocks_by_line(after.filter_traces(filters))
+            for line, count in after.items():
+                if count > before.get(line, 0):
+                    allocations[line] = allocations.get(line, 0) + count - before.get(line, 0)
+            if rects:
+                allocations[FREED_RECTS] = allocations.get(FREED_RECTS, 0) + rects
+    finally:
+        tracemalloc.stop()
+    return allocations
+
+def setup_pygame(monkeypatch):
+    """Prepara o pygame e os Rects contados; devolve a lista de count_freed_rects"""
+    # Os caminhos das imagens são relativos à pasta do jogo
+    monkeypatch.chdir(GAME_DIR)
+    random.seed(0)
+    pygame.init()
+    return count_freed_rects(monkeypatch)
+
+def test_steady_state_update_allocates_nothing(monkeypatch):
+    freed_rects = setup_pygame(monkeypatch)
+    try:
+        for player1_class, player2_class in ((0, 1), (1, 2), (2, 0)):
+            allocations = frame_allocations(make_game(player1_class, player2_class), freed_rects)
+            assert not allocations, "\n".join(f"{line}: {count} blocos" for line, count in sorted(allocations.items()))
+    finally:
+        pygame.quit()
+
+# Alocações feitas de propósito em cada frame, que o teste tem de apanhar
+INJECTED = {
+    "dict": lambda game: {"x": 1},
+    "tuple": lambda game: (game.current_time, game.current_time),
+    "rect": lambda game: game.player1.rect.move(1, 0),
+}
+
+@pytest.mark.parametrize("name", sorted(INJECTED))
+def test_injected_per_frame_allocation_is_detected(monkeypatch, name):
+    freed_rects = setup_pygame(monkeypatch)
+    try:
+        game = make_game(0, 1)
+        update = game.update
+        allocate = INJECTED[name]
+
+        def update_and_allocate():
+            update()
+            allocate(game)
+
+        game.update = update_and_allocate
+        allocations = frame_allocations(game, freed_rects)
+        counts = [count for line, count in allocations.items() if line.startswith(__file__) or line == FREED_RECTS]
+        assert counts and max(counts) >= MEASURED_FRAMES, allocations
+    finally:
+        pygame.quit()
@@ -0,0 +1,114 @@
+"""
+Os frames de uma partida ficam dentro dos orçamentos de desenho (config.DRAW_BUDGETS)
+
+Liga as contagens de desenho sem janela visível (SDL_VIDEODRIVER=dummy), joga
+uma partida com teclas aleatórias e o painel de desempenho (F3) visível, e
+verifica que nenhuma zona passou do orçamento depois do aquecimento (o
+primeiro frame do HUD renderiza todos os textos de uma vez).
+"""
+import copy
+import os
+import random
+import sys
+from collections import OrderedDict
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import config
+
+# Frames depois da contagem inicial antes de medir
+WARM_FRAMES = 10
+MEASURED_FRAMES = 240
+# Frames entre mudanças das teclas carregadas
+KEY_HOLD_FRAMES = 6
+
+class RandomKeys:
+    """Estado do teclado devolvido por pygame.key.get_pressed, com teclas aleatórias"""
+    def __init__(self, key_codes, rng):
+        self.key_codes = key_codes
+        self.rng = rng
+        self.down = set()
+
+    def shuffle(self):
+        """Carrega cerca de um quinto das teclas dos jogadores"""
+        self.down = {key for key in self.key_codes if self.rng.random() < 0.2}
+
+    def __getitem__(self, key):
+        return key in self.down
+
+def enable_counters(monkeypatch):
+    """
+    Liga as contagens de desenho só durante o teste
+
+    enable() substitui pygame.Surface, pygame.font.Font e algumas funções de
+    pygame.transform, e guarda as contagens no draw_counters partilhado; o
+    monkeypatch repõe tudo no fim. As fontes em cache são criadas de novo
+    para os textos serem contados.
+
+    Returns:
+        draw_counters ligado com config.DRAW_BUDGETS
+    """
+    from assets.asset_manager import asset_manager
+    from utils.draw_counters import draw_counters
+    monkeypatch.setattr(pygame, "Surface", pygame.Surface)
+    monkeypatch.setattr(pygame.font, "Font", pygame.font.Font)
+    for name in ("scale", "smoothscale", "flip", "chop"):
+        monkeypatch.setattr(pygame.transform, name, getattr(pygame.transform, name))
+    for name, value in list(vars(draw_counters).items()):
+        monkeypatch.setattr(draw_counters, name, copy.copy(value))
+    monkeypatch.setattr(asset_manager, "fonts", OrderedDict())
+    draw_counters.enable(config.DRAW_BUDGETS)
+    return draw_counters
+
+def test_frames_stay_within_draw_budgets(monkeypatch):
+    monkeypatch.chdir(GAME_DIR)
+    random.seed(0)
+    pygame.init()
+    draw_counters = enable_counters(monkeypatch)
+    try:
+        from core.display import display
+        from core.level_manager import LevelManager
+        from core.game_core import Game
+        canvas = display.open((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), "teste", "blit")
+        for player1_class, player2_class in ((0, 1), (1, 2), (2, 0)):
+            game = Game(canvas, player1_class, player2_class, "P1", "P2", LevelManager())
+            # Sem mudanças de qualidade a meio, que dependem do tempo de cada frame
+            game.quality.enabled = False
+            game.perf_overlay.toggle()
+            keys = RandomKeys(sorted({key for key, _, _ in game.input_map.key_table}), random.Random(1))
+            monkeypatch.setattr(pygame.key, "get_pressed", lambda: keys)
+
+            warm_frames = game.start_delay + 1 + WARM_FRAMES
+            for frame in range(warm_frames + MEASURED_FRAMES):
+                if frame == warm_frames:
+                    draw_counters.overruns.clear()
+                    draw_counters.maxima.clear()
+                if frame % KEY_HOLD_FRAMES == 0:
+                    keys.shuffle()
+                game.update()
+                game.render()
+                display.present()
+                draw_counters.end_frame()
+
+            assert not draw_counters.budget_overruns(), draw_counters.budget_overruns()
+    finally:
+        pygame.quit()
+
+def test_perf_overlay_reuses_its_surface(monkeypatch):
+    monkeypatch.chdir(GAME_DIR)
+    pygame.init()
+    try:
+        from core.level_manager import LevelManager
+        from core.game_core import Game
+        screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        overlay = Game(screen, 0, 1, "P1", "P2", LevelManager()).perf_overlay
+        overlay.render()
+        surface = overlay.surface
+        overlay.render()
+        assert overlay.surface is surface
+    finally:
+        pygame.quit()
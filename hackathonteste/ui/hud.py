@@ -1,34 +1,58 @@
 import pygame
 from entities.characters import Fighter, Mage, Rogue
+from core.controls import get_input_map
+from assets.asset_manager import asset_manager
+from ui.widgets import Label, Icon, Bar, IconRow, Panel, render_counts
 
 class HUD:
+    HUD_BASE = "./imagens_characters/SirLobo_Pack_HUD_2021_ONLY_PNG/HUD/Modulated/8"
+    HEART_PATH = "./imagens_characters/heart.png"
+    CHARACTER_TYPES = ("Knight", "Mage", "Rogue")
+    # Tamanho do painel de cada jogador (nome, barras, corações e retrato)
+    PANEL_SIZE = (280, 105)
+    # Cor da barra de recurso: mana, stamina e energia
+    RESOURCE_COLORS = {"Knight": (255, 255, 0), "Mage": (0, 100, 255), "Rogue": (0, 255, 0)}
+    
+    @classmethod
+    def portrait_path(cls, character_type):
+        """Caminho do retrato de um tipo de personagem"""
+        return f"./imagens_characters/PNG/{character_type}/frame_{character_type.lower()}.png"
+    
+    @classmethod
+    def asset_paths(cls):
+        """Caminhos de todas as imagens usadas pelo HUD"""
+        paths = [f"{cls.HUD_BASE}/hp_bar.png", f"{cls.HUD_BASE}/mp_bar.png", cls.HEART_PATH]
+        paths.extend(cls.portrait_path(character_type) for character_type in cls.CHARACTER_TYPES)
+        return paths
+    
     def __init__(self, game):
         self.game = game
         self.screen = game.screen
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.tiny_font = pygame.font.Font(None, 20)
+        self.panel_frames = {}
+        self.resource_fills = {}
+        # Guia de controles desenhado: (personagens e teclas, surface)
+        self.controls_guide = None
+        # Guia translúcido; o governador de qualidade desenha-o opaco em máquinas lentas
+        self.guide_translucent = True
         self.load_assets()
+        self.widgets = self.build_widgets()
     
     def load_assets(self):
         """Carrega todos os assets do HUD"""
-        hud_base = "./imagens_characters/SirLobo_Pack_HUD_2021_ONLY_PNG/HUD/Modulated/8"
         try:
-            self.hp_bar = pygame.image.load(f"{hud_base}/hp_bar.png").convert_alpha()
-            self.hp_bar = pygame.transform.scale(self.hp_bar, (200, 10))
-            
-            self.mp_bar = pygame.image.load(f"{hud_base}/mp_bar.png").convert_alpha()
-            self.mp_bar = pygame.transform.scale(self.mp_bar, (200, 10))
+            self.hp_bar = asset_manager.load_image(f"{self.HUD_BASE}/hp_bar.png", True, (200, 10))
+            self.mp_bar = asset_manager.load_image(f"{self.HUD_BASE}/mp_bar.png", True, (200, 10))
             
             # Load heart image
-            self.heart_image = pygame.image.load("./imagens_characters/heart.png").convert_alpha()
-            self.heart_image = pygame.transform.scale(self.heart_image, (15, 15))
+            self.heart_image = asset_manager.load_image(self.HEART_PATH, True, (15, 15))
             
             # Load character portraits
             self.portraits = {
-                "Knight": self.load_character_portrait("Knight"),
-                "Mage": self.load_character_portrait("Mage"),
-                "Rogue": self.load_character_portrait("Rogue")
+                character_type: self.load_character_portrait(character_type)
+                for character_type in self.CHARACTER_TYPES
             }
         except Exception as e:
             print(f"Error loading HUD assets: {str(e)}")
@@ -40,153 +64,193 @@ class HUD:
     def load_character_portrait(self, character_type):
         """Carrega o retrato do personagem"""
         try:
-            image_path = f"./imagens_characters/PNG/{character_type}/frame_{character_type.lower()}.png"
-            image = pygame.image.load(image_path).convert_alpha()
-            return pygame.transform.scale(image, (80, 80))
+            return asset_manager.load_image(self.portrait_path(character_type), True, (80, 80))
         except Exception as e:
             print(f"Error loading portrait for {character_type}: {str(e)}")
             return None
     
-    def draw(self):
-        """Desenha todo o HUD"""
-        # Draw time remaining
-        minutes = self.game.current_time // (60 * 60)
-        seconds = (self.game.current_time // 60) % 60
-        time_text = f"Tempo: {minutes:02d}:{seconds:02d}"
-        time_surface = self.font.render(time_text, True, (255, 255, 255))
-        time_x = self.screen.get_width()//2 - time_surface.get_width()//2
-        self.screen.blit(time_surface, (time_x, 20))
+    def build_widgets(self):
+        """
+        Cria a árvore de widgets do HUD, ligada ao estado do jogo
         
-        # Draw level info below time
-        level_text = f"Nível {self.game.level_manager.current_level + 1}/5"
-        level_surface = self.font.render(level_text, True, (255, 255, 0))
-        level_x = self.screen.get_width()//2 - level_surface.get_width()//2
-        self.screen.blit(level_surface, (level_x, 60))
+        Returns:
+            Lista de widgets de topo, pela ordem de desenho
+        """
+        game = self.game
+        center_x = lambda y: lambda surface: (self.screen.get_width()//2 - surface.get_width()//2, y)
+        widgets = [
+            # Tempo restante; o texto só muda uma vez por segundo
+            Label("tempo", self.font, lambda: "Tempo: {:02d}:{:02d}".format(
+                game.current_time // (60 * 60), (game.current_time // 60) % 60), pos=center_x(20)),
+            # Nível abaixo do tempo
+            Label("nivel", self.font, lambda: f"Nível {game.level_manager.current_level + 1}/5",
+                  (255, 255, 0), pos=center_x(60))
+        ]
         
-        # Draw player HUDs
         if self.hp_bar and self.mp_bar and self.heart_image:
-            # Player 1 HUD (left side)
-            self.draw_player_hud(
-                self.game.player1,
-                10,  # x position
-                10,  # y position
-                False  # not flipped
-            )
-            
-            # Player 2 HUD (right side)
-            self.draw_player_hud(
-                self.game.player2,
-                self.screen.get_width() - 310,  # x position
-                10,  # y position
-                True  # flipped
-            )
+            widgets.append(self.build_player_panel("jogador1", lambda: game.player1, (10, 10), False))
+            widgets.append(self.build_player_panel(
+                "jogador2", lambda: game.player2, lambda surface: (self.screen.get_width() - 310, 10), True))
         
-        # Draw damage percentages
-        self.draw_damage_percentage(self.game.player1)
-        self.draw_damage_percentage(self.game.player2)
+        widgets.extend(self.build_damage_labels("jogador1", lambda: game.player1))
+        widgets.extend(self.build_damage_labels("jogador2", lambda: game.player2))
+        return widgets
     
-    def draw_player_hud(self, player, x, y, flip):
-        """Desenha os elementos do HUD para um jogador"""
-        # Get character type and portrait
-        char_type = "Knight" if isinstance(player, Fighter) else "Mage" if isinstance(player, Mage) else "Rogue"
-        portrait = self.portraits.get(char_type)
+    def build_player_panel(self, name, get_player, pos, flip):
+        """
+        Cria o painel de um jogador (percentagem, barras, corações, nome e retrato)
         
-        # Draw player name
-        name_x = x + (10 if flip else 10)
-        name_surface = self.small_font.render(player.name, True, (255, 255, 255))
-        self.screen.blit(name_surface, (name_x, y + 15))
+        Args:
+            name: Prefixo dos nomes dos widgets
+            get_player: Função que devolve a personagem atual do jogador
+            pos: Posição do painel
+            flip: Se o retrato é espelhado (jogador 2)
         
-        # Draw percentage
-        percentage_text = f"{int(player.health)}%"
-        percentage_color = (255, max(0, 255 - (player.health * 1.5)), max(0, 255 - (player.health * 1.5)))
-        percentage_surface = self.small_font.render(percentage_text, True, percentage_color)
-        percentage_x = x + (10 if flip else 10)
-        self.screen.blit(percentage_surface, (percentage_x, y + 35))
+        Returns:
+            Panel com os widgets do jogador
+        """
+        def percentage():
+            health = get_player().health
+            return f"{int(health)}%", (255, max(0, 255 - (health * 1.5)), max(0, 255 - (health * 1.5)))
         
-        # Calculate bar positions
-        bar_x = x + (10 if flip else 10)
-        hp_y = y + 55
-        mp_y = y + 75
+        def hp_bar():
+            player = get_player()
+            return self.hp_bar, int((1 - player.health/player.max_health) * 200)
         
-        # Draw HP bar
-        hp_width = int((1 - player.health/player.max_health) * 200)  # Reduzido para 200px
-        if hp_width > 0:
-            hp_rect = pygame.Rect(bar_x, hp_y, hp_width, 10)  # Altura reduzida para 10px
-            hp_surf = pygame.transform.chop(self.hp_bar, (hp_width, 0, 200-hp_width, 0))
-            self.screen.blit(hp_surf, hp_rect)
+        def resource_bar():
+            player = get_player()
+            char_type = self.character_type(player)
+            return self.get_resource_fill(char_type), int(self.resource_level(player) * 200)
         
-        # Draw MP/Stamina/Energy bar
-        mp_bar_scaled = pygame.transform.scale(self.mp_bar, (200, 10))  # Redimensionado para 200x10
-        self.screen.blit(mp_bar_scaled, (bar_x, mp_y))
-        
-        # Desenha nível atual de mana/stamina/energy
-        mp_level = 0
-        if isinstance(player, Mage):
-            mp_level = (player.mana / player.max_mana) * 200
-            mp_color = (0, 100, 255)  # Azul para mana
-        elif isinstance(player, Fighter):
-            mp_level = (player.stamina / player.max_stamina) * 200
-            mp_color = (255, 255, 0)  # Amarelo para stamina
-        elif isinstance(player, Rogue):
-            mp_level = (player.energy / player.max_energy) * 200
-            mp_color = (0, 255, 0)  # Verde para energia
-        else:
-            mp_level = 0  # Para outros personagens
+        def lives():
+            # Usar as vidas do Game em vez das vidas do player
+            return self.game.player1_lives if get_player() == self.game.player1 else self.game.player2_lives
         
-        if mp_level > 0:
-            pygame.draw.rect(self.screen, mp_color, (bar_x, mp_y, mp_level, 10))
+        def frame():
+            player = get_player()
+            return self.get_panel_frame(self.character_type(player), player.name, flip)
         
-        # Draw hearts for lives
-        heart_start_x = x + (10 if flip else 10)
-        heart_y = y + 90
+        return Panel(name, self.PANEL_SIZE, [
+            Label(f"{name}.percentagem", self.small_font, percentage, pos=(10, 35)),
+            Bar(f"{name}.hp", hp_bar, pos=(10, 55)),
+            Icon(f"{name}.fundo_recurso", lambda: self.mp_bar, pos=(10, 75)),
+            Bar(f"{name}.recurso", resource_bar, pos=(10, 75)),
+            IconRow(f"{name}.vidas", self.heart_image, lives, 20, pos=(10, 90)),
+            # Nome e retrato por cima do fim das barras
+            Icon(f"{name}.retrato", frame)
+        ], pos)
+    
+    def build_damage_labels(self, name, get_player):
+        """
+        Cria a percentagem de dano e o nome que seguem a personagem
         
-        # Usar as vidas do Game em vez das vidas do player
-        lives_to_show = self.game.player1_lives if player == self.game.player1 else self.game.player2_lives
-        for i in range(lives_to_show):
-            heart_x = heart_start_x + (i * 20)  # Reduzido espaçamento para 20px
-            self.screen.blit(self.heart_image, (heart_x, heart_y))
+        Args:
+            name: Prefixo dos nomes dos widgets
+            get_player: Função que devolve a personagem atual do jogador
         
-        # Draw character portrait on the right
-        if portrait:
-            portrait_x = x + (200 if flip else 200)  # Moved to the right
-            portrait_y = y + 10
-            portrait_size = 80
-            portrait_flipped = pygame.transform.flip(portrait, flip, False)
-            self.screen.blit(portrait_flipped, (portrait_x, portrait_y))
-    
-    def draw_damage_percentage(self, player):
-        """Desenha a porcentagem de dano e o nome acima do jogador"""
-        # Cores baseadas na porcentagem de dano (verde para baixo, vermelho para alto)
-        damage_pct = player.health / player.max_health if player.max_health > 0 else 0
-        # Cor gradiente de verde para vermelho baseado no dano
-        r = min(255, int(255 * damage_pct * 2))
-        g = min(255, int(255 * (1 - damage_pct)))
-        color = (r, g, 0)
+        Returns:
+            Lista (nome, percentagem); só a posição muda a cada frame
+        """
+        def damage():
+            player = get_player()
+            # Cor gradiente de verde para vermelho baseado no dano
+            damage_pct = player.health / player.max_health if player.max_health > 0 else 0
+            r = min(255, int(255 * damage_pct * 2))
+            g = min(255, int(255 * (1 - damage_pct)))
+            return f"{int(player.health)}%", (r, g, 0)
         
-        # Renderiza o texto com a porcentagem de dano (sem fundo)
-        damage_text = self.small_font.render(f"{int(player.health)}%", True, color)
+        # Percentagem 10 píxeis acima do jogador, nome 5 píxeis acima da percentagem
+        def damage_pos(surface):
+            rect = get_player().rect
+            return rect.centerx - surface.get_width() // 2, rect.y - surface.get_height() - 10
         
-        # Renderiza o nome do jogador
-        name_text = self.small_font.render(f"{player.name}", True, (255, 255, 255))
+        def name_pos(surface):
+            rect = get_player().rect
+            damage_y = rect.y - damage_label.surface.get_height() - 10
+            return rect.centerx - surface.get_width() // 2, damage_y - surface.get_height() - 5
         
-        # Posiciona o texto acima do jogador
-        damage_x = player.rect.centerx - damage_text.get_width() // 2
-        damage_y = player.rect.y - damage_text.get_height() - 10  # 10 pixels acima do jogador
+        damage_label = Label(f"{name}.dano", self.small_font, damage, pos=damage_pos)
+        name_label = Label(f"{name}.nome", self.small_font, lambda: get_player().name, pos=name_pos)
+        return [damage_label, name_label]
+    
+    @staticmethod
+    def character_type(player):
+        """Tipo de personagem usado no retrato e na cor do recurso"""
+        return "Knight" if isinstance(player, Fighter) else "Mage" if isinstance(player, Mage) else "Rogue"
+    
+    @staticmethod
+    def resource_level(player):
+        """Fração de mana/stamina/energia do jogador (0 para outros personagens)"""
+        if isinstance(player, Mage):
+            return player.mana / player.max_mana
+        if isinstance(player, Fighter):
+            return player.stamina / player.max_stamina
+        if isinstance(player, Rogue):
+            return player.energy / player.max_energy
+        return 0
+    
+    def draw(self):
+        """Desenha todo o HUD; cada widget só é redesenhado quando o seu valor muda"""
+        for widget in self.widgets:
+            widget.draw(self.screen)
+    
+    def get_render_counts(self):
+        """Número de vezes que cada widget do HUD foi desenhado"""
+        return render_counts(self.widgets)
+    
+    def get_panel_frame(self, char_type, name, flip):
+        """
+        Retorna a camada fixa do painel (nome e retrato), criada uma vez por jogador
         
-        # Posiciona o nome acima da porcentagem
-        name_x = player.rect.centerx - name_text.get_width() // 2
-        name_y = damage_y - name_text.get_height() - 5  # 5 pixels acima da porcentagem
+        Args:
+            char_type: Tipo de personagem ("Knight", "Mage" ou "Rogue")
+            name: Nome do jogador
+            flip: Se o retrato é espelhado (jogador 2)
         
-        # Desenha os textos (sem fundo)
-        self.screen.blit(name_text, (name_x, name_y))
-        self.screen.blit(damage_text, (damage_x, damage_y))
+        Returns:
+            Surface com transparência do tamanho do painel
+        """
+        key = (char_type, name, flip)
+        frame = self.panel_frames.get(key)
+        if frame is None:
+            frame = pygame.Surface(self.PANEL_SIZE, pygame.SRCALPHA)
+            frame.blit(self.small_font.render(name, True, (255, 255, 255)), (10, 15))
+            
+            # Retrato à direita, por cima do fim das barras
+            portrait = self.portraits.get(char_type)
+            if portrait:
+                frame.blit(pygame.transform.flip(portrait, flip, False), (200, 10))
+            self.panel_frames[key] = frame
+        return frame
+    
+    def get_resource_fill(self, char_type):
+        """Retorna a barra de recurso cheia (200x10) na cor do tipo de personagem"""
+        fill = self.resource_fills.get(char_type)
+        if fill is None:
+            fill = pygame.Surface((200, 10))
+            fill.fill(self.RESOURCE_COLORS[char_type])
+            self.resource_fills[char_type] = fill
+        return fill
     
     def draw_controls_guide(self):
         """Desenha o guia de controles com novas habilidades"""
+        controls_surface = self.get_controls_guide()
+        controls_surface.set_alpha(self.game.controls_alpha if self.guide_translucent else None)
+        
+        # Draw the controls surface on the chosen side
+        x_pos = 10 if self.game.controls_position == "left" else self.screen.get_width() - 260
+        self.screen.blit(controls_surface, (x_pos, 40))  # Moved up to 80 from 200
+    
+    def get_controls_guide(self):
+        """Retorna o guia de controles desenhado, refeito só quando as personagens mudam"""
+        # As teclas são compiladas uma vez no arranque, por isso só as personagens mudam o guia
+        guide_key = (type(self.game.player1), type(self.game.player2))
+        if self.controls_guide is not None and self.controls_guide[0] == guide_key:
+            return self.controls_guide[1]
+        
         # Create semi-transparent overlay for controls
         controls_surface = pygame.Surface((250, 800))  # Increased height from 400 to 600
         controls_surface.fill((0, 0, 0))
-        controls_surface.set_alpha(self.game.controls_alpha)
         
         # Calculate positions
         margin = 10
@@ -212,15 +276,8 @@ class HUD:
             class_name = "Cavaleiro" if isinstance(player, Fighter) else "Mago" if isinstance(player, Mage) else "Assasino"
             y = draw_control_line(f"Jogador {player_num} - {class_name}:", y, (255, 215, 0))
             
-            # Movement
-            controls = {
-                "Movimento": "WASD" if player_num == 1 else "Setas",
-                "Ataque": "F" if player_num == 1 else "K",
-                "Defesa": "G" if player_num == 1 else "L",
-                "Especial": "H" if player_num == 1 else "M"
-            }
-            
-            for action, key in controls.items():
+            # Movement and actions, from the key bindings
+            for action, key in get_input_map().guide_lines(player_num - 1):
                 y = draw_control_line(f"{action}: {key}", y)
             
             # Special abilities based on character class
@@ -273,9 +330,8 @@ class HUD:
             
             y += margin  # Add space between players
         
-        # Draw the controls surface on the chosen side
-        x_pos = 10 if self.game.controls_position == "left" else self.screen.get_width() - 260
-        self.screen.blit(controls_surface, (x_pos, 40))  # Moved up to 80 from 200
+        self.controls_guide = (guide_key, controls_surface)
+        return controls_surface
     
     def draw_game_over(self):
         """Desenha a tela de fim de jogo"""
@@ -0,0 +1,82 @@
+import math
+import pygame
+from assets.asset_manager import asset_manager
+from core.display import display
+from utils.sampler import sampling_profiler
+from utils.draw_counters import draw_counters
+
+class PerfOverlay:
+    """Painel de desempenho (F3): FPS e estado da cache de imagens"""
+    # Frames entre atualizações do texto, para o painel não pesar no próprio frame
+    REFRESH_FRAMES = 30
+    # Largura arredondada a este passo, para a Surface não ser recriada sempre que um número muda
+    WIDTH_STEP = 32
+    
+    def __init__(self, game):
+        self.game = game
+        self.screen = game.screen
+        self.font = pygame.font.Font(None, 20)
+        self.visible = False
+        self.refresh_timer = 0
+        self.surface = None
+    
+    def toggle(self):
+        """Mostra ou esconde o painel"""
+        self.visible = not self.visible
+        self.refresh_timer = 0
+    
+    def get_lines(self):
+        """Linhas de texto mostradas no painel"""
+        clock = self.game.clock
+        stats = asset_manager.get_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = 100 * stats["hits"] / lookups if lookups else 0
+        hud_counts = self.game.hud.get_render_counts()
+        busiest = max(hud_counts, key=hud_counts.get)
+        render = display.get_stats()
+        lines = [
+            f"FPS: {clock.get_fps():.1f} ({clock.get_rawtime()} ms)",
+            f"Qualidade: {self.game.quality.settings['name']} ({self.game.quality.average():.1f} ms)",
+            f"Frames saltados: {self.game.skipped_draws}  ticks perdidos: {self.game.lost_ticks}",
+            # Só a cache de imagens: as superfícies desenhadas no código não contam
+            f"Cache de imagens: {stats['images']}  {stats['resident_bytes'] / 2**20:.1f}/{stats['budget'] / 2**20:.0f} MB",
+            f"Cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.0f}%)",
+            f"Libertadas: {stats['evictions']}",
+            f"HUD: {sum(hud_counts.values())} desenhos ({busiest}: {hud_counts[busiest]})",
+            f"Render: {render['backend']}  {render['textures']} texturas, {render['uploads']} envios"
+        ]
+        if draw_counters.enabled:
+            totals = draw_counters.frame_totals()
+            lines.append(f"Frame: {totals['surfaces']} Surfaces, {totals['transforms']} transforms, "
+                         f"{totals['fonts']} textos, {totals['blits']} blits ({totals['pixels'] / 1e6:.2f} Mpx)")
+            for name, counts in sorted(draw_counters.last_frame.items()):
+                surfaces, transforms, fonts, blits, pixels = counts
+                lines.append(f"  {name}: {surfaces}/{transforms}/{fonts}  {blits} blits ({pixels / 1e3:.0f} kpx)")
+            for name, metric, frames, maximum, limit in draw_counters.budget_overruns():
+                lines.append(f"  Acima do orçamento: {name} {metric} em {frames} frames (máx. {maximum}, limite {limit})")
+        if sampling_profiler.running:
+            lines.append(f"Perfil: a amostrar ({sampling_profiler.samples} amostras, F6 para parar)")
+        return lines
+    
+    def render(self):
+        """Desenha o texto do painel numa superfície reaproveitada entre frames (recriada só se o tamanho mudar)"""
+        lines = [self.font.render(line, True, (255, 255, 255)) for line in self.get_lines()]
+        width = math.ceil((max(line.get_width() for line in lines) + 12) / self.WIDTH_STEP) * self.WIDTH_STEP
+        height = len(lines) * 18 + 8
+        if self.surface is None or self.surface.get_size() != (width, height):
+            self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            self.surface.blit(line, (6, 4 + i * 18))
+        # Redesenhada no lugar: o backend por texturas tem de voltar a enviar os píxeis
+        display.invalidate(self.surface)
+    
+    def draw(self):
+        """Desenha o painel no canto inferior esquerdo"""
+        if not self.visible:
+            return
+        if self.refresh_timer <= 0:
+            self.render()
+            self.refresh_timer = self.REFRESH_FRAMES
+        self.refresh_timer -= 1
+        self.screen.blit(self.surface, (10, self.screen.get_height() - self.surface.get_height() - 10))
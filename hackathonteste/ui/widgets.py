@@ -0,0 +1,167 @@
+"""
+Widgets do HUD em modo retido
+
+Cada widget está ligado a uma função que devolve o valor que mostra e
+guarda a superfície desenhada; só volta a desenhar quando esse valor muda.
+A posição é calculada em cada frame, por isso um texto que segue a
+personagem não é redesenhado enquanto o conteúdo for o mesmo.
+"""
+import pygame
+from core.display import display
+
+# Valor inicial que nunca é igual a um valor ligado, para forçar o primeiro desenho
+_UNSET = object()
+
+class Widget:
+    """
+    Base dos widgets: valor ligado, superfície em cache e contador de desenhos
+    """
+    def __init__(self, name, source=None, pos=(0, 0)):
+        """
+        Args:
+            name: Nome do widget (usado nas contagens de desenhos)
+            source: Função sem argumentos que devolve o valor mostrado
+            pos: Posição (x, y) ou função que recebe a superfície e devolve a posição
+        """
+        self.name = name
+        self.source = source
+        self.pos = pos
+        self.value = _UNSET
+        self.surface = None
+        self.render_count = 0
+
+    def update(self):
+        """
+        Lê o valor ligado e redesenha se mudou
+
+        Returns:
+            True se o widget foi redesenhado
+        """
+        value = self.source() if self.source else None
+        if value == self.value:
+            return False
+        self.value = value
+        self.surface = self.render(value)
+        self.render_count += 1
+        return True
+
+    def render(self, value):
+        """
+        Desenha o widget para um valor
+
+        Args:
+            value: Valor ligado
+
+        Returns:
+            Surface, ou None se não houver nada para mostrar
+        """
+        raise NotImplementedError
+
+    def position(self):
+        """Posição atual do widget"""
+        return self.pos(self.surface) if callable(self.pos) else self.pos
+
+    def draw(self, surface):
+        """
+        Atualiza o widget e desenha-o
+
+        Args:
+            surface: Superfície de destino
+        """
+        self.update()
+        if self.surface is not None:
+            surface.blit(self.surface, self.position())
+
+    def walk(self):
+        """Percorre este widget e os seus filhos"""
+        yield self
+
+class Label(Widget):
+    """Texto numa fonte; o valor é o texto ou uma tupla (texto, cor)"""
+    def __init__(self, name, font, source, color=(255, 255, 255), pos=(0, 0)):
+        super().__init__(name, source, pos)
+        self.font = font
+        self.color = color
+
+    def render(self, value):
+        text, color = value if isinstance(value, tuple) else (value, self.color)
+        return self.font.render(text, True, color)
+
+class Icon(Widget):
+    """Imagem devolvida pela função ligada (None esconde o ícone)"""
+    def render(self, value):
+        return value
+
+class Bar(Widget):
+    """
+    Barra horizontal; o valor é uma tupla (imagem, largura)
+
+    Mostra a parte esquerda da imagem com uma subsurface, por isso não copia píxeis.
+    """
+    def render(self, value):
+        image, width = value
+        width = max(0, min(int(width), image.get_width()))
+        if width == 0:
+            return None
+        return image.subsurface((0, 0, width, image.get_height()))
+
+class IconRow(Widget):
+    """Fila de ícones iguais; o valor é o número de ícones"""
+    def __init__(self, name, icon, source, spacing, pos=(0, 0)):
+        super().__init__(name, source, pos)
+        self.icon = icon
+        self.spacing = spacing
+
+    def render(self, count):
+        if count <= 0:
+            return None
+        width = self.spacing * (count - 1) + self.icon.get_width()
+        surface = pygame.Surface((width, self.icon.get_height()), pygame.SRCALPHA)
+        surface.blits([(self.icon, (i * self.spacing, 0)) for i in range(count)], doreturn=False)
+        return surface
+
+class Panel(Widget):
+    """
+    Grupo de widgets compostos numa única superfície
+
+    Os filhos são desenhados por ordem, com posições relativas ao painel; o
+    painel só é recomposto quando algum filho foi redesenhado, sempre na
+    mesma superfície.
+    """
+    def __init__(self, name, size, children, pos=(0, 0)):
+        super().__init__(name, None, pos)
+        self.size = size
+        self.children = children
+
+    def update(self):
+        changed = [child.update() for child in self.children]
+        if self.surface is not None and not any(changed):
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        else:
+            self.surface.fill((0, 0, 0, 0))
+        for child in self.children:
+            if child.surface is not None:
+                self.surface.blit(child.surface, child.position())
+        # Redesenhado no lugar: o backend por texturas tem de voltar a enviar os píxeis
+        display.invalidate(self.surface)
+        self.render_count += 1
+        return True
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+def render_counts(widgets):
+    """
+    Conta os desenhos de cada widget de uma árvore
+
+    Args:
+        widgets: Lista de widgets de topo
+
+    Returns:
+        Dicionário nome → número de vezes que o widget foi desenhado
+    """
+    return {widget.name: widget.render_count for root in widgets for widget in root.walk()}
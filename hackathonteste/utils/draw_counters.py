@@ -0,0 +1,285 @@
+"""
+Contadores de alocações e desenhos por frame
+
+Ativado com `python main.py --count-draws`. Conta, em cada frame e por zona
+do código (Level.draw, Character.draw, draw_effects, FireProjectile.draw,
+HUD...), as Surfaces criadas, as chamadas a pygame.transform (scale,
+smoothscale, flip, chop), os Font.render, os blits e a área copiada, e
+compara-as com um orçamento por zona e por frame (config.DRAW_BUDGETS).
+
+As Surfaces, as fontes e as transformações são contadas substituindo
+pygame.Surface, pygame.font.Font e as funções de pygame.transform, por isso
+o modo tem de ser ligado antes de se criar qualquer fonte. Os blits são
+contados em CountingCanvas à volta da superfície interna do mundo
+(RenderTarget.canvas) e do ecrã do HUD, por isso o frame contado é desenhado
+como o normal, à resolução interna.
+"""
+import threading
+import pygame
+from core.display import draw_rect, draw_circle
+from utils.startup_profiler import NULL_SPAN
+
+# Métricas por zona, pela ordem das listas de contagem
+METRICS = ("surfaces", "transforms", "fonts", "blits", "pixels")
+_SURFACES, _TRANSFORMS, _FONTS, _BLITS, _PIXELS = range(len(METRICS))
+
+# Zona das contagens fora de qualquer zona marcada
+OTHER_SITE = "outros"
+
+class _CountedType(type):
+    """Metaclasse que mantém isinstance(x, pygame.Surface) verdadeiro para as Surfaces normais"""
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls.__mro__[1])
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, cls.__mro__[1])
+
+class _Site:
+    """Zona do código com nome fixo; reaproveitada em todas as chamadas com esse nome"""
+    def __init__(self, counters, name):
+        self.counters = counters
+        self.name = name
+
+    def __enter__(self):
+        self.counters.stack.append(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.counters.stack.pop()
+        return False
+
+class CountingCanvas:
+    """
+    Destino de desenho que conta os blits e a área copiada antes de os passar ao destino real
+
+    Tem a mesma interface de desenho que o TextureCanvas, por isso o jogo
+    desenha nele como em qualquer outro backend.
+    """
+    def __init__(self, target, counters):
+        """
+        Args:
+            target: Ecrã ou TextureCanvas onde o jogo desenha
+            counters: DrawCounters que recebe as contagens
+        """
+        self.target = target
+        self.counters = counters
+
+    def get_size(self):
+        return self.target.get_size()
+
+    def get_width(self):
+        return self.target.get_width()
+
+    def get_height(self):
+        return self.target.get_height()
+
+    def get_rect(self, **kwargs):
+        return self.target.get_rect(**kwargs)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Conta e desenha uma Surface, como Surface.blit"""
+        self.counters.count_blit(source, area)
+        return self.target.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Conta e desenha várias Surfaces, como Surface.blits"""
+        blit_sequence = list(blit_sequence)
+        for item in blit_sequence:
+            self.counters.count_blit(item[0], item[2] if len(item) > 2 else None)
+        return self.target.blits(blit_sequence, doreturn)
+
+    def fill(self, color, rect=None):
+        return self.target.fill(color, rect)
+
+    def draw_rect(self, color, rect, width=0):
+        draw_rect(self.target, color, rect, width)
+
+    def draw_circle(self, color, center, radius):
+        draw_circle(self.target, color, center, radius)
+
+class DrawCounters:
+    """
+    Contagens por zona do frame atual, do último frame e da sessão
+    """
+    def __init__(self):
+        self.enabled = False
+        self.main_thread = threading.main_thread().ident
+        # Pilha de zonas ativas; as contagens vão para a do topo
+        self.stack = []
+        # Zona → lista de contagens pela ordem de METRICS
+        self.frame = {}
+        self.last_frame = {}
+        self.totals = {}
+        self.maxima = {}
+        self.frames = 0
+        # Zona → limites por frame pela ordem de METRICS (None sem limite)
+        self.budgets = {}
+        # Zona → frames acima do orçamento por métrica
+        self.overruns = {}
+        # Nome → _Site, para não criar objetos em cada zona
+        self.sites = {}
+
+    def enable(self, budgets=None):
+        """
+        Liga as contagens, substituindo pygame.Surface, pygame.font.Font e pygame.transform
+
+        Tem de ser chamado antes de se criarem as fontes e as Surfaces a contar.
+
+        Args:
+            budgets: Dicionário zona → métrica → máximo por frame (ex.: config.DRAW_BUDGETS)
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.budgets = {name: [limits.get(metric) for metric in METRICS] for name, limits in (budgets or {}).items()}
+        counters = self
+
+        class CountedSurface(pygame.Surface, metaclass=_CountedType):
+            def __init__(self, *args, **kwargs):
+                counters.add(_SURFACES)
+                super().__init__(*args, **kwargs)
+
+        class CountedFont(pygame.font.Font, metaclass=_CountedType):
+            def render(self, *args, **kwargs):
+                counters.add(_FONTS)
+                return super().render(*args, **kwargs)
+
+        def counted(function):
+            def wrapper(*args, **kwargs):
+                counters.add(_TRANSFORMS)
+                return function(*args, **kwargs)
+            wrapper.__name__ = function.__name__
+            wrapper.__doc__ = function.__doc__
+            return wrapper
+
+        pygame.Surface = CountedSurface
+        pygame.font.Font = CountedFont
+        for name in ("scale", "smoothscale", "flip", "chop"):
+            setattr(pygame.transform, name, counted(getattr(pygame.transform, name)))
+
+    def wrap(self, canvas):
+        """
+        Destino de desenho do jogo, com os blits contados se o modo estiver ligado
+
+        Args:
+            canvas: Ecrã ou TextureCanvas
+
+        Returns:
+            CountingCanvas à volta de canvas, ou o próprio canvas
+        """
+        return CountingCanvas(canvas, self) if self.enabled else canvas
+
+    def site(self, name):
+        """
+        Atribui as contagens de um bloco de código a uma zona
+
+        Args:
+            name: Nome da zona (ex.: "Character.draw")
+
+        Returns:
+            Context manager; não faz nada se o modo estiver desligado
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        site = self.sites.get(name)
+        if site is None:
+            site = self.sites[name] = _Site(self, name)
+        return site
+
+    def get_counts(self):
+        """Contagens da zona atual no frame atual"""
+        name = self.stack[-1] if self.stack else OTHER_SITE
+        counts = self.frame.get(name)
+        if counts is None:
+            counts = self.frame[name] = [0] * len(METRICS)
+        return counts
+
+    def add(self, metric):
+        """Soma 1 a uma métrica da zona atual (só na thread principal)"""
+        if threading.get_ident() == self.main_thread:
+            self.get_counts()[metric] += 1
+
+    def count_blit(self, source, area):
+        """Soma um blit e a área copiada à zona atual"""
+        counts = self.get_counts()
+        counts[_BLITS] += 1
+        if area is None:
+            width, height = source.get_size()
+        else:
+            clipped = pygame.Rect(area).clip(source.get_rect())
+            width, height = clipped.size
+        counts[_PIXELS] += width * height
+
+    def end_frame(self):
+        """
+        Fecha as contagens do frame atual e soma-as às da sessão
+        """
+        if not self.enabled:
+            return
+        for name, counts in self.frame.items():
+            totals = self.totals.setdefault(name, [0] * len(METRICS))
+            maxima = self.maxima.setdefault(name, [0] * len(METRICS))
+            for metric, value in enumerate(counts):
+                totals[metric] += value
+                maxima[metric] = max(maxima[metric], value)
+            budget = self.budgets.get(name)
+            if budget is not None:
+                for metric, limit in enumerate(budget):
+                    if limit is not None and counts[metric] > limit:
+                        overruns = self.overruns.setdefault(name, [0] * len(METRICS))
+                        overruns[metric] += 1
+        self.last_frame = self.frame
+        self.frame = {}
+        self.frames += 1
+
+    def frame_totals(self):
+        """
+        Soma das zonas no último frame
+
+        Returns:
+            Dicionário métrica → valor
+        """
+        totals = [0] * len(METRICS)
+        for counts in self.last_frame.values():
+            for metric, value in enumerate(counts):
+                totals[metric] += value
+        return dict(zip(METRICS, totals))
+
+    def budget_overruns(self):
+        """
+        Métricas que passaram do orçamento em algum frame da sessão
+
+        Returns:
+            Lista de (zona, métrica, frames acima, máximo num frame, limite)
+        """
+        return [
+            (name, metric, frames, self.maxima[name][index], self.budgets[name][index])
+            for name, counts in sorted(self.overruns.items())
+            for index, (metric, frames) in enumerate(zip(METRICS, counts))
+            if frames
+        ]
+
+    def summary(self):
+        """
+        Médias e máximos por frame de cada zona, para os ficheiros de resultados
+
+        Returns:
+            Dicionário zona → métrica → {"per_frame", "max_frame", "total"}, com
+            "budget" e "over_budget_frames" nas métricas com orçamento
+        """
+        frames = max(1, self.frames)
+        summary = {}
+        for name, totals in self.totals.items():
+            budget = self.budgets.get(name)
+            overruns = self.overruns.get(name)
+            summary[name] = {}
+            for index, metric in enumerate(METRICS):
+                entry = {"per_frame": totals[index] / frames, "max_frame": self.maxima[name][index], "total": totals[index]}
+                if budget is not None and budget[index] is not None:
+                    entry["budget"] = budget[index]
+                    entry["over_budget_frames"] = overruns[index] if overruns else 0
+                summary[name][metric] = entry
+        return summary
+
+# Instância global, ligada em main.py com --count-draws
+draw_counters = DrawCounters()
@@ -0,0 +1,238 @@
+"""
+Estatísticas de tempo por frame de toda a sessão
+
+Guarda um histograma ao estilo HdrHistogram (precisão relativa fixa, em
+microssegundos) por nível e por fase do frame (update, draw, present). Na
+saída do jogo, ou com F4, escreve percentis (p50/p90/p99/p99.9/máx) e o
+histograma em JSON e CSV, para comparar máquinas e níveis.
+
+Só usa a biblioteca padrão.
+"""
+import csv
+import json
+import os
+import platform
+import time
+
+class HdrHistogram:
+    """
+    Histograma com erro relativo limitado, como o HdrHistogram
+
+    Os valores são agrupados em baldes cuja largura duplica a cada potência
+    de 2, cada um dividido em sub-baldes suficientes para manter
+    `significant_digits` algarismos significativos.
+    """
+    def __init__(self, highest=60_000_000, significant_digits=2):
+        """
+        Args:
+            highest: Maior valor registado (valores acima são limitados a este)
+            significant_digits: Algarismos significativos mantidos (1 a 5)
+        """
+        self.highest = highest
+        largest_single_unit = 2 * 10 ** significant_digits
+        self.sub_bucket_count_magnitude = (largest_single_unit - 1).bit_length()
+        self.sub_bucket_half_count_magnitude = self.sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << self.sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self.sub_bucket_count
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.counts = [0] * ((bucket_count + 1) * self.sub_bucket_half_count)
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+
+    def index_of(self, value):
+        """Índice do contador onde um valor cai"""
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_count_magnitude
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + sub_bucket_index - self.sub_bucket_half_count
+
+    def value_range(self, index):
+        """
+        Intervalo de valores de um contador
+
+        Returns:
+            Tupla (menor valor, maior valor equivalente)
+        """
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+        lowest = sub_bucket_index << bucket_index
+        return lowest, lowest + (1 << bucket_index) - 1
+
+    def record(self, value):
+        """
+        Regista um valor inteiro (microssegundos)
+
+        Args:
+            value: Valor a registar
+        """
+        value = min(max(0, int(value)), self.highest)
+        self.counts[self.index_of(value)] += 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def add(self, other):
+        """Soma outro histograma com a mesma configuração a este"""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def value_at_percentile(self, percentile):
+        """
+        Valor abaixo do qual fica uma percentagem dos registos
+
+        Args:
+            percentile: Percentil (0 a 100)
+
+        Returns:
+            Maior valor equivalente do contador onde o percentil cai (0 sem registos)
+        """
+        if self.total == 0:
+            return 0
+        target = max(1, int(percentile / 100 * self.total + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.value_range(index)[1], self.max)
+        return self.max
+
+    def buckets(self):
+        """Contadores não vazios como lista de (menor valor, maior valor, contagem)"""
+        return [(*self.value_range(index), count) for index, count in enumerate(self.counts) if count]
+
+class FrameStats:
+    """
+    Histogramas de tempo por frame, por nível e por fase
+    """
+    PHASES = ("update", "draw", "present")
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self):
+        self.started = time.time()
+        # Nível → fase → HdrHistogram
+        self.levels = {}
+        # Informação extra escrita com os resultados (ex.: backend, frames saltados)
+        self.info = {}
+
+    def record(self, level, phase, ms):
+        """
+        Regista o tempo de uma fase de um frame
+
+        Args:
+            level: Nome do nível (ex.: "background4.jpg")
+            phase: "update", "draw" ou "present"
+            ms: Duração em milissegundos
+        """
+        phases = self.levels.get(level)
+        if phases is None:
+            phases = self.levels[level] = {phase_name: HdrHistogram() for phase_name in self.PHASES}
+        phases[phase].record(ms * 1000)
+
+    def summary(self, histogram):
+        """
+        Resumo de um histograma em milissegundos
+
+        Returns:
+            Dicionário com contagem, média, percentis e máximo
+        """
+        result = {
+            "count": histogram.total,
+            "mean_ms": histogram.sum / histogram.total / 1000 if histogram.total else 0,
+            "min_ms": (histogram.min or 0) / 1000
+        }
+        for percentile in self.PERCENTILES:
+            result[f"p{percentile:g}_ms"] = histogram.value_at_percentile(percentile) / 1000
+        result["max_ms"] = histogram.max / 1000
+        return result
+
+    def groups(self):
+        """
+        Histogramas por nível e o total da sessão ("todos")
+
+        Returns:
+            Lista de (nível, fase, HdrHistogram)
+        """
+        totals = {phase: HdrHistogram() for phase in self.PHASES}
+        groups = []
+        for level, phases in self.levels.items():
+            for phase, histogram in phases.items():
+                groups.append((level, phase, histogram))
+                totals[phase].add(histogram)
+        groups.extend(("todos", phase, histogram) for phase, histogram in totals.items())
+        return groups
+
+    def export(self, directory):
+        """
+        Escreve os resultados em JSON e CSV
+
+        Args:
+            directory: Pasta de destino (criada se não existir)
+
+        Returns:
+            Caminho base dos ficheiros escritos, ou None se não houver frames
+        """
+        if not self.levels:
+            return None
+        base = os.path.join(directory, time.strftime("frame_stats_%Y%m%d_%H%M%S"))
+        groups = self.groups()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            data = {
+                "session": {
+                    "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+                    "duration_s": time.time() - self.started,
+                    "host": platform.node(),
+                    "platform": platform.platform(),
+                    "processor": platform.processor(),
+                    "python": platform.python_version(),
+                    **self.info
+                },
+                "levels": {}
+            }
+            for level, phase, histogram in groups:
+                entry = self.summary(histogram)
+                entry["histogram_us"] = histogram.buckets()
+                data["levels"].setdefault(level, {})[phase] = entry
+            with open(base + ".json", "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=1)
+
+            with open(base + "_summary.csv", "w", newline="", encoding="utf-8") as file:
+                writer = None
+                for level, phase, histogram in groups:
+                    row = {"level": level, "phase": phase, **self.summary(histogram)}
+                    if writer is None:
+                        writer = csv.DictWriter(file, fieldnames=list(row))
+                        writer.writeheader()
+                    writer.writerow(row)
+
+            with open(base + "_histogram.csv", "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["level", "phase", "from_us", "to_us", "count"])
+                for level, phase, histogram in groups:
+                    for lowest, highest, count in histogram.buckets():
+                        writer.writerow([level, phase, lowest, highest, count])
+            print(f"Estatísticas de frames em {base}.json")
+            return base
+        except Exception as e:
+            print(f"Erro ao escrever estatísticas de frames: {e}")
+            return None
+
+# Instância global da sessão, partilhada pelo jogo e pelo menu
+frame_stats = FrameStats()
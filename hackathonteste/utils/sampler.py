@@ -0,0 +1,190 @@
+"""
+Profiler por amostragem para partidas reais
+
+Uma thread lê a pilha da thread principal com sys._current_frames() a
+intervalos fixos, sem instrumentar chamadas, por isso o jogo corre quase à
+velocidade normal. Ligado e desligado com F6 durante a partida; ao parar
+escreve:
+- `.collapsed`: pilhas no formato "a;b;c contagem" (flamegraph.pl, speedscope);
+- `.pstats`: resumo compatível com pstats (`python -m pstats ficheiro`),
+  com os tempos estimados a partir do número de amostras.
+
+Só usa a biblioteca padrão.
+"""
+from collections import Counter
+import marshal
+import os
+import sys
+import threading
+import time
+
+class SamplingProfiler:
+    """
+    Amostra a pilha da thread principal numa thread separada
+    """
+    def __init__(self, interval=0.005):
+        """
+        Args:
+            interval: Segundos entre amostras
+        """
+        self.interval = interval
+        self.target = threading.main_thread().ident
+        # Pilha (tuplo de (ficheiro, linha, função) da raiz para a folha) → amostras
+        self.stacks = Counter()
+        self.samples = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.started = 0
+        self.switch_interval = sys.getswitchinterval()
+
+    @property
+    def running(self):
+        return self.thread is not None
+
+    def start(self):
+        """
+        Começa a amostrar a thread principal
+        """
+        if self.running:
+            return
+        self.stacks.clear()
+        self.samples = 0
+        self.stop_event.clear()
+        self.started = time.perf_counter()
+        # A thread só amostra quando recebe o GIL; com o intervalo de troca normal
+        # (5 ms) as amostras cairiam quase só onde o jogo o liberta (clock.tick, flip)
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval / 10))
+        self.thread = threading.Thread(target=self.sample_loop, name="sampling-profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Para a amostragem e espera pela thread
+        """
+        if not self.running:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        sys.setswitchinterval(self.switch_interval)
+
+    def sample_loop(self):
+        """Ciclo da thread de amostragem"""
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed_lines(self):
+        """
+        Pilhas no formato colapsado dos flamegraphs
+
+        Returns:
+            Lista de linhas "módulo:função;...;módulo:função contagem"
+        """
+        lines = []
+        for stack, count in self.stacks.most_common():
+            names = ";".join(f"{os.path.splitext(os.path.basename(filename))[0]}:{name}" for filename, _, name in stack)
+            lines.append(f"{names} {count}")
+        return lines
+
+    def pstats_data(self):
+        """
+        Converte as amostras para o dicionário que pstats.Stats lê
+
+        Cada amostra vale `interval` segundos. O tempo próprio (tt) é o da
+        função no topo da pilha e o acumulado (ct) conta cada função uma vez
+        por amostra, mesmo em recursão. As contagens de chamadas são amostras.
+
+        Returns:
+            Dicionário (ficheiro, linha, função) → (cc, nc, tt, ct, callers)
+        """
+        interval = self.interval
+        stats = {}
+        for stack, count in self.stacks.items():
+            seconds = count * interval
+            seen = set()
+            caller = None
+            for depth, function in enumerate(stack):
+                entry = stats.get(function)
+                if entry is None:
+                    entry = stats[function] = [0, 0, 0.0, 0.0, {}]
+                if function not in seen:
+                    seen.add(function)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += seconds
+                if depth == len(stack) - 1:
+                    entry[2] += seconds
+                if caller is not None:
+                    callers = entry[4]
+                    cc, nc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                    callers[caller] = (cc + count, nc + count,
+                                       tt + (seconds if depth == len(stack) - 1 else 0.0), ct + seconds)
+                caller = function
+        return {function: (cc, nc, tt, ct, callers) for function, (cc, nc, tt, ct, callers) in stats.items()}
+
+    def write(self, directory):
+        """
+        Escreve as pilhas colapsadas e o resumo pstats
+
+        Args:
+            directory: Pasta de destino (criada se não existir)
+
+        Returns:
+            Caminho base dos ficheiros escritos, ou None se não houver amostras
+        """
+        if self.samples == 0:
+            return None
+        base = os.path.join(directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(base + ".collapsed", "w", encoding="utf-8") as file:
+                file.write("\n".join(self.collapsed_lines()) + "\n")
+            with open(base + ".pstats", "wb") as file:
+                marshal.dump(self.pstats_data(), file)
+            duration = time.perf_counter() - self.started
+            print(f"Perfil: {self.samples} amostras em {duration:.1f} s, em {base}.collapsed e {base}.pstats")
+            return base
+        except Exception as e:
+            print(f"Erro ao escrever perfil: {e}")
+            return None
+
+    def toggle(self, directory):
+        """
+        Liga o profiler, ou para-o e escreve os resultados
+
+        Args:
+            directory: Pasta de destino dos resultados
+
+        Returns:
+            Caminho base dos ficheiros escritos ao parar, senão None
+        """
+        if not self.running:
+            self.start()
+            print("Perfil: a amostrar (F6 para parar)")
+            return None
+        self.stop()
+        return self.write(directory)
+
+    def finish(self, directory):
+        """
+        Para o profiler e escreve os resultados, se estiver ligado (usado ao sair)
+
+        Args:
+            directory: Pasta de destino dos resultados
+        """
+        if self.running:
+            self.stop()
+            self.write(directory)
+
+# Instância global, ligada com F6 durante a partida
+sampling_profiler = SamplingProfiler()
@@ -0,0 +1,199 @@
+"""
+Perfil do arranque: tempo de imports, inicialização e carregamento de assets
+
+Ativado com `python main.py --profile-startup`. Regista cada intervalo
+medido até ao primeiro frame do menu e escreve um relatório ordenado e um
+trace no formato do Chrome (abrir em chrome://tracing ou ui.perfetto.dev).
+
+Só usa a biblioteca padrão, porque é importado antes de tudo o resto.
+"""
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+
+class _NullSpan:
+    """Intervalo vazio usado quando o profiler está desligado"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    """Intervalo medido, registado no profiler ao sair do bloco"""
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter())
+        return False
+
+class StartupProfiler:
+    """
+    Recolhe intervalos (nome, categoria, início, fim, thread) durante o arranque
+    """
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = []
+        self.original_import = None
+
+    def enable(self):
+        """
+        Liga o profiler e começa a medir os imports de módulos
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.origin = time.perf_counter()
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def disable(self):
+        """
+        Desliga o profiler e repõe o import original
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        if builtins.__import__ is self.timed_import:
+            builtins.__import__ = self.original_import
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        Substituto de __import__ que mede a primeira importação de cada módulo
+        """
+        if level or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            self.record(f"import {name}", "import", start, time.perf_counter())
+
+    def span(self, name, category):
+        """
+        Mede um bloco de código
+
+        Args:
+            name: Nome do intervalo
+            category: Categoria (ex.: "init", "asset", "import")
+
+        Returns:
+            Context manager; não faz nada se o profiler estiver desligado
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, category)
+
+    def record(self, name, category, start, end):
+        """
+        Regista um intervalo já medido
+
+        Args:
+            name: Nome do intervalo
+            category: Categoria
+            start: Início (time.perf_counter)
+            end: Fim (time.perf_counter)
+        """
+        self.events.append((name, category, start, end, threading.get_ident()))
+
+    def mark(self, name):
+        """
+        Regista um instante (ex.: primeiro frame do menu)
+
+        Args:
+            name: Nome do instante
+        """
+        if self.enabled:
+            now = time.perf_counter()
+            self.record(name, "mark", now, now)
+
+    def report_lines(self, limit=40):
+        """
+        Gera o relatório com os intervalos mais longos primeiro
+
+        Args:
+            limit: Número máximo de intervalos listados
+
+        Returns:
+            Lista de linhas de texto
+        """
+        total = max((end for _, _, _, end, _ in self.events), default=self.origin) - self.origin
+        lines = [f"Arranque até ao primeiro frame do menu: {total * 1000:.1f} ms", ""]
+
+        by_category = {}
+        for _, category, start, end, _ in self.events:
+            by_category[category] = by_category.get(category, 0) + (end - start)
+        lines.append("Por categoria (tempos aninhados somam mais de uma vez):")
+        for category, duration in sorted(by_category.items(), key=lambda item: -item[1]):
+            lines.append(f"  {category:<8} {duration * 1000:9.1f} ms")
+        lines.append("")
+
+        lines.append(f"{'ms':>9}  {'início':>9}  categoria  nome")
+        events = sorted(self.events, key=lambda event: event[2] - event[3])
+        for name, category, start, end, _ in events[:limit]:
+            lines.append(f"{(end - start) * 1000:9.2f}  {(start - self.origin) * 1000:9.1f}  {category:<9}  {name}")
+        return lines
+
+    def chrome_trace(self):
+        """
+        Converte os intervalos para o formato de trace do Chrome
+
+        Returns:
+            Dicionário pronto para json.dump
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, category, start, end, thread_id in self.events:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "i" if category == "mark" else "X",
+                "ts": (start - self.origin) * 1e6,
+                "pid": pid,
+                "tid": thread_id
+            }
+            if category == "mark":
+                event["s"] = "g"
+            else:
+                event["dur"] = (end - start) * 1e6
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def finish(self, report_path, trace_path):
+        """
+        Desliga o profiler e escreve o relatório e o trace
+
+        Args:
+            report_path: Caminho do relatório de texto
+            trace_path: Caminho do trace JSON
+        """
+        if not self.enabled:
+            return
+        self.disable()
+        lines = self.report_lines()
+        try:
+            with open(report_path, "w", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+            with open(trace_path, "w", encoding="utf-8") as file:
+                json.dump(self.chrome_trace(), file)
+            print(lines[0])
+            print(f"Relatório em {report_path}, trace em {trace_path}")
+        except Exception as e:
+            print(f"Erro ao escrever perfil de arranque: {e}")
+
+# Instância global, partilhada por main.py, AssetManager e Animation
+startup_profiler = StartupProfiler()
@@ -0,0 +1,154 @@
+"""
+Trace das fases do ciclo de jogo no formato do Chrome
+
+Ativado com `python main.py --trace`. Cada fase instrumentada (eventos,
+update, update_local, desenho do nível, das personagens e do HUD,
+apresentação do frame) regista um início e um fim num buffer circular
+alocado uma única vez, que guarda os últimos config.TRACE_CAPACITY
+eventos. Na saída do jogo, ou com F5, os eventos são escritos em JSON para
+abrir em ui.perfetto.dev ou chrome://tracing.
+
+Desligado, `tracer.span()` devolve sempre o mesmo intervalo vazio, por isso
+o custo é uma chamada e um teste por fase.
+"""
+from array import array
+import json
+import os
+import threading
+import time
+from utils.startup_profiler import NULL_SPAN
+
+# Fases dos eventos no buffer
+_BEGIN = 0
+_END = 1
+
+class _TraceSpan:
+    """Intervalo com nome fixo; reaproveitado em todas as chamadas com esse nome"""
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.tracer.add(self.name, _BEGIN)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.add(self.name, _END)
+        return False
+
+class Tracer:
+    """
+    Buffer circular de eventos de início/fim das fases do ciclo de jogo
+    """
+    def __init__(self):
+        self.enabled = False
+        self.capacity = 0
+        self.origin = time.perf_counter()
+        self.count = 0
+        self.names = []
+        self.phases = bytearray()
+        self.times = array("d")
+        # Nome → _TraceSpan, para não criar objetos em cada fase
+        self.spans = {}
+
+    def enable(self, capacity):
+        """
+        Liga o tracer e aloca o buffer
+
+        Args:
+            capacity: Número de eventos guardados (os mais antigos são substituídos)
+        """
+        self.capacity = capacity
+        self.names = [None] * capacity
+        self.phases = bytearray(capacity)
+        self.times = array("d", bytes(8 * capacity))
+        self.count = 0
+        self.origin = time.perf_counter()
+        self.enabled = True
+
+    def span(self, name):
+        """
+        Mede um bloco de código
+
+        Args:
+            name: Nome da fase (ex.: "HUD.draw")
+
+        Returns:
+            Context manager; não faz nada se o tracer estiver desligado
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = _TraceSpan(self, name)
+        return span
+
+    def add(self, name, phase):
+        """
+        Regista um evento no buffer
+
+        Args:
+            name: Nome da fase
+            phase: _BEGIN ou _END
+        """
+        index = self.count % self.capacity
+        self.names[index] = name
+        self.phases[index] = phase
+        self.times[index] = time.perf_counter()
+        self.count += 1
+
+    def chrome_trace(self):
+        """
+        Converte o buffer para o formato de trace do Chrome, do mais antigo ao mais recente
+
+        Returns:
+            Dicionário pronto para json.dump
+        """
+        pid = os.getpid()
+        tid = threading.main_thread().ident
+        first = max(0, self.count - self.capacity)
+        trace_events = []
+        depth = 0
+        for position in range(first, self.count):
+            index = position % self.capacity
+            phase = self.phases[index]
+            if phase == _END:
+                # O início deste intervalo já foi substituído no buffer
+                if depth == 0:
+                    continue
+                depth -= 1
+            else:
+                depth += 1
+            trace_events.append({
+                "name": self.names[index],
+                "cat": "game",
+                "ph": "B" if phase == _BEGIN else "E",
+                "ts": (self.times[index] - self.origin) * 1e6,
+                "pid": pid,
+                "tid": tid
+            })
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        """
+        Escreve o trace, se o tracer estiver ligado
+
+        Args:
+            path: Caminho do ficheiro JSON
+
+        Returns:
+            True se o ficheiro foi escrito
+        """
+        if not self.enabled or self.count == 0:
+            return False
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(self.chrome_trace(), file)
+            print(f"Trace do jogo em {path} ({min(self.count, self.capacity)} eventos)")
+            return True
+        except Exception as e:
+            print(f"Erro ao escrever trace do jogo: {e}")
+            return False
+
+# Instância global, ligada em main.py com --trace
+tracer = Tracer()